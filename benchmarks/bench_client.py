@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Benchmark every ``ProjectClient`` method against the in-process stand-in
+server, reporting requests/sec, p50/p99 latency and CPU time per call, and
+the memory retained per listed session.
+
+    $ python benchmarks/bench_client.py --sessions 500 --calls 200
+    $ python benchmarks/bench_client.py --save baseline.json
+    $ python benchmarks/bench_client.py --compare baseline.json
+
+CPU time includes the stand-in server, which runs in the same process; its
+share is constant between runs, so changes still show up in comparisons.
+With ``--compare``, the script exits non-zero if any method's p50 latency,
+CPU per call or memory per session grew by more than ``--threshold``.
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+
+from standin_server import StandinConfig, StandinServer, standin_client
+
+from syncflow.models import (
+    CreateSessionRequest,
+    RegisterDeviceRequest,
+    TokenRequest,
+    VideoGrantsWrapper,
+)
+from syncflow.retry import RetryPolicy
+
+SESSION_ID = "session-0"
+
+
+async def _collect(iterator):
+    return [item async for item in iterator]
+
+
+def operations(device_id):
+    token_request = TokenRequest(
+        identity="bench", video_grants=VideoGrantsWrapper(room=SESSION_ID)
+    )
+    return {
+        "get_project_details": lambda c: c.get_project_details(),
+        "summarize_project": lambda c: c.summarize_project(),
+        "list_sessions": lambda c: c.list_sessions(),
+        "list_sessions_compact": lambda c: c.list_sessions_compact(),
+        "iter_sessions": lambda c: _collect(c.iter_sessions()),
+        "list_session": lambda c: c.list_session(SESSION_ID),
+        "list_participants": lambda c: c.list_participants(SESSION_ID),
+        "generate_session_token": lambda c: c.generate_session_token(
+            SESSION_ID, token_request
+        ),
+        "get_livekit_session_info": lambda c: c.get_livekit_session_info(SESSION_ID),
+        "create_session": lambda c: c.create_session(
+            CreateSessionRequest(name="bench")
+        ),
+        "stop_session": lambda c: c.stop_session(SESSION_ID),
+        "register_device": lambda c: c.register_device(
+            RegisterDeviceRequest(name="bench", group="bench")
+        ),
+        "list_devices": lambda c: c.list_devices(),
+        "list_device": lambda c: c.list_device(device_id),
+    }
+
+
+LISTINGS = ("list_sessions", "list_sessions_compact", "iter_sessions")
+
+
+async def run_method(client, operation, calls, concurrency):
+    latencies = []
+    errors = 0
+    remaining = iter(range(calls))
+
+    async def worker():
+        nonlocal errors
+        for _ in remaining:
+            start = time.perf_counter()
+            try:
+                await operation(client)
+            except Exception:
+                errors += 1
+            latencies.append(time.perf_counter() - start)
+
+    await operation(client)
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    wall = time.perf_counter() - wall_start
+    cpu = time.process_time() - cpu_start
+    latencies.sort()
+    return {
+        "calls": calls,
+        "errors": errors,
+        "rps": calls / wall,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000,
+        "cpu_ms_per_call": cpu / calls * 1000,
+    }
+
+
+async def retained_bytes(client, operation):
+    """Bytes still allocated after ``operation`` returns and its result is kept."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = await operation(client)
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return after - before
+
+
+async def run(args):
+    config = StandinConfig(
+        sessions=args.sessions,
+        participants=args.participants,
+        tracks=args.tracks,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        seed=0,
+    )
+    server = StandinServer(config)
+    device_id = next(iter(server.devices))
+    ops = operations(device_id)
+    selected = args.methods or list(ops)
+
+    results = {}
+    async with standin_client(
+        server,
+        coalesce_gets=False,
+        retry_policy=RetryPolicy(max_attempts=args.max_attempts),
+    ) as client:
+        for name in selected:
+            results[name] = await run_method(
+                client, ops[name], args.calls, args.concurrency
+            )
+            if name in LISTINGS:
+                size = await retained_bytes(client, ops[name])
+                results[name]["bytes_per_session"] = size / len(server.sessions)
+    return results
+
+
+def print_results(results):
+    header = (
+        f"{'method':<26}{'req/s':>10}{'p50 ms':>10}{'p99 ms':>10}"
+        f"{'cpu ms':>10}{'errors':>8}{'B/session':>12}"
+    )
+    print(header)
+    print("-" * len(header))
+    for name, r in results.items():
+        per_session = r.get("bytes_per_session")
+        print(
+            f"{name:<26}{r['rps']:>10.0f}{r['p50_ms']:>10.2f}{r['p99_ms']:>10.2f}"
+            f"{r['cpu_ms_per_call']:>10.3f}{r['errors']:>8}"
+            f"{'' if per_session is None else f'{per_session:.0f}':>12}"
+        )
+
+
+def compare(results, baseline, threshold):
+    regressions = []
+    for name, r in results.items():
+        if name not in baseline:
+            continue
+        for metric in ("p50_ms", "cpu_ms_per_call", "bytes_per_session"):
+            old, new = baseline[name].get(metric), r.get(metric)
+            if old and new and new > old * threshold:
+                regressions.append(f"{name} {metric}: {old:.3f} -> {new:.3f}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--sessions", type=int, default=500)
+    parser.add_argument("--participants", type=int, default=4)
+    parser.add_argument("--tracks", type=int, default=2)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--max-attempts", type=int, default=3)
+    parser.add_argument("--calls", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--methods", nargs="*", help="Methods to run (default: all)")
+    parser.add_argument("--save", help="Write results as JSON to this file")
+    parser.add_argument("--compare", help="Baseline JSON written by --save")
+    parser.add_argument("--threshold", type=float, default=1.25)
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+    print_results(results)
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=2)
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        if regressions:
+            print("\nRegressions:")
+            for regression in regressions:
+                print(f"  {regression}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Compare memory use and construction time of pydantic session models with
+the compact ``NamedTuple`` records from ``syncflow.compact``.
+
+    $ python benchmarks/bench_compact.py --sessions 2000
+"""
+
+import argparse
+import gc
+import json
+import statistics
+import time
+import tracemalloc
+from typing import List
+
+from payloads import make_sessions
+
+from syncflow import codec
+from syncflow.compact import decode_sessions
+from syncflow.models import ProjectSessionResponse
+
+
+def pydantic_models(content: bytes):
+    return codec.decode(content, List[ProjectSessionResponse])
+
+
+def compact_records(content: bytes):
+    return decode_sessions(content)
+
+
+def construction_time(fn, content, repeat):
+    fn(content)
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(content)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def retained_memory(fn, content):
+    gc.collect()
+    tracemalloc.start()
+    result = fn(content)
+    gc.collect()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return retained, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=int, default=2000)
+    parser.add_argument("--participants", type=int, default=4)
+    parser.add_argument("--tracks", type=int, default=2)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    content = json.dumps(
+        make_sessions(args.sessions, args.participants, args.tracks)
+    ).encode("utf-8")
+    print(f"payload: {args.sessions} sessions, {len(content) / 1e6:.1f} MB")
+    print(f"{'':18}{'time (ms)':>12}{'retained (MB)':>16}{'peak (MB)':>12}")
+    for name, fn in (
+        ("pydantic models", pydantic_models),
+        ("compact records", compact_records),
+    ):
+        elapsed = construction_time(fn, content, args.repeat)
+        retained, peak = retained_memory(fn, content)
+        print(
+            f"{name:18}{elapsed * 1000:12.1f}{retained / 1e6:16.1f}{peak / 1e6:12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
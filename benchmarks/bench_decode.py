@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Compare the old ``response.json()`` + ``Model(**data)`` decoding of a
+``list_sessions`` payload with validating the raw bytes directly through a
+cached ``TypeAdapter``.
+
+    $ python benchmarks/bench_decode.py --sessions 2000
+"""
+
+import argparse
+import json
+import statistics
+import time
+from typing import List
+
+from payloads import make_sessions
+
+from syncflow import codec
+from syncflow.models import ProjectSessionResponse
+
+
+def two_pass(content: bytes):
+    return [ProjectSessionResponse(**session) for session in json.loads(content)]
+
+
+def direct(content: bytes):
+    return codec.decode(content, List[ProjectSessionResponse])
+
+
+def measure(fn, content, repeat):
+    fn(content)
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(content)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=int, default=2000)
+    parser.add_argument("--participants", type=int, default=4)
+    parser.add_argument("--tracks", type=int, default=2)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    content = json.dumps(
+        make_sessions(args.sessions, args.participants, args.tracks)
+    ).encode("utf-8")
+    assert two_pass(content) == direct(content)
+
+    before = measure(two_pass, content, args.repeat)
+    after = measure(direct, content, args.repeat)
+    print(f"payload: {args.sessions} sessions, {len(content) / 1e6:.1f} MB")
+    print(f"json.loads + Model(**data): {before * 1000:8.1f} ms")
+    print(f"TypeAdapter.validate_json:  {after * 1000:8.1f} ms")
+    print(f"speedup: {before / after:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Measure the cold-start cost of importing syncflow modules.
+
+Each import runs in a fresh interpreter, repeated ``--repeat`` times, and the
+median is reported. ``-X importtime`` gives the cumulative time of the
+imported module and the slowest modules it pulled in.
+
+    $ python benchmarks/bench_import.py
+    $ python benchmarks/bench_import.py --save import.json
+    $ python benchmarks/bench_import.py --compare import.json
+
+Run it from the repository root, or with syncflow installed.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+MODULES = (
+    "syncflow",
+    "syncflow.models",
+    "syncflow.project_client",
+    "syncflow.sync_client",
+)
+
+SNIPPETS = {
+    "first request setup": (
+        "from syncflow import ProjectClient, CreateSessionRequest\n"
+        "ProjectClient('http://localhost', 'p', 'k', 's')\n"
+        "CreateSessionRequest(name='x')"
+    ),
+}
+
+
+def _env() -> dict:
+    path = [os.getcwd()] + [p for p in [os.environ.get("PYTHONPATH")] if p]
+    return dict(os.environ, PYTHONPATH=os.pathsep.join(path))
+
+
+def direct_imports(module: str) -> dict:
+    """Cumulative microseconds of each module imported directly by ``module``."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=_env(),
+        check=True,
+    )
+    # Modules are listed after everything they imported, so the block of
+    # lines ending at ``module`` holds its subtree.
+    children = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, raw_name = line[len("import time:") :].split("|")
+        depth = (len(raw_name) - len(raw_name.lstrip()) - 1) // 2
+        if depth == 1:
+            children[raw_name.strip()] = int(cumulative)
+        elif depth == 0:
+            if raw_name.strip() == module:
+                return children
+            children = {}
+    return {}
+
+
+def wall_time(statement: str) -> float:
+    """Seconds a fresh interpreter spends running ``statement``."""
+    code = (
+        "import time\n"
+        "start = time.perf_counter()\n"
+        f"exec({statement!r})\n"
+        "print(time.perf_counter() - start)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        env=_env(),
+        check=True,
+    )
+    return float(result.stdout)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--top", type=int, default=5)
+    parser.add_argument("--save", help="Write results as JSON to this file")
+    parser.add_argument("--compare", help="Baseline JSON written by --save")
+    parser.add_argument("--threshold", type=float, default=1.25)
+    args = parser.parse_args()
+
+    results = {}
+    statements = {module: f"import {module}" for module in MODULES}
+    statements.update(SNIPPETS)
+    for label, statement in statements.items():
+        wall_time(statement)
+        timings = [wall_time(statement) for _ in range(args.repeat)]
+        results[label] = statistics.median(timings) * 1000
+        print(f"{label:<28}{results[label]:>8.1f} ms")
+        if label in MODULES:
+            heaviest = sorted(
+                direct_imports(label).items(), key=lambda item: item[1], reverse=True
+            )[: args.top]
+            for name, micros in heaviest:
+                print(f"    {name:<32}{micros / 1000:>8.1f} ms")
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=2)
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = [
+            f"{label}: {baseline[label]:.1f} -> {value:.1f} ms"
+            for label, value in results.items()
+            if label in baseline and value > baseline[label] * args.threshold
+        ]
+        if regressions:
+            print("\nRegressions:")
+            for regression in regressions:
+                print(f"  {regression}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Measure the CPU cost of streaming a ``list_sessions`` payload through
+``JsonArraySplitter``, against validating the whole payload at once.
+
+    $ python benchmarks/bench_streaming.py --sessions 2000 --chunk-size 65536
+
+``split`` is the splitter alone, ``split + decode`` is what ``iter_sessions``
+does per response, and ``validate_json`` is what ``list_sessions`` does.
+"""
+
+import argparse
+import json
+import statistics
+import time
+from typing import List
+
+from payloads import make_sessions
+
+from syncflow import codec
+from syncflow.models import ProjectSessionResponse
+from syncflow.streaming import JsonArraySplitter
+
+
+def split(content: bytes, chunk_size: int) -> List[bytes]:
+    splitter = JsonArraySplitter()
+    items = []
+    for start in range(0, len(content), chunk_size):
+        items.extend(splitter.feed(content[start : start + chunk_size]))
+    splitter.close()
+    return items
+
+
+def split_and_decode(content: bytes, chunk_size: int):
+    return [
+        codec.decode(item, ProjectSessionResponse)
+        for item in split(content, chunk_size)
+    ]
+
+
+def validate(content: bytes, chunk_size: int):
+    return codec.decode(content, List[ProjectSessionResponse])
+
+
+def cpu_time(fn, content, chunk_size, repeat):
+    fn(content, chunk_size)
+    timings = []
+    for _ in range(repeat):
+        start = time.process_time()
+        fn(content, chunk_size)
+        timings.append(time.process_time() - start)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--sessions", type=int, default=2000)
+    parser.add_argument("--participants", type=int, default=4)
+    parser.add_argument("--tracks", type=int, default=2)
+    parser.add_argument("--chunk-size", type=int, default=64 * 1024)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    content = json.dumps(
+        make_sessions(args.sessions, args.participants, args.tracks)
+    ).encode("utf-8")
+    assert split_and_decode(content, args.chunk_size) == validate(content, 0)
+
+    megabytes = len(content) / 1e6
+    print(f"payload: {args.sessions} sessions, {megabytes:.1f} MB")
+    for label, fn in (
+        ("split", split),
+        ("split + decode", split_and_decode),
+        ("validate_json", validate),
+    ):
+        seconds = cpu_time(fn, content, args.chunk_size, args.repeat)
+        print(
+            f"{label:<16}{seconds * 1000:>10.1f} ms cpu"
+            f"{megabytes / seconds:>10.1f} MB/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Synthetic SyncFlow API payloads shared by the benchmark scripts."""
+
+import random
+import time
+
+
+def make_track(session_id, participant_id, index):
+    track_id = f"{participant_id}-track-{index}"
+    return {
+        "id": track_id,
+        "sid": f"TR_{track_id}",
+        "name": f"track-{index}",
+        "kind": "video" if index % 2 == 0 else "audio",
+        "source": "camera" if index % 2 == 0 else "microphone",
+        "participantId": participant_id,
+        "multimediaDetails": {
+            "fileName": f"{session_id}/{track_id}.mp4",
+            "destination": "s3",
+            "publisher": participant_id,
+            "trackId": f"TR_{track_id}",
+            "presignedUrl": f"https://storage.example.com/{session_id}/{track_id}.mp4",
+            "presignedUrlExpires": int(time.time()) + 3600,
+            "recordingStartTime": int(time.time()) - random.randint(0, 3600),
+        },
+    }
+
+
+def make_session(index, participants=4, tracks=2, project_id="project"):
+    session_id = f"session-{index}"
+    started_at = int(time.time()) - 86400 + index
+    session_participants = []
+    recordings = []
+    for p in range(participants):
+        participant_id = f"{session_id}-participant-{p}"
+        participant_tracks = [
+            make_track(session_id, participant_id, t) for t in range(tracks)
+        ]
+        session_participants.append(
+            {
+                "id": participant_id,
+                "identity": f"identity-{p}",
+                "name": f"Participant {p}",
+                "joinedAt": started_at + p,
+                "leftAt": started_at + 600 if index % 3 else None,
+                "sessionId": session_id,
+                "tracks": participant_tracks,
+            }
+        )
+        for track in participant_tracks:
+            recordings.append(
+                {
+                    "id": f"egress-{track['id']}",
+                    "trackId": track["sid"],
+                    "egressId": f"EG_{track['id']}",
+                    "startedAt": started_at + p,
+                    "egressType": "track",
+                    "status": "EGRESS_COMPLETE",
+                    "destination": "s3",
+                    "roomName": session_id,
+                    "sessionId": session_id,
+                    "participantId": participant_id,
+                    "dbTrackId": track["id"],
+                }
+            )
+    return {
+        "id": session_id,
+        "name": f"Session {index}",
+        "startedAt": started_at,
+        "comments": "benchmark session",
+        "emptyTimeout": 600,
+        "maxParticipants": 32,
+        "livekitRoomName": session_id,
+        "projectId": project_id,
+        "status": "Stopped" if index % 3 else "Started",
+        "numParticipants": participants,
+        "numRecordings": len(recordings),
+        "participants": session_participants,
+        "recordings": recordings,
+        "duration": 600,
+    }
+
+
+def make_sessions(count, participants=4, tracks=2, project_id="project"):
+    return [make_session(i, participants, tracks, project_id) for i in range(count)]
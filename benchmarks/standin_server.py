@@ -0,0 +1,375 @@
+#!/usr/bin/env python3
+"""
+An in-process stand-in for the SyncFlow API, for benchmarks and local runs.
+
+``StandinServer`` is a plain ASGI application serving the endpoints that
+``ProjectClient`` uses from synthetic payloads, with configurable latency,
+error rate and payload sizes. Benchmarks drive it through
+``httpx.ASGITransport`` so no sockets are involved:
+
+    server = StandinServer(StandinConfig(sessions=500, latency=0.005))
+    async with standin_client(server) as client:
+        await client.list_sessions()
+
+It can also be served over HTTP when uvicorn is installed, e.g. to point
+``examples/main.py`` at it:
+
+    $ python benchmarks/standin_server.py --port 8000 --sessions 500
+"""
+
+import argparse
+import asyncio
+import random
+import re
+import time
+import uuid
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+from payloads import make_session
+
+from syncflow import codec
+from syncflow.project_client import ProjectClient
+from syncflow.transport import SharedTransport
+
+PROJECT = r"/projects/(?P<project>[^/]+)"
+SESSION = PROJECT + r"/sessions/(?P<session>[^/]+)"
+DEVICE = PROJECT + r"/devices/(?P<device>[^/]+)"
+
+ROUTES = [
+    ("GET", PROJECT, "project"),
+    ("DELETE", PROJECT, "project"),
+    ("GET", PROJECT + "/summarize", "summarize"),
+    ("POST", PROJECT + "/create-session", "create_session"),
+    ("GET", PROJECT + "/sessions", "sessions"),
+    ("GET", SESSION + "/participants", "participants"),
+    ("POST", SESSION + "/token", "token"),
+    ("GET", SESSION + "/livekit-session-info", "livekit_session_info"),
+    ("POST", SESSION + "/stop", "stop_session"),
+    ("GET", SESSION, "session"),
+    ("POST", PROJECT + "/devices/register", "register_device"),
+    ("GET", PROJECT + "/devices", "devices"),
+    ("GET", DEVICE, "device"),
+    ("DELETE", DEVICE, "delete_device"),
+]
+
+
+@dataclass
+class StandinConfig:
+    """
+    Behaviour of a ``StandinServer``.
+
+    Args:
+        sessions (int): Sessions in the project.
+        participants (int): Participants per session.
+        tracks (int): Tracks per participant.
+        devices (int): Registered devices.
+        latency (float): Seconds added to every response.
+        jitter (float): Extra uniformly distributed delay, up to this many seconds.
+        error_rate (float): Fraction of requests answered with ``error_status``.
+        error_status (int): Status code of injected errors.
+        capacity (int, optional): Requests the server handles at once; beyond
+            that, each extra request in flight adds ``latency`` and requests
+            above twice the capacity are rejected with 429.
+        chunk_size (int): Response bodies are sent in chunks of this many bytes.
+        seed (int, optional): Seed for latency jitter and error injection.
+    """
+
+    sessions: int = 100
+    participants: int = 4
+    tracks: int = 2
+    devices: int = 20
+    latency: float = 0.0
+    jitter: float = 0.0
+    error_rate: float = 0.0
+    error_status: int = 503
+    capacity: Optional[int] = None
+    chunk_size: int = 64 * 1024
+    seed: Optional[int] = None
+
+
+class StandinServer:
+    """An ASGI application imitating the SyncFlow API; see the module docstring."""
+
+    def __init__(self, config: StandinConfig = None):
+        self.config = config or StandinConfig()
+        self.random = random.Random(self.config.seed)
+        self.routes = [
+            (method, re.compile(pattern + "$"), getattr(self, f"_{name}"))
+            for method, pattern, name in ROUTES
+        ]
+        self.requests: Dict[Tuple[str, str], int] = {}
+        self.errors = 0
+        self.rejected = 0
+        self.in_flight = 0
+        self.sessions = {}
+        for index in range(self.config.sessions):
+            session = make_session(index, self.config.participants, self.config.tracks)
+            self.sessions[session["id"]] = session
+        self.devices = {}
+        for index in range(self.config.devices):
+            self._add_device(f"device-{index}", f"group-{index % 4}", None)
+        self._sessions_body = None
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                if message["type"] == "lifespan.startup":
+                    await send({"type": "lifespan.startup.complete"})
+                elif message["type"] == "lifespan.shutdown":
+                    await send({"type": "lifespan.shutdown.complete"})
+                    return
+        body = b""
+        while True:
+            message = await receive()
+            body += message.get("body", b"")
+            if not message.get("more_body"):
+                break
+        self.in_flight += 1
+        try:
+            status, content = await self.handle(scope["method"], scope["path"], body)
+        finally:
+            self.in_flight -= 1
+        await self._respond(send, status, content)
+
+    async def handle(self, method: str, path: str, body: bytes) -> Tuple[int, bytes]:
+        config = self.config
+        delay = config.latency + self.random.uniform(0, config.jitter)
+        if config.capacity is not None and self.in_flight > config.capacity:
+            if self.in_flight > 2 * config.capacity:
+                self.rejected += 1
+                await asyncio.sleep(delay)
+                return 429, codec.dumps({"detail": "Too many requests"})
+            delay += config.latency * (self.in_flight - config.capacity)
+        if delay:
+            await asyncio.sleep(delay)
+        for route_method, pattern, handler in self.routes:
+            match = pattern.match(path)
+            if match and route_method == method:
+                break
+        else:
+            return 404, codec.dumps({"detail": f"No route for {method} {path}"})
+        key = (method, pattern.pattern)
+        self.requests[key] = self.requests.get(key, 0) + 1
+        if config.error_rate and self.random.random() < config.error_rate:
+            self.errors += 1
+            return config.error_status, codec.dumps({"detail": "Injected error"})
+        data = codec.loads(body) if body else None
+        params = match.groupdict()
+        params.pop("project")
+        return handler(data, **params)
+
+    async def _respond(self, send, status: int, content: bytes):
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(content)).encode()),
+                ],
+            }
+        )
+        chunk_size = self.config.chunk_size
+        for offset in range(0, len(content), chunk_size):
+            await send(
+                {
+                    "type": "http.response.body",
+                    "body": content[offset : offset + chunk_size],
+                    "more_body": offset + chunk_size < len(content),
+                }
+            )
+        if not content:
+            await send({"type": "http.response.body", "body": b""})
+
+    def _add_device(self, name, group, comments) -> dict:
+        device_id = str(uuid.uuid4())
+        device = {
+            "id": device_id,
+            "name": name,
+            "group": group,
+            "comments": comments,
+            "registeredAt": int(time.time()),
+            "registeredBy": 1,
+            "projectId": "project",
+            "sessionNotificationExchangeName": "session_notifications",
+            "sessionNotificationBindingKey": f"project.{group}",
+        }
+        self.devices[device_id] = device
+        return device
+
+    def _not_found(self, kind, key) -> Tuple[int, bytes]:
+        return 404, codec.dumps({"detail": f"{kind} {key} not found"})
+
+    def _project(self, data) -> Tuple[int, bytes]:
+        return 200, codec.dumps(
+            {
+                "id": "project",
+                "name": "Stand-in project",
+                "description": "Synthetic project served by the stand-in server",
+                "livekitServerUrl": "wss://livekit.example.com",
+                "storageType": "s3",
+                "bucketName": "recordings",
+                "endpoint": "https://storage.example.com",
+                "lastUpdated": int(time.time()),
+            }
+        )
+
+    def _summarize(self, data) -> Tuple[int, bytes]:
+        sessions = self.sessions.values()
+        return 200, codec.dumps(
+            {
+                "numSessions": len(self.sessions),
+                "numActiveSessions": sum(s["status"] == "Started" for s in sessions),
+                "numParticipants": sum(s["numParticipants"] for s in sessions),
+                "numRecordings": sum(s["numRecordings"] for s in sessions),
+            }
+        )
+
+    def _create_session(self, data) -> Tuple[int, bytes]:
+        data = data or {}
+        session = make_session(len(self.sessions), participants=0, tracks=0)
+        session["id"] = str(uuid.uuid4())
+        session["status"] = "Started"
+        for field in ("name", "comments", "emptyTimeout", "maxParticipants"):
+            if data.get(field) is not None:
+                session[field] = data[field]
+        session["deviceGroups"] = data.get("deviceGroups")
+        self.sessions[session["id"]] = session
+        self._sessions_body = None
+        return 200, codec.dumps(session)
+
+    def _sessions(self, data) -> Tuple[int, bytes]:
+        if self._sessions_body is None:
+            self._sessions_body = codec.dumps(list(self.sessions.values()))
+        return 200, self._sessions_body
+
+    def _session(self, data, session) -> Tuple[int, bytes]:
+        if session not in self.sessions:
+            return self._not_found("Session", session)
+        return 200, codec.dumps(self.sessions[session])
+
+    def _participants(self, data, session) -> Tuple[int, bytes]:
+        if session not in self.sessions:
+            return self._not_found("Session", session)
+        return 200, codec.dumps(
+            [
+                {
+                    "id": participant["id"],
+                    "identity": participant["identity"],
+                    "name": participant["name"],
+                    "state": "CONNECTED",
+                    "tracks": [
+                        {"sid": track["sid"]} for track in participant["tracks"]
+                    ],
+                    "metadata": "",
+                    "joinedAt": participant["joinedAt"],
+                    "permission": {"canPublish": True, "canSubscribe": True},
+                    "isPublisher": True,
+                }
+                for participant in self.sessions[session]["participants"]
+            ]
+        )
+
+    def _token(self, data, session) -> Tuple[int, bytes]:
+        if session not in self.sessions:
+            return self._not_found("Session", session)
+        identity = (data or {}).get("identity", "anonymous")
+        return 200, codec.dumps(
+            {
+                "token": f"standin.{session}.{identity}.{uuid.uuid4().hex}",
+                "identity": identity,
+                "livekitServerUrl": "wss://livekit.example.com",
+            }
+        )
+
+    def _livekit_session_info(self, data, session) -> Tuple[int, bytes]:
+        if session not in self.sessions:
+            return self._not_found("Session", session)
+        room = self.sessions[session]["livekitRoomName"]
+        return 200, codec.dumps(
+            {"sid": f"RM_{room}", "name": room, "numParticipants": 0}
+        )
+
+    def _stop_session(self, data, session) -> Tuple[int, bytes]:
+        if session not in self.sessions:
+            return self._not_found("Session", session)
+        self.sessions[session]["status"] = "Stopped"
+        self._sessions_body = None
+        return 200, codec.dumps(self.sessions[session])
+
+    def _register_device(self, data) -> Tuple[int, bytes]:
+        data = data or {}
+        device = self._add_device(
+            data.get("name", "device"),
+            data.get("group", "default"),
+            data.get("comments"),
+        )
+        return 200, codec.dumps(device)
+
+    def _devices(self, data) -> Tuple[int, bytes]:
+        return 200, codec.dumps(list(self.devices.values()))
+
+    def _device(self, data, device) -> Tuple[int, bytes]:
+        if device not in self.devices:
+            return self._not_found("Device", device)
+        return 200, codec.dumps(self.devices[device])
+
+    def _delete_device(self, data, device) -> Tuple[int, bytes]:
+        if device not in self.devices:
+            return self._not_found("Device", device)
+        return 200, codec.dumps(self.devices.pop(device))
+
+
+@asynccontextmanager
+async def standin_client(server: StandinServer, **kwargs):
+    """A ``ProjectClient`` whose requests are served in-process by ``server``."""
+    import httpx
+
+    transport = SharedTransport(transport=httpx.ASGITransport(app=server))
+    client = ProjectClient(
+        "http://standin",
+        "project",
+        "api-key",
+        "api-secret-for-the-stand-in-server",
+        transport=transport,
+        **kwargs,
+    )
+    try:
+        yield client
+    finally:
+        await client.aclose()
+        await transport.aclose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve the SyncFlow stand-in API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--sessions", type=int, default=100)
+    parser.add_argument("--participants", type=int, default=4)
+    parser.add_argument("--tracks", type=int, default=2)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    try:
+        import uvicorn
+    except ImportError:
+        parser.exit(1, "Serving over HTTP requires uvicorn: pip install uvicorn\n")
+    config = StandinConfig(
+        sessions=args.sessions,
+        participants=args.participants,
+        tracks=args.tracks,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+    )
+    uvicorn.run(StandinServer(config), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,18 +2,27 @@
 import argparse
 import asyncio
 import json
+import sys
+import time
 
 from dotenv import load_dotenv
+from pydantic_core import to_json
 
+from syncflow.limits import AdaptiveLimiter
 from syncflow.models import CreateSessionRequest, RegisterDeviceRequest, TokenRequest, VideoGrantsWrapper
 from syncflow.project_client import ProjectClient
 
 
+def print_json(value):
+    """Print models, lists of models or plain data as indented JSON."""
+    print(to_json(value, indent=2).decode("utf-8"))
+
+
 async def list_sessions(args, client):
     """List all available sessions"""
     sessions = await client.list_sessions()
     if args.json:
-        print(json.dumps([session.__dict__ for session in sessions], indent=2))
+        print_json(sessions)
     else:
         for session in sessions:
             print(f"Session ID: {session.id}")
@@ -23,7 +32,7 @@ async def get_session(args, client):
     """Get details for a specific session"""
     session = await client.list_session(args.session_id)
     if args.json:
-        print(json.dumps(session.__dict__, indent=2))
+        print_json(session)
     else:
         print(f"Session Details: {session}")
 
@@ -37,7 +46,7 @@ async def create_session(args, client):
     )
     session = await client.create_session(request)
     if args.json:
-        print(json.dumps(session.__dict__, indent=2))
+        print_json(session)
     else:
         print(f"Created Session: {session}")
 
@@ -46,7 +55,7 @@ async def stop_session(args, client):
     """Stop a specific session"""
     session = await client.stop_session(args.session_id)
     if args.json:
-        print(json.dumps(session.__dict__, indent=2))
+        print_json(session)
     else:
         print(f"Stopped Session: {session}")
 
@@ -55,7 +64,7 @@ async def get_project_details(args, client):
     """Get project details"""
     details = await client.get_project_details()
     if args.json:
-        print(json.dumps(details.__dict__, indent=2))
+        print_json(details)
     else:
         print(f"Project Details: {details}")
 
@@ -75,11 +84,8 @@ async def delete_project(args, client):
 async def list_participants(args, client):
     """List participants for a specific session"""
     participants = await client.list_participants(args.session_id)
-    print(participants)
     if args.json:
-        print(
-            json.dumps([participant.__dict__ for participant in participants], indent=2)
-        )
+        print_json(participants)
     else:
         for participant in participants:
             print(f"Participant: {participant}")
@@ -88,14 +94,13 @@ async def list_participants(args, client):
 async def generate_token(args, client):
     """Generate a session token"""
     session = await client.list_session(args.session_id)
-    print(session)
     video_grants = VideoGrantsWrapper(room=session.name)
     request = TokenRequest(
         identity=args.participant_id, name=args.participant_name, video_grants=video_grants
     )
     token = await client.generate_session_token(args.session_id, request)
     if args.json:
-        print(json.dumps(token.__dict__, indent=2))
+        print_json(token)
     else:
         print(f"Generated Token: {token}")
 
@@ -103,7 +108,7 @@ async def generate_token(args, client):
 async def get_livekit_info(args, client):
     """Get LiveKit session information"""
     info = await client.get_livekit_session_info(args.session_id)
-    print(json.dumps(info, indent=2))
+    print_json(info)
 
 
 async def register_device(args, client):
@@ -115,7 +120,7 @@ async def register_device(args, client):
     )
     device = await client.register_device(request)
     if args.json:
-        print(json.dumps(device.__dict__, indent=2))
+        print_json(device)
     else:
         print(f"Registered Device: {device}")
 
@@ -124,7 +129,7 @@ async def list_devices(args, client):
     """List all registered devices"""
     devices = await client.list_devices()
     if args.json:
-        print(json.dumps([device.__dict__ for device in devices], indent=2))
+        print_json(devices)
     else:
         for device in devices:
             print(f"Device: {device}")
@@ -134,7 +139,7 @@ async def get_device(args, client):
     """Get details for a specific device"""
     device = await client.list_device(args.device_id)
     if args.json:
-        print(json.dumps(device.__dict__, indent=2))
+        print_json(device)
     else:
         print(f"Device Details: {device}")
 
@@ -143,11 +148,131 @@ async def delete_device(args, client):
     """Delete a specific device"""
     device = await client.delete_device(args.device_id)
     if args.json:
-        print(json.dumps(device.__dict__, indent=2))
+        print_json(device)
     else:
         print(f"Deleted Device: {device}")
 
 
+async def _batch_token(client, args):
+    session_id = args.pop("session_id")
+    if "video_grants" not in args:
+        session = await client.list_session(session_id)
+        args["video_grants"] = {"room": session.name}
+    request = TokenRequest.model_validate(args)
+    return await client.generate_session_token(session_id, request)
+
+
+BATCH_OPERATIONS = {
+    "get_project_details": lambda client, args: client.get_project_details(),
+    "summarize_project": lambda client, args: client.summarize_project(),
+    "list_sessions": lambda client, args: client.list_sessions(),
+    "list_session": lambda client, args: client.list_session(args["session_id"]),
+    "create_session": lambda client, args: client.create_session(
+        CreateSessionRequest.model_validate(args)
+    ),
+    "stop_session": lambda client, args: client.stop_session(args["session_id"]),
+    "list_participants": lambda client, args: client.list_participants(
+        args["session_id"]
+    ),
+    "generate_session_token": _batch_token,
+    "get_livekit_session_info": lambda client, args: client.get_livekit_session_info(
+        args["session_id"]
+    ),
+    "register_device": lambda client, args: client.register_device(
+        RegisterDeviceRequest.model_validate(args)
+    ),
+    "list_devices": lambda client, args: client.list_devices(),
+    "list_device": lambda client, args: client.list_device(args["device_id"]),
+    "delete_device": lambda client, args: client.delete_device(args["device_id"]),
+}
+
+
+class InvalidCommand(ValueError):
+    pass
+
+
+def parse_command(line):
+    try:
+        command = json.loads(line)
+    except ValueError as e:
+        raise InvalidCommand(f"Invalid JSON: {e}") from None
+    if not isinstance(command, dict) or command.get("op") not in BATCH_OPERATIONS:
+        raise InvalidCommand(f"Unknown command: {line.strip()}")
+    return command
+
+
+async def run_command(client, line_number, line):
+    """Run one NDJSON command and return its result record"""
+    started = time.perf_counter()
+    record = {"id": line_number, "op": None}
+    try:
+        command = parse_command(line)
+        record["id"] = command.get("id", line_number)
+        record["op"] = command["op"]
+        operation = BATCH_OPERATIONS[command["op"]]
+        result = await operation(client, dict(command.get("args") or {}))
+        record.update(ok=True, result=result)
+    except Exception as e:
+        record.update(
+            ok=False,
+            error={
+                "type": type(e).__name__,
+                "message": str(e),
+                "status_code": getattr(e, "status_code", None),
+            },
+        )
+    record["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 3)
+    return record
+
+
+async def run_batch(args, client):
+    """Run NDJSON commands concurrently and stream NDJSON results"""
+    source = sys.stdin if args.input == "-" else open(args.input)
+    output = sys.stdout.buffer if args.output == "-" else open(args.output, "wb")
+    loop = asyncio.get_running_loop()
+    queue = asyncio.Queue(maxsize=args.concurrency * 2)
+    counts = {True: 0, False: 0}
+    started = time.perf_counter()
+
+    async def read():
+        line_number = 0
+        while True:
+            line = await loop.run_in_executor(None, source.readline)
+            if not line:
+                break
+            line_number += 1
+            if line.strip():
+                await queue.put((line_number, line))
+        for _ in range(args.concurrency):
+            await queue.put(None)
+
+    async def work():
+        while True:
+            item = await queue.get()
+            if item is None:
+                return
+            record = await run_command(client, *item)
+            counts[record["ok"]] += 1
+            output.write(to_json(record) + b"\n")
+            output.flush()
+
+    try:
+        await asyncio.gather(read(), *(work() for _ in range(args.concurrency)))
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if output is not sys.stdout.buffer:
+            output.close()
+
+    elapsed = time.perf_counter() - started
+    total = counts[True] + counts[False]
+    print(
+        f"{total} commands, {counts[False]} failed in {elapsed:.2f}s "
+        f"({total / elapsed if elapsed else 0:.1f}/s)",
+        file=sys.stderr,
+    )
+
+
 async def main():
     parser = argparse.ArgumentParser(description="Project Management CLI")
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
@@ -269,8 +394,32 @@ async def main():
     )
     delete_device_parser.set_defaults(func=delete_device)
 
+    # Batch commands
+    batch_parser = subparsers.add_parser(
+        "batch",
+        help='Run NDJSON commands, e.g. {"id": 1, "op": "list_session", '
+        '"args": {"session_id": "..."}}, and write NDJSON results',
+    )
+    batch_parser.add_argument(
+        "input", nargs="?", default="-", help="Command file, or - for stdin"
+    )
+    batch_parser.add_argument(
+        "--output", default="-", help="Result file, or - for stdout"
+    )
+    batch_parser.add_argument(
+        "--concurrency", type=int, default=32, help="Commands run at once"
+    )
+    batch_parser.set_defaults(func=run_batch)
+
     args = parser.parse_args()
-    client = ProjectClient()
+    if args.command == "batch":
+        client = ProjectClient(
+            concurrency_limiter=AdaptiveLimiter(
+                initial_limit=min(16, args.concurrency), max_limit=args.concurrency
+            )
+        )
+    else:
+        client = ProjectClient()
 
     try:
         await args.func(args, client)
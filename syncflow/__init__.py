@@ -1 +1,78 @@
+"""
+Python client for SyncFlow.
+
+The names below are imported from their submodules on first access, so
+``import syncflow`` stays cheap for tools that only need part of the package.
+"""
+
+import importlib
+from typing import TYPE_CHECKING
+
 __version__ = "0.0.1"
+
+_LAZY_ATTRIBUTES = {
+    "ProjectClient": "syncflow.project_client",
+    "HttpError": "syncflow.project_client",
+    "SyncProjectClient": "syncflow.sync_client",
+    "FleetClient": "syncflow.fleet",
+    "ProjectCredentials": "syncflow.fleet",
+    "PoolConfig": "syncflow.transport",
+    "SharedTransport": "syncflow.transport",
+    "RetryPolicy": "syncflow.retry",
+    "HedgePolicy": "syncflow.retry",
+    "ResponseCache": "syncflow.cache",
+    "SessionStore": "syncflow.session_store",
+    "SessionTokenCache": "syncflow.session_tokens",
+    "AdaptiveLimiter": "syncflow.limits",
+    "RateLimits": "syncflow.limits",
+    "CreateSessionRequest": "syncflow.models",
+    "RegisterDeviceRequest": "syncflow.models",
+    "TokenRequest": "syncflow.models",
+    "VideoGrantsWrapper": "syncflow.models",
+    "ProjectInfo": "syncflow.models",
+    "ProjectSummary": "syncflow.models",
+    "ProjectSessionResponse": "syncflow.models",
+    "ParticipantInfo": "syncflow.models",
+    "TokenResponse": "syncflow.models",
+    "DeviceResponse": "syncflow.models",
+    "SessionNotification": "syncflow.models",
+}
+
+__all__ = ["__version__", *_LAZY_ATTRIBUTES]
+
+if TYPE_CHECKING:
+    from syncflow.cache import ResponseCache
+    from syncflow.fleet import FleetClient, ProjectCredentials
+    from syncflow.limits import AdaptiveLimiter, RateLimits
+    from syncflow.models import (
+        CreateSessionRequest,
+        DeviceResponse,
+        ParticipantInfo,
+        ProjectInfo,
+        ProjectSessionResponse,
+        ProjectSummary,
+        RegisterDeviceRequest,
+        SessionNotification,
+        TokenRequest,
+        TokenResponse,
+        VideoGrantsWrapper,
+    )
+    from syncflow.project_client import HttpError, ProjectClient
+    from syncflow.retry import HedgePolicy, RetryPolicy
+    from syncflow.session_store import SessionStore
+    from syncflow.session_tokens import SessionTokenCache
+    from syncflow.sync_client import SyncProjectClient
+    from syncflow.transport import PoolConfig, SharedTransport
+
+
+def __getattr__(name):
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module 'syncflow' has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
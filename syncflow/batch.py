@@ -0,0 +1,175 @@
+import asyncio
+import copy
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+READ_METHODS = frozenset(
+    {
+        "get_project_details",
+        "summarize_project",
+        "list_sessions",
+        "list_sessions_compact",
+        "list_session",
+        "list_participants",
+        "get_livekit_session_info",
+        "list_devices",
+        "list_device",
+    }
+)
+WRITE_METHODS = frozenset(
+    {
+        "create_session",
+        "stop_session",
+        "generate_session_token",
+        "register_device",
+        "delete_device",
+    }
+)
+
+
+@dataclass
+class BatchOperation:
+    """One queued call and, once the batch has run, its outcome."""
+
+    method: str
+    args: tuple
+    kwargs: dict
+    value: Any = None
+    error: Optional[Exception] = None
+    elapsed: float = 0.0
+    deduplicated: bool = False
+    done: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.done and self.error is None
+
+    def result(self) -> Any:
+        """The call's return value; raises its exception if it failed."""
+        if not self.done:
+            raise RuntimeError(f"{self.method} has not run yet")
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+
+@dataclass
+class BatchReport:
+    operations: List[BatchOperation] = field(default_factory=list)
+    elapsed: float = 0.0
+    calls: int = 0
+
+    @property
+    def succeeded(self) -> List[BatchOperation]:
+        return [operation for operation in self.operations if operation.ok]
+
+    @property
+    def failed(self) -> List[BatchOperation]:
+        return [operation for operation in self.operations if operation.error]
+
+
+class Batch:
+    """
+    Queues ``ProjectClient`` calls and runs them together.
+
+    Calls are queued by invoking client methods on the batch, which returns a
+    ``BatchOperation`` instead of a coroutine. Leaving the ``async with`` block
+    (or awaiting ``run``) executes every queued call concurrently, with at most
+    ``concurrency`` in flight. Identical reads are sent once, and each
+    operation gets its own copy of the result. Operations are not ordered, so calls that depend on each other
+    belong in separate batches.
+
+        async with client.batch(concurrency=8) as batch:
+            created = batch.create_session(request)
+            participants = batch.list_participants(session_id)
+        print(batch.report.elapsed, participants.result())
+
+    A failed call stores its exception on its operation rather than failing
+    the batch.
+    """
+
+    def __init__(self, client, concurrency: int = 8):
+        self.client = client
+        self.concurrency = concurrency
+        self.operations: List[BatchOperation] = []
+        self.report: Optional[BatchReport] = None
+
+    def add(self, method: str, *args, **kwargs) -> BatchOperation:
+        if method not in READ_METHODS and method not in WRITE_METHODS:
+            raise ValueError(f"{method} cannot be batched")
+        if self.report is not None:
+            raise RuntimeError("This batch has already run")
+        operation = BatchOperation(method, args, kwargs)
+        self.operations.append(operation)
+        return operation
+
+    def __getattr__(self, name):
+        if name in READ_METHODS or name in WRITE_METHODS:
+            return lambda *args, **kwargs: self.add(name, *args, **kwargs)
+        raise AttributeError(name)
+
+    def _groups(self) -> List[List[BatchOperation]]:
+        groups: List[List[BatchOperation]] = []
+        reads: Dict[tuple, List[BatchOperation]] = {}
+        for operation in self.operations:
+            if operation.method not in READ_METHODS:
+                groups.append([operation])
+                continue
+            key = (
+                operation.method,
+                operation.args,
+                tuple(sorted(operation.kwargs.items())),
+            )
+            try:
+                group = reads.get(key)
+            except TypeError:
+                groups.append([operation])
+                continue
+            if group is None:
+                group = reads[key] = []
+                groups.append(group)
+            else:
+                operation.deduplicated = True
+            group.append(operation)
+        return groups
+
+    async def run(self) -> BatchReport:
+        if self.report is not None:
+            return self.report
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def execute(group):
+            first = group[0]
+            async with semaphore:
+                started = time.perf_counter()
+                value, error = None, None
+                try:
+                    value = await getattr(self.client, first.method)(
+                        *first.args, **first.kwargs
+                    )
+                except Exception as e:
+                    error = e
+                elapsed = time.perf_counter() - started
+            for index, operation in enumerate(group):
+                operation.value = value if index == 0 else copy.deepcopy(value)
+                operation.error = error
+                operation.elapsed = elapsed
+                operation.done = True
+
+        groups = self._groups()
+        started = time.perf_counter()
+        await asyncio.gather(*(execute(group) for group in groups))
+        self.report = BatchReport(
+            operations=list(self.operations),
+            elapsed=time.perf_counter() - started,
+            calls=len(groups),
+        )
+        return self.report
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            await self.run()
@@ -0,0 +1,104 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+DEFAULT_TTLS = {
+    "get_project_details": 60.0,
+    "list_devices": 30.0,
+    "list_device": 60.0,
+    "list_session": 300.0,
+}
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+
+
+class ResponseCache:
+    """
+    An LRU cache of response bodies with a TTL per endpoint.
+
+    Only endpoints listed in ``ttls`` are cached. ``ProjectClient`` stores the
+    raw body and decodes it again on every hit, so callers can mutate what
+    they get back without affecting later hits. It invalidates the affected
+    entries whenever it performs a mutation, and results fetched
+    concurrently with an invalidation are not stored.
+
+    Args:
+        max_entries (int, optional): Maximum number of cached responses. Defaults to 1024.
+        ttls (dict, optional): Seconds to keep responses for each endpoint, keyed by
+            the ``ProjectClient`` method name. Defaults to ``DEFAULT_TTLS``.
+        clock (callable, optional): Monotonic time source. Defaults to ``time.monotonic``.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttls: Dict[str, float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_entries = max_entries
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.stats = CacheStats()
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        """Incremented on every invalidation; used to discard racing writes."""
+        return self._generation
+
+    def is_cacheable(self, endpoint: str) -> bool:
+        return self.ttls.get(endpoint, 0) > 0
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats.misses += 1
+            return False, None
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            self.stats.expirations += 1
+            self.stats.misses += 1
+            return False, None
+        self._entries.move_to_end(key)
+        self.stats.hits += 1
+        return True, value
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        endpoint: str,
+        generation: Optional[int] = None,
+    ):
+        ttl = self.ttls.get(endpoint, 0)
+        if ttl <= 0 or (generation is not None and generation != self._generation):
+            return
+        self._entries[key] = (self._clock() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    def invalidate(self, *keys: Hashable):
+        self._generation += 1
+        for key in keys:
+            if self._entries.pop(key, None) is not None:
+                self.stats.invalidations += 1
+
+    def clear(self):
+        self._generation += 1
+        self.stats.invalidations += len(self._entries)
+        self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
@@ -0,0 +1,57 @@
+import json
+from functools import lru_cache
+from typing import Any, Type, TypeVar
+
+from pydantic import BaseModel, TypeAdapter
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+T = TypeVar("T")
+
+
+def loads(content: bytes) -> Any:
+    """Parse JSON bytes, using orjson when it is installed."""
+    if not content:
+        return None
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def dumps(data: Any) -> bytes:
+    """Serialize plain Python data to JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+@lru_cache(maxsize=None)
+def type_adapter(response_type: Type[T]) -> TypeAdapter:
+    return TypeAdapter(response_type)
+
+
+def decode(content: bytes, response_type: Type[T]) -> T:
+    """
+    Validate raw JSON bytes straight into ``response_type``.
+
+    Args:
+        content (bytes): The raw response body.
+        response_type (type): A model or typing construct such as
+            ``List[ProjectSessionResponse]``.
+
+    Returns:
+        Any: The validated value.
+    """
+    if response_type is Any or response_type is dict:
+        return loads(content)
+    return type_adapter(response_type).validate_json(content)
+
+
+def encode(data: Any) -> bytes:
+    """Serialize a request body to JSON bytes, honouring model aliases."""
+    if isinstance(data, BaseModel):
+        return data.model_dump_json(by_alias=True).encode("utf-8")
+    return dumps(data)
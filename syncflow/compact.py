@@ -0,0 +1,159 @@
+"""
+Slotted, immutable records for large read-only listings.
+
+These mirror the response models in ``syncflow.models`` as ``NamedTuple``
+types. They skip pydantic validation and per-instance ``__dict__``s, which
+makes them much smaller in memory when holding thousands of sessions. Use the
+pydantic models when payloads need to be validated or modified.
+"""
+
+from typing import List, NamedTuple, Optional, Tuple
+
+from syncflow import codec
+
+
+class CompactMultimediaDetails(NamedTuple):
+    file_name: Optional[str]
+    destination: Optional[str]
+    publisher: Optional[str]
+    track_id: Optional[str]
+    presigned_url: Optional[str]
+    presigned_url_expires: Optional[int]
+    recording_start_time: Optional[int]
+
+
+class CompactTrack(NamedTuple):
+    id: str
+    sid: str
+    name: Optional[str]
+    kind: str
+    source: str
+    participant_id: str
+    multimedia_details: Optional[CompactMultimediaDetails]
+
+
+class CompactParticipant(NamedTuple):
+    id: str
+    identity: str
+    name: Optional[str]
+    joined_at: int
+    left_at: Optional[int]
+    session_id: str
+    tracks: Tuple[CompactTrack, ...]
+
+
+class CompactEgress(NamedTuple):
+    id: str
+    track_id: str
+    egress_id: str
+    started_at: int
+    egress_type: Optional[str]
+    status: str
+    destination: Optional[str]
+    room_name: str
+    session_id: str
+    participant_id: Optional[str]
+    db_track_id: Optional[str]
+
+
+class CompactSession(NamedTuple):
+    id: str
+    name: str
+    started_at: int
+    comments: str
+    empty_timeout: int
+    max_participants: int
+    livekit_room_name: str
+    project_id: str
+    status: str
+    num_participants: int
+    num_recordings: int
+    participants: Tuple[CompactParticipant, ...]
+    recordings: Tuple[CompactEgress, ...]
+    duration: int
+    device_groups: Optional[Tuple[str, ...]]
+
+    def is_stopped(self):
+        return self.status.lower() == "stopped"
+
+
+def _multimedia_details(data: Optional[dict]) -> Optional[CompactMultimediaDetails]:
+    if data is None:
+        return None
+    get = data.get
+    return CompactMultimediaDetails(
+        get("fileName"),
+        get("destination"),
+        get("publisher"),
+        get("trackId"),
+        get("presignedUrl"),
+        get("presignedUrlExpires"),
+        get("recordingStartTime"),
+    )
+
+
+def _track(data: dict) -> CompactTrack:
+    return CompactTrack(
+        data["id"],
+        data["sid"],
+        data.get("name"),
+        data["kind"],
+        data["source"],
+        data["participantId"],
+        _multimedia_details(data.get("multimediaDetails")),
+    )
+
+
+def _participant(data: dict) -> CompactParticipant:
+    return CompactParticipant(
+        data["id"],
+        data["identity"],
+        data.get("name"),
+        data["joinedAt"],
+        data.get("leftAt"),
+        data["sessionId"],
+        tuple(_track(track) for track in data.get("tracks") or ()),
+    )
+
+
+def _egress(data: dict) -> CompactEgress:
+    get = data.get
+    return CompactEgress(
+        data["id"],
+        data["trackId"],
+        data["egressId"],
+        data["startedAt"],
+        get("egressType"),
+        data["status"],
+        get("destination"),
+        data["roomName"],
+        data["sessionId"],
+        get("participantId"),
+        get("dbTrackId"),
+    )
+
+
+def compact_session(data: dict) -> CompactSession:
+    """Build a ``CompactSession`` from a camelCase session JSON object."""
+    device_groups = data.get("deviceGroups")
+    return CompactSession(
+        data["id"],
+        data["name"],
+        data["startedAt"],
+        data["comments"],
+        data["emptyTimeout"],
+        data["maxParticipants"],
+        data["livekitRoomName"],
+        data["projectId"],
+        data["status"],
+        data["numParticipants"],
+        data["numRecordings"],
+        tuple(_participant(p) for p in data.get("participants") or ()),
+        tuple(_egress(e) for e in data.get("recordings") or ()),
+        data["duration"],
+        tuple(device_groups) if device_groups is not None else None,
+    )
+
+
+def decode_sessions(content: bytes) -> List[CompactSession]:
+    return [compact_session(session) for session in codec.loads(content)]
@@ -0,0 +1,387 @@
+import asyncio
+import json
+import mmap
+import os
+import re
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+import httpx
+
+from syncflow.models import (
+    MultimediaDetailsResponse,
+    ParticipantTrackResponse,
+    ProjectSessionResponse,
+)
+from syncflow.retry import RetryPolicy
+
+_CONTENT_RANGE = re.compile(r"bytes \d+-\d+/(\d+)")
+
+
+class PresignedUrlExpired(Exception):
+    pass
+
+
+@dataclass
+class DownloadResult:
+    session_id: str
+    track_id: str
+    path: Optional[Path] = None
+    bytes: int = 0
+    elapsed: float = 0.0
+    skipped: bool = False
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class DownloadStats:
+    files: int = 0
+    skipped: int = 0
+    failed: int = 0
+    bytes: int = 0
+    elapsed: float = 0.0
+    url_refreshes: int = 0
+    chunk_retries: int = 0
+
+    @property
+    def throughput(self) -> float:
+        """
+        Bytes per second over all completed downloads.
+
+        ``elapsed`` is the wall-clock time during which at least one download
+        was running, so concurrent downloads are not counted twice.
+        """
+        return self.bytes / self.elapsed if self.elapsed else 0.0
+
+
+@dataclass
+class _PartialFile:
+    size: int
+    chunk_size: int
+    completed: Set[int] = field(default_factory=set)
+
+    @property
+    def num_chunks(self) -> int:
+        return max(1, -(-self.size // self.chunk_size))
+
+    def chunk_range(self, index: int) -> Tuple[int, int]:
+        start = index * self.chunk_size
+        return start, min(self.size, start + self.chunk_size) - 1
+
+
+class RecordingDownloader:
+    """
+    Download the recordings of a session's tracks through their presigned URLs.
+
+    Recordings are fetched concurrently and split into HTTP range requests
+    that are written straight into a preallocated, memory-mapped ``.part``
+    file, so no recording is held in memory. Completed chunks are tracked in
+    a ``.part.json`` file next to it, which lets an interrupted download
+    resume. Presigned URLs that have expired, or are rejected with a 403, are
+    refreshed by fetching the session again.
+
+    Args:
+        client (ProjectClient): Used to refresh expired presigned URLs.
+        directory (str): Recordings are written to ``directory/<session_id>/``.
+        concurrency (int, optional): Maximum recordings downloaded at once. Defaults to 4.
+        chunk_size (int, optional): Size of each range request in bytes. Defaults to 8 MiB.
+        chunk_concurrency (int, optional): Maximum range requests per recording.
+            Defaults to 4.
+        http_client (httpx.AsyncClient, optional): Client used for the downloads.
+            Presigned URLs must not carry the project credentials, so this is
+            separate from ``client.httpx_client``.
+        retry_policy (RetryPolicy, optional): How range requests that fail with
+            a transport error, a 5xx or one of the policy's status codes are
+            retried. Defaults to three attempts with jittered backoff.
+    """
+
+    def __init__(
+        self,
+        client,
+        directory: str,
+        concurrency: int = 4,
+        chunk_size: int = 8 * 1024 * 1024,
+        chunk_concurrency: int = 4,
+        http_client: httpx.AsyncClient = None,
+        url_expiry_margin: float = 30,
+        retry_policy: RetryPolicy = None,
+    ):
+        self.client = client
+        self.directory = Path(directory)
+        self.concurrency = concurrency
+        self.chunk_size = chunk_size
+        self.chunk_concurrency = chunk_concurrency
+        self.url_expiry_margin = url_expiry_margin
+        self.retry_policy = retry_policy or RetryPolicy(budget=None)
+        self.stats = DownloadStats()
+        self._active = 0
+        self._active_since = 0.0
+        self._owns_http_client = http_client is None
+        self.http_client = http_client or httpx.AsyncClient(
+            follow_redirects=True, timeout=httpx.Timeout(30.0, connect=10.0)
+        )
+        self._sessions: Dict[str, ProjectSessionResponse] = {}
+        self._refresh_locks: Dict[str, asyncio.Lock] = {}
+
+    async def download_session(
+        self, session: ProjectSessionResponse
+    ) -> List[DownloadResult]:
+        """Download every track recording of ``session`` that has a presigned URL."""
+        self._sessions[session.id] = session
+        tracks = [
+            track
+            for participant in session.participants
+            for track in participant.tracks
+            if track.multimedia_details is not None
+            and track.multimedia_details.presigned_url
+            and track.multimedia_details.file_name
+        ]
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def download(track):
+            async with semaphore:
+                return await self.download_track(session.id, track)
+
+        return list(await asyncio.gather(*(download(track) for track in tracks)))
+
+    async def download_track(
+        self, session_id: str, track: ParticipantTrackResponse
+    ) -> DownloadResult:
+        details = track.multimedia_details
+        target = self.directory / session_id / os.path.basename(details.file_name)
+        result = DownloadResult(session_id=session_id, track_id=track.id, path=target)
+        if target.exists():
+            result.skipped = True
+            self.stats.skipped += 1
+            return result
+
+        start = time.perf_counter()
+        if not self._active:
+            self._active_since = start
+        self._active += 1
+        try:
+            result.bytes = await self._download(session_id, track.id, details, target)
+        except Exception as e:
+            result.error = e
+            self.stats.failed += 1
+            return result
+        finally:
+            self._active -= 1
+            if not self._active:
+                self.stats.elapsed += time.perf_counter() - self._active_since
+        result.elapsed = time.perf_counter() - start
+        self.stats.files += 1
+        self.stats.bytes += result.bytes
+        return result
+
+    async def _download(
+        self,
+        session_id: str,
+        track_id: str,
+        details: MultimediaDetailsResponse,
+        target: Path,
+    ) -> int:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        part_path = target.with_name(target.name + ".part")
+        state_path = target.with_name(target.name + ".part.json")
+
+        if self._is_expired(details):
+            details = await self._refresh_details(session_id, track_id, details)
+        details, size, ranged = await self._probe(session_id, track_id, details)
+
+        if not ranged:
+            written = await self._download_whole(details, part_path)
+            os.replace(part_path, target)
+            return written
+
+        partial = self._load_state(state_path, size)
+        if partial is None or not part_path.exists():
+            partial = _PartialFile(size=size, chunk_size=self.chunk_size)
+            with open(part_path, "wb") as f:
+                f.truncate(size)
+        self._save_state(state_path, partial)
+
+        if size == 0:
+            os.replace(part_path, target)
+            state_path.unlink()
+            return 0
+
+        pending = [i for i in range(partial.num_chunks) if i not in partial.completed]
+        semaphore = asyncio.Semaphore(self.chunk_concurrency)
+        # Shared so every chunk picks up a URL refreshed by any other chunk.
+        current = {"details": details}
+        written = 0
+
+        with open(part_path, "r+b") as f, mmap.mmap(f.fileno(), size) as mapped:
+
+            async def fetch(index):
+                nonlocal written
+                async with semaphore:
+                    count = await self._download_chunk(
+                        session_id, track_id, current, partial, index, mapped
+                    )
+                    written += count
+                    partial.completed.add(index)
+                    self._save_state(state_path, partial)
+
+            tasks = [asyncio.ensure_future(fetch(index)) for index in pending]
+            try:
+                await asyncio.gather(*tasks)
+            finally:
+                # Stop the remaining chunks before the map they write into closes.
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+            mapped.flush()
+
+        os.replace(part_path, target)
+        state_path.unlink()
+        return written
+
+    async def _download_chunk(
+        self, session_id, track_id, current, partial, index, mapped
+    ) -> int:
+        first, last = partial.chunk_range(index)
+        refreshed = False
+        attempt = 0
+        while True:
+            attempt += 1
+            details = current["details"]
+            offset = first
+            try:
+                async with self.http_client.stream(
+                    "GET",
+                    details.presigned_url,
+                    headers={"Range": f"bytes={first}-{last}"},
+                ) as response:
+                    if response.status_code == 403:
+                        raise PresignedUrlExpired(details.presigned_url)
+                    response.raise_for_status()
+                    if response.status_code != 206:
+                        raise ValueError("Server ignored the range request")
+                    async for data in response.aiter_bytes():
+                        mapped[offset : offset + len(data)] = data
+                        offset += len(data)
+            except PresignedUrlExpired:
+                if refreshed:
+                    raise
+                refreshed = True
+                current["details"] = await self._refresh_details(
+                    session_id, track_id, details
+                )
+                continue
+            except (httpx.TransportError, httpx.HTTPStatusError) as e:
+                response = getattr(e, "response", None)
+                if attempt >= self.retry_policy.max_attempts or not (
+                    response is None
+                    or response.status_code >= 500
+                    or response.status_code in self.retry_policy.status_codes
+                ):
+                    raise
+                self.stats.chunk_retries += 1
+                await asyncio.sleep(self.retry_policy.delay(attempt, response))
+                continue
+            if offset != last + 1:
+                raise ValueError(f"Incomplete range {first}-{last} for {track_id}")
+            return offset - first
+
+    async def _download_whole(self, details, part_path: Path) -> int:
+        written = 0
+        async with self.http_client.stream("GET", details.presigned_url) as response:
+            response.raise_for_status()
+            with open(part_path, "wb") as f:
+                async for data in response.aiter_bytes():
+                    f.write(data)
+                    written += len(data)
+        return written
+
+    async def _probe(self, session_id, track_id, details):
+        """Return the (possibly refreshed) details, total size and range support."""
+        for attempt in range(2):
+            async with self.http_client.stream(
+                "GET", details.presigned_url, headers={"Range": "bytes=0-0"}
+            ) as response:
+                if response.status_code == 403 and not attempt:
+                    details = await self._refresh_details(session_id, track_id, details)
+                    continue
+                if response.status_code == 416:
+                    return details, 0, True
+                response.raise_for_status()
+                match = _CONTENT_RANGE.match(response.headers.get("Content-Range", ""))
+                if response.status_code == 206 and match:
+                    return details, int(match.group(1)), True
+                return details, int(response.headers.get("Content-Length", 0)), False
+        raise PresignedUrlExpired(details.presigned_url)
+
+    def _is_expired(self, details: MultimediaDetailsResponse) -> bool:
+        expires = details.presigned_url_expires
+        return expires is not None and expires - self.url_expiry_margin <= time.time()
+
+    async def _refresh_details(
+        self, session_id: str, track_id: str, stale: MultimediaDetailsResponse
+    ) -> MultimediaDetailsResponse:
+        lock = self._refresh_locks.setdefault(session_id, asyncio.Lock())
+        async with lock:
+            details = self._find_details(self._sessions.get(session_id), track_id)
+            # Another track may already have refreshed the session.
+            if details is None or details.presigned_url == stale.presigned_url:
+                session = await self.client.list_session(session_id, fresh=True)
+                self._sessions[session_id] = session
+                self.stats.url_refreshes += 1
+                details = self._find_details(session, track_id)
+        if details is None or not details.presigned_url:
+            raise PresignedUrlExpired(stale.presigned_url)
+        return details
+
+    @staticmethod
+    def _find_details(
+        session: Optional[ProjectSessionResponse], track_id: str
+    ) -> Optional[MultimediaDetailsResponse]:
+        if session is None:
+            return None
+        for participant in session.participants:
+            for track in participant.tracks:
+                if track.id == track_id:
+                    return track.multimedia_details
+        return None
+
+    def _load_state(self, state_path: Path, size: int) -> Optional[_PartialFile]:
+        try:
+            state = json.loads(state_path.read_text())
+        except (OSError, ValueError):
+            return None
+        if state.get("size") != size or state.get("chunk_size") != self.chunk_size:
+            return None
+        return _PartialFile(
+            size=size, chunk_size=self.chunk_size, completed=set(state["completed"])
+        )
+
+    @staticmethod
+    def _save_state(state_path: Path, partial: _PartialFile):
+        tmp_path = state_path.with_name(state_path.name + ".tmp")
+        tmp_path.write_text(
+            json.dumps(
+                {
+                    "size": partial.size,
+                    "chunk_size": partial.chunk_size,
+                    "completed": sorted(partial.completed),
+                }
+            )
+        )
+        os.replace(tmp_path, state_path)
+
+    async def aclose(self):
+        if self._owns_http_client:
+            await self.http_client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
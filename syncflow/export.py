@@ -0,0 +1,342 @@
+import os
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Tuple,
+    Union,
+)
+
+from syncflow.models import DeviceResponse, ProjectSessionResponse
+
+try:
+    import pyarrow as pa
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+
+# Column kinds: "str" and "int" may be null, "int!" is never null.
+SCHEMAS: Dict[str, List[Tuple[str, str]]] = {
+    "sessions": [
+        ("id", "str"),
+        ("name", "str"),
+        ("project_id", "str"),
+        ("status", "str"),
+        ("started_at", "int!"),
+        ("duration", "int!"),
+        ("comments", "str"),
+        ("empty_timeout", "int!"),
+        ("max_participants", "int!"),
+        ("livekit_room_name", "str"),
+        ("num_participants", "int!"),
+        ("num_recordings", "int!"),
+    ],
+    "participants": [
+        ("id", "str"),
+        ("session_id", "str"),
+        ("identity", "str"),
+        ("name", "str"),
+        ("joined_at", "int!"),
+        ("left_at", "int"),
+        ("num_tracks", "int!"),
+    ],
+    "tracks": [
+        ("id", "str"),
+        ("session_id", "str"),
+        ("participant_id", "str"),
+        ("sid", "str"),
+        ("name", "str"),
+        ("kind", "str"),
+        ("source", "str"),
+        ("file_name", "str"),
+        ("destination", "str"),
+        ("publisher", "str"),
+        ("presigned_url", "str"),
+        ("presigned_url_expires", "int"),
+        ("recording_start_time", "int"),
+    ],
+    "recordings": [
+        ("id", "str"),
+        ("session_id", "str"),
+        ("egress_id", "str"),
+        ("track_id", "str"),
+        ("db_track_id", "str"),
+        ("participant_id", "str"),
+        ("egress_type", "str"),
+        ("status", "str"),
+        ("destination", "str"),
+        ("room_name", "str"),
+        ("started_at", "int!"),
+    ],
+    "devices": [
+        ("id", "str"),
+        ("name", "str"),
+        ("group", "str"),
+        ("comments", "str"),
+        ("project_id", "str"),
+        ("registered_at", "int!"),
+        ("registered_by", "int!"),
+        ("session_notification_exchange_name", "str"),
+        ("session_notification_binding_key", "str"),
+    ],
+}
+
+SESSION_TABLES = ("sessions", "participants", "tracks", "recordings")
+
+
+def _session_rows(session: ProjectSessionResponse) -> Iterator[Tuple[str, tuple]]:
+    yield "sessions", (
+        session.id,
+        session.name,
+        session.project_id,
+        session.status,
+        session.started_at,
+        session.duration,
+        session.comments,
+        session.empty_timeout,
+        session.max_participants,
+        session.livekit_room_name,
+        session.num_participants,
+        session.num_recordings,
+    )
+    for participant in session.participants:
+        yield "participants", (
+            participant.id,
+            session.id,
+            participant.identity,
+            participant.name,
+            participant.joined_at,
+            participant.left_at,
+            len(participant.tracks),
+        )
+        for track in participant.tracks:
+            details = track.multimedia_details
+            yield "tracks", (
+                track.id,
+                session.id,
+                participant.id,
+                track.sid,
+                track.name,
+                track.kind,
+                track.source,
+                details.file_name if details else None,
+                details.destination if details else None,
+                details.publisher if details else None,
+                details.presigned_url if details else None,
+                details.presigned_url_expires if details else None,
+                details.recording_start_time if details else None,
+            )
+    for egress in session.recordings:
+        yield "recordings", (
+            egress.id,
+            session.id,
+            egress.egress_id,
+            egress.track_id,
+            egress.db_track_id,
+            egress.participant_id,
+            egress.egress_type,
+            egress.status,
+            egress.destination,
+            egress.room_name,
+            egress.started_at,
+        )
+
+
+def _device_row(device: DeviceResponse) -> tuple:
+    return (
+        device.id,
+        device.name,
+        device.group,
+        device.comments,
+        device.project_id,
+        device.registered_at,
+        device.registered_by,
+        device.session_notification_exchange_name,
+        device.session_notification_binding_key,
+    )
+
+
+def arrow_schema(table: str):
+    """The pyarrow schema of ``table``."""
+    if pa is None:
+        raise ImportError("Arrow export requires pyarrow: pip install pyarrow")
+    types = {"str": pa.string(), "int": pa.int64(), "int!": pa.int64()}
+    return pa.schema(
+        [
+            pa.field(name, types[kind], nullable=kind != "int!")
+            for name, kind in SCHEMAS[table]
+        ]
+    )
+
+
+def numpy_dtype(table: str):
+    """
+    The structured dtype of ``table``. Strings are object columns and nullable
+    integers are float64 columns with NaN for missing values.
+    """
+    import numpy as np
+
+    kinds = {"str": object, "int": np.float64, "int!": np.int64}
+    return np.dtype([(name, kinds[kind]) for name, kind in SCHEMAS[table]])
+
+
+class _TableBuffer:
+    def __init__(self, table: str, backend: str):
+        self.table = table
+        self.backend = backend
+        self.rows: List[tuple] = []
+
+    def build(self) -> Any:
+        rows, self.rows = self.rows, []
+        if self.backend == "arrow":
+            schema = arrow_schema(self.table)
+            columns = zip(*rows)
+            return pa.RecordBatch.from_arrays(
+                [pa.array(column, type=f.type) for column, f in zip(columns, schema)],
+                schema=schema,
+            )
+        import numpy as np
+
+        dtype = numpy_dtype(self.table)
+        nullable = [kind == "int" for _, kind in SCHEMAS[self.table]]
+        return np.array(
+            [
+                tuple(
+                    float("nan") if null and value is None else value
+                    for value, null in zip(row, nullable)
+                )
+                for row in rows
+            ],
+            dtype=dtype,
+        )
+
+
+def _resolve_backend(backend: str) -> str:
+    if backend == "auto":
+        return "arrow" if pa is not None else "numpy"
+    if backend not in ("arrow", "numpy"):
+        raise ValueError(f"Unsupported backend: {backend}")
+    if backend == "arrow" and pa is None:
+        raise ImportError("Arrow export requires pyarrow: pip install pyarrow")
+    return backend
+
+
+class _Batcher:
+    def __init__(self, tables: Iterable[str], batch_size: int, backend: str):
+        self.batch_size = batch_size
+        backend = _resolve_backend(backend)
+        self.buffers = {table: _TableBuffer(table, backend) for table in tables}
+
+    def add(self, table: str, row: tuple) -> Iterator[Tuple[str, Any]]:
+        buffer = self.buffers[table]
+        buffer.rows.append(row)
+        if len(buffer.rows) >= self.batch_size:
+            yield table, buffer.build()
+
+    def flush(self) -> Iterator[Tuple[str, Any]]:
+        for table, buffer in self.buffers.items():
+            if buffer.rows:
+                yield table, buffer.build()
+
+
+def session_batches(
+    sessions: Iterable[ProjectSessionResponse],
+    batch_size: int = 4096,
+    backend: str = "auto",
+) -> Iterator[Tuple[str, Any]]:
+    """
+    Flatten sessions into ``sessions``, ``participants``, ``tracks`` and
+    ``recordings`` tables and yield ``(table, batch)`` pairs of at most
+    ``batch_size`` rows.
+
+    A batch is a ``pyarrow.RecordBatch`` when the backend is "arrow" (the
+    default when pyarrow is installed) and a NumPy structured array otherwise.
+    """
+    batcher = _Batcher(SESSION_TABLES, batch_size, backend)
+    for session in sessions:
+        for table, row in _session_rows(session):
+            yield from batcher.add(table, row)
+    yield from batcher.flush()
+
+
+async def asession_batches(
+    sessions: AsyncIterable[ProjectSessionResponse],
+    batch_size: int = 4096,
+    backend: str = "auto",
+) -> AsyncIterator[Tuple[str, Any]]:
+    """Like ``session_batches`` for async iterables such as ``iter_sessions()``."""
+    batcher = _Batcher(SESSION_TABLES, batch_size, backend)
+    async for session in sessions:
+        for table, row in _session_rows(session):
+            for batch in batcher.add(table, row):
+                yield batch
+    for batch in batcher.flush():
+        yield batch
+
+
+def device_batches(
+    devices: Iterable[DeviceResponse],
+    batch_size: int = 4096,
+    backend: str = "auto",
+) -> Iterator[Any]:
+    batcher = _Batcher(("devices",), batch_size, backend)
+    for device in devices:
+        for _, batch in batcher.add("devices", _device_row(device)):
+            yield batch
+    for _, batch in batcher.flush():
+        yield batch
+
+
+async def export_sessions_parquet(
+    sessions: Union[Iterable, AsyncIterable],
+    directory: str,
+    batch_size: int = 65536,
+) -> Dict[str, int]:
+    """
+    Stream sessions into ``sessions.parquet``, ``participants.parquet``,
+    ``tracks.parquet`` and ``recordings.parquet`` under ``directory``.
+
+    Returns:
+        Dict[str, int]: Rows written per table.
+    """
+    import pyarrow.parquet as pq
+
+    if not hasattr(sessions, "__aiter__"):
+        sessions = _aiter(sessions)
+    os.makedirs(directory, exist_ok=True)
+    writers = {
+        table: pq.ParquetWriter(
+            os.path.join(directory, f"{table}.parquet"), arrow_schema(table)
+        )
+        for table in SESSION_TABLES
+    }
+    counts = {table: 0 for table in SESSION_TABLES}
+    try:
+        async for table, batch in asession_batches(sessions, batch_size, "arrow"):
+            writers[table].write_batch(batch)
+            counts[table] += batch.num_rows
+    finally:
+        for writer in writers.values():
+            writer.close()
+    return counts
+
+
+def export_devices_parquet(
+    devices: Iterable[DeviceResponse], path: str, batch_size: int = 65536
+) -> int:
+    import pyarrow.parquet as pq
+
+    count = 0
+    with pq.ParquetWriter(path, arrow_schema("devices")) as writer:
+        for batch in device_batches(devices, batch_size, "arrow"):
+            writer.write_batch(batch)
+            count += batch.num_rows
+    return count
+
+
+async def _aiter(items: Iterable) -> AsyncIterator:
+    for item in items:
+        yield item
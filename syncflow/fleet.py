@@ -0,0 +1,216 @@
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+    Tuple,
+)
+
+from syncflow.models import ProjectSummary
+from syncflow.project_client import ProjectClient
+from syncflow.transport import PoolConfig, SharedTransport
+
+
+@dataclass
+class ProjectCredentials:
+    project_id: str
+    api_key: str
+    api_secret: str
+    server_url: Optional[str] = None
+
+
+@dataclass
+class ProjectResult:
+    """The outcome of one fleet query for one project."""
+
+    project_id: str
+    value: Any = None
+    error: Optional[Exception] = None
+    elapsed: float = 0.0
+    timed_out: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class FleetResult:
+    results: Dict[str, ProjectResult] = field(default_factory=dict)
+    elapsed: float = 0.0
+
+    @property
+    def succeeded(self) -> Dict[str, Any]:
+        """Values of the projects that answered, keyed by project ID."""
+        return {pid: r.value for pid, r in self.results.items() if r.ok}
+
+    @property
+    def failed(self) -> Dict[str, ProjectResult]:
+        return {pid: r for pid, r in self.results.items() if not r.ok}
+
+    def items(self) -> Iterator[Tuple[str, Any]]:
+        """Flatten list results into ``(project_id, item)`` pairs."""
+        for project_id, result in self.results.items():
+            if result.ok:
+                for item in result.value:
+                    yield project_id, item
+
+    def latencies(self) -> Dict[str, float]:
+        return {pid: r.elapsed for pid, r in self.results.items()}
+
+
+def sum_summaries(summaries: Iterable[ProjectSummary]) -> ProjectSummary:
+    """Add up the summaries of several projects."""
+    total = ProjectSummary(
+        num_sessions=0, num_active_sessions=0, num_participants=0, num_recordings=0
+    )
+    for summary in summaries:
+        total.num_sessions += summary.num_sessions
+        total.num_active_sessions += summary.num_active_sessions
+        total.num_participants += summary.num_participants
+        total.num_recordings += summary.num_recordings
+    return total
+
+
+class FleetClient:
+    """
+    Queries many SyncFlow projects concurrently.
+
+    One ``ProjectClient`` is created per project and all of them share a
+    single connection pool. ``concurrency`` caps the number of queries in
+    flight across the whole fleet. Each project gets its own ``timeout``, so a
+    slow or failing project is reported in its ``ProjectResult`` without
+    holding up the others.
+
+    Args:
+        credentials (Iterable[ProjectCredentials]): The projects to query.
+        server_url (str, optional): Server for credentials that do not set
+            their own. Defaults to the ``SYNCFLOW_SERVER_URL`` environment variable.
+        concurrency (int, optional): Maximum queries in flight. Defaults to 16.
+        timeout (float, optional): Seconds before a project's query is
+            abandoned. Defaults to no limit.
+        transport (SharedTransport, optional): Pool to use; one is created and
+            owned by the fleet when omitted.
+        pool_config (PoolConfig, optional): Settings for the pool created when
+            ``transport`` is omitted.
+        **client_kwargs: Passed to every ``ProjectClient``.
+    """
+
+    def __init__(
+        self,
+        credentials: Iterable[ProjectCredentials],
+        server_url: Optional[str] = None,
+        concurrency: int = 16,
+        timeout: Optional[float] = None,
+        transport: SharedTransport = None,
+        pool_config: PoolConfig = None,
+        **client_kwargs,
+    ):
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self._owns_transport = transport is None
+        self.transport = transport or SharedTransport(pool_config)
+        self.clients: Dict[str, ProjectClient] = {}
+        for creds in credentials:
+            self.clients[creds.project_id] = ProjectClient(
+                server_url=creds.server_url or server_url,
+                project_id=creds.project_id,
+                api_key=creds.api_key,
+                api_secret=creds.api_secret,
+                transport=self.transport,
+                **client_kwargs,
+            )
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    def _limit(self) -> asyncio.Semaphore:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        return self._semaphore
+
+    async def _query(
+        self,
+        project_id: str,
+        operation: Callable[[ProjectClient], Awaitable],
+        timeout: Optional[float],
+    ) -> ProjectResult:
+        result = ProjectResult(project_id)
+        async with self._limit():
+            started = time.perf_counter()
+            try:
+                result.value = await asyncio.wait_for(
+                    operation(self.clients[project_id]), timeout
+                )
+            except asyncio.TimeoutError as e:
+                result.error, result.timed_out = e, True
+            except Exception as e:
+                result.error = e
+            result.elapsed = time.perf_counter() - started
+        return result
+
+    async def iter_results(
+        self,
+        operation: Callable[[ProjectClient], Awaitable],
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[ProjectResult]:
+        """Yield each project's result as soon as it is available."""
+        timeout = timeout if timeout is not None else self.timeout
+        tasks = [
+            asyncio.ensure_future(self._query(project_id, operation, timeout))
+            for project_id in self.clients
+        ]
+        try:
+            for next_result in asyncio.as_completed(tasks):
+                yield await next_result
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def run(
+        self,
+        operation: Callable[[ProjectClient], Awaitable],
+        timeout: Optional[float] = None,
+    ) -> FleetResult:
+        """
+        Run ``operation`` against every project's client.
+
+        Args:
+            operation (Callable[[ProjectClient], Awaitable]): E.g.
+                ``lambda client: client.list_sessions()``.
+            timeout (float, optional): Overrides the fleet's per-project timeout.
+
+        Returns:
+            FleetResult: One ``ProjectResult`` per project, in credential order.
+        """
+        started = time.perf_counter()
+        results = {r.project_id: r async for r in self.iter_results(operation, timeout)}
+        return FleetResult(
+            results={project_id: results[project_id] for project_id in self.clients},
+            elapsed=time.perf_counter() - started,
+        )
+
+    async def summarize_projects(self, timeout: Optional[float] = None) -> FleetResult:
+        return await self.run(lambda client: client.summarize_project(), timeout)
+
+    async def list_sessions(self, timeout: Optional[float] = None) -> FleetResult:
+        return await self.run(lambda client: client.list_sessions(), timeout)
+
+    async def list_devices(self, timeout: Optional[float] = None) -> FleetResult:
+        return await self.run(lambda client: client.list_devices(), timeout)
+
+    async def aclose(self):
+        await asyncio.gather(*(client.aclose() for client in self.clients.values()))
+        if self._owns_transport:
+            await self.transport.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
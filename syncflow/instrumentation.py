@@ -0,0 +1,297 @@
+import bisect
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+
+PHASES = ("token", "connect", "server", "transfer", "decode", "total")
+
+DEFAULT_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+
+_CONNECT_EVENTS = {
+    "connection.connect_tcp",
+    "connection.connect_unix_socket",
+    "connection.start_tls",
+}
+
+
+@dataclass
+class RequestMetrics:
+    """
+    Timings and counters for one ``ProjectClient`` call.
+
+    Phases are in seconds and summed over retries and hedged attempts:
+    ``token`` is obtaining the API token, ``connect`` is opening TCP/TLS
+    connections, ``server`` runs from sending the request to receiving
+    response headers (minus ``connect``), ``transfer`` is reading the body and
+    ``decode`` is parsing and validating it into models.
+
+    Calls served by another caller's request or from the cache report that
+    response's status code, but no ``bytes_in`` since nothing was received.
+    """
+
+    endpoint: str
+    method: str
+    started: float = field(default_factory=time.perf_counter)
+    status_code: Optional[int] = None
+    token: float = 0.0
+    connect: float = 0.0
+    server: float = 0.0
+    transfer: float = 0.0
+    decode: float = 0.0
+    total: float = 0.0
+    bytes_out: int = 0
+    bytes_in: int = 0
+    retries: int = 0
+    cache_hit: bool = False
+    coalesced: bool = False
+    error: Optional[str] = None
+
+
+def connect_tracer(metrics: RequestMetrics):
+    """An httpx ``trace`` extension that adds connection setup time to ``metrics``."""
+    started = {}
+
+    async def trace(event_name, info):
+        prefix, _, stage = event_name.rpartition(".")
+        if prefix not in _CONNECT_EVENTS:
+            return
+        if stage == "started":
+            started[prefix] = time.perf_counter()
+        elif prefix in started:
+            metrics.connect += time.perf_counter() - started.pop(prefix)
+
+    return trace
+
+
+class Instrumentation:
+    """Receives the metrics of every request; subclasses override ``on_request``."""
+
+    def on_request(self, metrics: RequestMetrics):
+        pass
+
+
+class CompositeInstrumentation(Instrumentation):
+    def __init__(self, instrumentations: Iterable[Instrumentation]):
+        self.instrumentations = list(instrumentations)
+
+    def on_request(self, metrics: RequestMetrics):
+        for instrumentation in self.instrumentations:
+            instrumentation.on_request(metrics)
+
+
+class Histogram:
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Upper bound of the bucket containing the ``q`` quantile."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return (
+                    self.buckets[index] if index < len(self.buckets) else float("inf")
+                )
+        return float("inf")
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self.sum / self.count if self.count else None
+
+
+class InMemoryExporter(Instrumentation):
+    """Aggregates request metrics per endpoint in memory."""
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.latency: Dict[Tuple[str, str], Histogram] = {}
+        self.requests: Dict[Tuple[str, Optional[int]], int] = defaultdict(int)
+        self.bytes_in: Dict[str, int] = defaultdict(int)
+        self.bytes_out: Dict[str, int] = defaultdict(int)
+        self.retries: Dict[str, int] = defaultdict(int)
+        self.cache_hits: Dict[str, int] = defaultdict(int)
+        self.coalesced: Dict[str, int] = defaultdict(int)
+        self.errors: Dict[Tuple[str, str], int] = defaultdict(int)
+
+    def on_request(self, metrics: RequestMetrics):
+        endpoint = metrics.endpoint
+        for phase in PHASES:
+            key = (endpoint, phase)
+            histogram = self.latency.get(key)
+            if histogram is None:
+                histogram = self.latency[key] = Histogram(self.buckets)
+            histogram.observe(getattr(metrics, phase))
+        self.requests[(endpoint, metrics.status_code)] += 1
+        self.bytes_in[endpoint] += metrics.bytes_in
+        self.bytes_out[endpoint] += metrics.bytes_out
+        self.retries[endpoint] += metrics.retries
+        self.cache_hits[endpoint] += metrics.cache_hit
+        self.coalesced[endpoint] += metrics.coalesced
+        if metrics.error is not None:
+            self.errors[(endpoint, metrics.error)] += 1
+
+    def endpoints(self) -> List[str]:
+        return sorted({endpoint for endpoint, _ in self.latency})
+
+    def summary(self) -> Dict[str, dict]:
+        """Per-endpoint request counts, bytes and p50/p99 of every phase."""
+        summary = {}
+        for endpoint in self.endpoints():
+            phases = {}
+            for phase in PHASES:
+                histogram = self.latency[(endpoint, phase)]
+                phases[phase] = {
+                    "mean": histogram.mean,
+                    "p50": histogram.percentile(0.5),
+                    "p99": histogram.percentile(0.99),
+                }
+            summary[endpoint] = {
+                "requests": self.latency[(endpoint, "total")].count,
+                "status_codes": {
+                    status: count
+                    for (name, status), count in self.requests.items()
+                    if name == endpoint
+                },
+                "bytes_in": self.bytes_in[endpoint],
+                "bytes_out": self.bytes_out[endpoint],
+                "retries": self.retries[endpoint],
+                "cache_hits": self.cache_hits[endpoint],
+                "coalesced": self.coalesced[endpoint],
+                "phases": phases,
+            }
+        return summary
+
+
+class PrometheusExporter(Instrumentation):
+    """
+    Export request metrics with ``prometheus_client``. Does nothing when
+    ``prometheus_client`` is not installed.
+    """
+
+    def __init__(self, namespace: str = "syncflow", registry=None):
+        try:
+            import prometheus_client
+        except ImportError:
+            self.enabled = False
+            return
+        self.enabled = True
+        kwargs = {"namespace": namespace}
+        if registry is not None:
+            kwargs["registry"] = registry
+        self._latency = prometheus_client.Histogram(
+            "request_phase_seconds",
+            "Time spent in each phase of a SyncFlow request",
+            ["endpoint", "phase"],
+            buckets=DEFAULT_BUCKETS,
+            **kwargs,
+        )
+        self._requests = prometheus_client.Counter(
+            "requests",
+            "SyncFlow requests by endpoint and status code",
+            ["endpoint", "method", "status"],
+            **kwargs,
+        )
+        self._bytes = prometheus_client.Counter(
+            "request_bytes",
+            "Bytes sent and received per endpoint",
+            ["endpoint", "direction"],
+            **kwargs,
+        )
+        self._events = prometheus_client.Counter(
+            "request_events",
+            "Retries, cache hits and coalesced calls per endpoint",
+            ["endpoint", "event"],
+            **kwargs,
+        )
+
+    def on_request(self, metrics: RequestMetrics):
+        if not self.enabled:
+            return
+        endpoint = metrics.endpoint
+        for phase in PHASES:
+            self._latency.labels(endpoint, phase).observe(getattr(metrics, phase))
+        self._requests.labels(endpoint, metrics.method, str(metrics.status_code)).inc()
+        self._bytes.labels(endpoint, "in").inc(metrics.bytes_in)
+        self._bytes.labels(endpoint, "out").inc(metrics.bytes_out)
+        if metrics.retries:
+            self._events.labels(endpoint, "retry").inc(metrics.retries)
+        if metrics.cache_hit:
+            self._events.labels(endpoint, "cache_hit").inc()
+        if metrics.coalesced:
+            self._events.labels(endpoint, "coalesced").inc()
+
+
+class OpenTelemetryExporter(Instrumentation):
+    """
+    Record request metrics with the OpenTelemetry metrics API. Does nothing
+    when ``opentelemetry-api`` is not installed.
+    """
+
+    def __init__(self, meter_provider=None):
+        try:
+            from opentelemetry import metrics
+        except ImportError:
+            self.enabled = False
+            return
+        self.enabled = True
+        meter = metrics.get_meter("syncflow", meter_provider=meter_provider)
+        self._latency = meter.create_histogram(
+            "syncflow.request.phase.duration",
+            unit="s",
+            description="Time spent in each phase of a SyncFlow request",
+        )
+        self._requests = meter.create_counter(
+            "syncflow.requests", description="SyncFlow requests"
+        )
+        self._bytes = meter.create_counter(
+            "syncflow.request.bytes", unit="By", description="Bytes sent and received"
+        )
+        self._events = meter.create_counter(
+            "syncflow.request.events",
+            description="Retries, cache hits and coalesced calls",
+        )
+
+    def on_request(self, metrics: RequestMetrics):
+        if not self.enabled:
+            return
+        attributes = {"endpoint": metrics.endpoint, "method": metrics.method}
+        for phase in PHASES:
+            self._latency.record(getattr(metrics, phase), dict(attributes, phase=phase))
+        self._requests.add(1, dict(attributes, status=str(metrics.status_code)))
+        self._bytes.add(metrics.bytes_in, dict(attributes, direction="in"))
+        self._bytes.add(metrics.bytes_out, dict(attributes, direction="out"))
+        for event, count in (
+            ("retry", metrics.retries),
+            ("cache_hit", int(metrics.cache_hit)),
+            ("coalesced", int(metrics.coalesced)),
+        ):
+            if count:
+                self._events.add(count, dict(attributes, event=event))
@@ -0,0 +1,222 @@
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Optional
+
+OVERLOAD_STATUS_CODES = frozenset({429, 503})
+
+
+class TokenBucket:
+    """
+    Allows ``rate`` requests per second on average with bursts of up to ``burst``.
+
+    Callers that find the bucket empty reserve a token anyway and sleep until
+    it would have been refilled, so waiters are served in arrival order.
+    """
+
+    def __init__(
+        self, rate: float, burst: Optional[float] = None, clock=time.monotonic
+    ):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1.0, rate)
+        self._clock = clock
+        self._tokens = self.burst
+        self._updated = clock()
+
+    def reserve(self) -> float:
+        """Take a token and return how many seconds to wait before using it."""
+        now = self._clock()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        self._tokens -= 1
+        return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    async def acquire(self):
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class RateLimits:
+    """
+    Per-endpoint token buckets.
+
+    Args:
+        per_endpoint (Dict[str, float], optional): Requests per second keyed by
+            ``ProjectClient`` method name, e.g. ``{"generate_session_token": 20}``.
+        default (float, optional): Rate for endpoints not in ``per_endpoint``.
+            Defaults to no limit.
+        burst (float, optional): Bucket size. Defaults to one second's worth of
+            requests.
+    """
+
+    def __init__(
+        self,
+        per_endpoint: Dict[str, float] = None,
+        default: Optional[float] = None,
+        burst: Optional[float] = None,
+    ):
+        self.per_endpoint = dict(per_endpoint or {})
+        self.default = default
+        self.burst = burst
+        self._buckets: Dict[str, TokenBucket] = {}
+
+    def bucket(self, endpoint: Optional[str]) -> Optional[TokenBucket]:
+        bucket = self._buckets.get(endpoint)
+        if bucket is None:
+            rate = self.per_endpoint.get(endpoint, self.default)
+            if rate is None:
+                return None
+            bucket = self._buckets[endpoint] = TokenBucket(rate, self.burst)
+        return bucket
+
+    async def acquire(self, endpoint: Optional[str]):
+        bucket = self.bucket(endpoint)
+        if bucket is not None:
+            await bucket.acquire()
+
+
+@dataclass
+class LimiterStats:
+    limit: float
+    in_flight: int
+    queued: int
+    increases: int
+    decreases: int
+    overloads: int
+
+
+class AdaptiveLimiter:
+    """
+    A client-wide cap on requests in flight that adapts to the server.
+
+    The limit grows additively, by about one per round trip, while requests
+    succeed and the limit is actually being used. It shrinks multiplicatively
+    by ``backoff_ratio`` when the server answers 429/503, a request times out,
+    or an endpoint's recent latency exceeds ``latency_tolerance`` times its
+    long-run baseline. Decreases happen at most once per round trip so a burst
+    of rejections counts as one congestion signal.
+
+    Latency baselines are kept per endpoint, since listing every session and
+    minting a token have very different normal latencies.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 16,
+        min_limit: int = 1,
+        max_limit: int = 256,
+        backoff_ratio: float = 0.7,
+        latency_tolerance: float = 2.0,
+        overload_status_codes: FrozenSet[int] = OVERLOAD_STATUS_CODES,
+        clock=time.monotonic,
+    ):
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff_ratio = backoff_ratio
+        self.latency_tolerance = latency_tolerance
+        self.overload_status_codes = overload_status_codes
+        self._clock = clock
+        self._limit = float(min(max(initial_limit, min_limit), max_limit))
+        self._in_flight = 0
+        self._waiters = deque()
+        self._baseline: Dict[Optional[str], float] = {}
+        self._recent: Dict[Optional[str], float] = {}
+        self._last_decrease = float("-inf")
+        self._increases = 0
+        self._decreases = 0
+        self._overloads = 0
+
+    @property
+    def limit(self) -> int:
+        return max(self.min_limit, int(self._limit))
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def stats(self) -> LimiterStats:
+        return LimiterStats(
+            limit=self._limit,
+            in_flight=self._in_flight,
+            queued=sum(not waiter.done() for waiter in self._waiters),
+            increases=self._increases,
+            decreases=self._decreases,
+            overloads=self._overloads,
+        )
+
+    async def acquire(self):
+        """Wait for a free slot; pair every call with ``release``."""
+        if self._in_flight < self.limit and not self._waiters:
+            self._in_flight += 1
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just before cancellation.
+                self._in_flight -= 1
+                self._wake()
+            else:
+                self._waiters.remove(waiter)
+            raise
+
+    def release(
+        self,
+        endpoint: Optional[str] = None,
+        latency: Optional[float] = None,
+        overloaded: bool = False,
+    ):
+        """
+        Free a slot and feed the outcome of the request into the limit.
+
+        Args:
+            endpoint (str, optional): The endpoint the request was for.
+            latency (float, optional): Seconds the request took. Leave as None
+                when the outcome says nothing about server load, e.g. the
+                request was cancelled.
+            overloaded (bool, optional): The server rejected the request as
+                overloaded or it timed out.
+        """
+        saturated = self._in_flight >= self.limit or bool(self._waiters)
+        self._in_flight -= 1
+        if overloaded:
+            self._overloads += 1
+            self._decrease(self._recent.get(endpoint, latency or 0.0))
+        elif latency is not None:
+            self._observe(endpoint, latency, saturated)
+        self._wake()
+
+    def _observe(self, endpoint, latency, saturated):
+        baseline = self._baseline.get(endpoint)
+        if baseline is None:
+            self._baseline[endpoint] = self._recent[endpoint] = latency
+            return
+        recent = self._recent[endpoint] = 0.8 * self._recent[endpoint] + 0.2 * latency
+        self._baseline[endpoint] = 0.99 * baseline + 0.01 * latency
+        if recent > baseline * self.latency_tolerance:
+            self._decrease(recent)
+        elif saturated and self._limit < self.max_limit:
+            self._limit = min(self.max_limit, self._limit + 1 / self._limit)
+            self._increases += 1
+
+    def _decrease(self, round_trip: float):
+        now = self._clock()
+        if now - self._last_decrease < round_trip:
+            return
+        self._last_decrease = now
+        self._limit = max(self.min_limit, self._limit * self.backoff_ratio)
+        self._decreases += 1
+
+    def _wake(self):
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if waiter.done():
+                continue
+            self._in_flight += 1
+            waiter.set_result(None)
@@ -0,0 +1,190 @@
+import asyncio
+import csv
+from typing import AsyncIterator, Dict, List, Optional
+
+from pydantic import BaseModel
+
+from syncflow.models import (
+    ParticipantTrackResponse,
+    ProjectSessionResponse,
+    SessionEgressResponse,
+    SessionParticipantResponse,
+)
+
+MANIFEST_FORMATS = ("csv", "ndjson", "parquet")
+
+
+class RecordingManifestEntry(BaseModel):
+    session_id: str
+    session_name: str
+    session_status: str
+    participant_id: Optional[str] = None
+    participant_identity: Optional[str] = None
+    track_id: Optional[str] = None
+    track_sid: Optional[str] = None
+    track_kind: Optional[str] = None
+    track_source: Optional[str] = None
+    egress_id: Optional[str] = None
+    egress_status: Optional[str] = None
+    destination: Optional[str] = None
+    egress_started_at: Optional[int] = None
+    recording_start_time: Optional[int] = None
+    file_name: Optional[str] = None
+    presigned_url_expires: Optional[int] = None
+
+
+def manifest_entries(session: ProjectSessionResponse) -> List[RecordingManifestEntry]:
+    """
+    Flatten a session into one manifest entry per track, merged with the egress
+    that recorded it. Egresses that match no track get an entry of their own.
+    """
+    by_db_track = {e.db_track_id: e for e in session.recordings if e.db_track_id}
+    by_track_sid = {e.track_id: e for e in session.recordings}
+    matched = set()
+    entries = []
+    for participant in session.participants:
+        for track in participant.tracks:
+            egress = by_db_track.get(track.id) or by_track_sid.get(track.sid)
+            if egress is not None:
+                matched.add(egress.id)
+            entries.append(_entry(session, participant, track, egress))
+    for egress in session.recordings:
+        if egress.id not in matched:
+            entries.append(_entry(session, None, None, egress))
+    return entries
+
+
+def _entry(
+    session: ProjectSessionResponse,
+    participant: Optional[SessionParticipantResponse],
+    track: Optional[ParticipantTrackResponse],
+    egress: Optional[SessionEgressResponse],
+) -> RecordingManifestEntry:
+    details = track.multimedia_details if track is not None else None
+    return RecordingManifestEntry(
+        session_id=session.id,
+        session_name=session.name,
+        session_status=session.status,
+        participant_id=(
+            participant.id if participant is not None else egress.participant_id
+        ),
+        participant_identity=participant.identity if participant else None,
+        track_id=track.id if track else (egress.db_track_id if egress else None),
+        track_sid=track.sid if track else (egress.track_id if egress else None),
+        track_kind=track.kind if track else None,
+        track_source=track.source if track else None,
+        egress_id=egress.egress_id if egress else None,
+        egress_status=egress.status if egress else None,
+        destination=(
+            egress.destination
+            if egress and egress.destination
+            else (details.destination if details else None)
+        ),
+        egress_started_at=egress.started_at if egress else None,
+        recording_start_time=details.recording_start_time if details else None,
+        file_name=details.file_name if details else None,
+        presigned_url_expires=details.presigned_url_expires if details else None,
+    )
+
+
+async def iter_manifest(
+    client, concurrency: int = 8
+) -> AsyncIterator[RecordingManifestEntry]:
+    """
+    Fetch every session of the project with at most ``concurrency`` requests in
+    flight and yield manifest entries as each session arrives.
+    """
+    session_ids = [session.id async for session in client.iter_sessions()]
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch(session_id):
+        async with semaphore:
+            return await client.list_session(session_id)
+
+    tasks = [asyncio.ensure_future(fetch(session_id)) for session_id in session_ids]
+    try:
+        for next_session in asyncio.as_completed(tasks):
+            for entry in manifest_entries(await next_session):
+                yield entry
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+async def write_manifest(
+    client,
+    path: str,
+    format: str = "ndjson",
+    concurrency: int = 8,
+    batch_size: int = 1024,
+) -> int:
+    """
+    Build the project's recording manifest and write it to ``path`` incrementally.
+
+    Args:
+        client (ProjectClient): The client to fetch sessions with.
+        path (str): Output file path.
+        format (str, optional): One of "csv", "ndjson" or "parquet". Parquet
+            requires ``pyarrow``. Defaults to "ndjson".
+        concurrency (int, optional): Maximum concurrent session fetches. Defaults to 8.
+        batch_size (int, optional): Rows per Parquet row group. Defaults to 1024.
+
+    Returns:
+        int: The number of entries written.
+    """
+    if format not in MANIFEST_FORMATS:
+        raise ValueError(f"Unsupported manifest format: {format}")
+    entries = iter_manifest(client, concurrency=concurrency)
+    if format == "parquet":
+        return await _write_parquet(entries, path, batch_size)
+
+    fields = list(RecordingManifestEntry.model_fields)
+    count = 0
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=fields) if format == "csv" else None
+        if writer is not None:
+            writer.writeheader()
+        async for entry in entries:
+            if writer is not None:
+                writer.writerow(entry.model_dump())
+            else:
+                f.write(entry.model_dump_json())
+                f.write("\n")
+            count += 1
+    return count
+
+
+async def _write_parquet(entries, path: str, batch_size: int) -> int:
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError(
+            "Writing Parquet manifests requires pyarrow: pip install pyarrow"
+        ) from e
+
+    string, integer = pa.string(), pa.int64()
+    schema = pa.schema(
+        [
+            (name, integer if field.annotation in (int, Optional[int]) else string)
+            for name, field in RecordingManifestEntry.model_fields.items()
+        ]
+    )
+    count = 0
+    batch: Dict[str, list] = {name: [] for name in schema.names}
+    with pq.ParquetWriter(path, schema) as writer:
+
+        def flush():
+            writer.write_table(pa.Table.from_pydict(batch, schema=schema))
+            for values in batch.values():
+                values.clear()
+
+        async for entry in entries:
+            for name, value in entry.model_dump().items():
+                batch[name].append(value)
+            count += 1
+            if count % batch_size == 0:
+                flush()
+        if count % batch_size:
+            flush()
+    return count
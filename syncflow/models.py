@@ -2,7 +2,7 @@ import time
 from enum import Enum
 from typing import List, Optional
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from pydantic.alias_generators import to_camel
 
 
@@ -17,6 +17,7 @@ class ProjectTokenClaims(BaseModel):
         alias_generator=to_camel,
         populate_by_name=True,
         from_attributes=True,
+        defer_build=True,
     )
 
     def is_expired(self):
@@ -75,6 +76,7 @@ class CreateSessionRequest(BaseModel):
         alias_generator=to_camel,
         populate_by_name=True,
         from_attributes=True,
+        defer_build=True,
     )
 
 
@@ -126,6 +128,7 @@ class VideoGrantsWrapper(BaseModel):
         alias_generator=to_camel,
         populate_by_name=True,
         from_attributes=True,
+        defer_build=True,
     )
 
 
@@ -149,6 +152,7 @@ class TokenRequest(BaseModel):
         alias_generator=to_camel,
         populate_by_name=True,
         from_attributes=True,
+        defer_build=True,
     )
 
 
@@ -165,6 +169,7 @@ class MultimediaDetailsResponse(BaseModel):
         alias_generator=to_camel,
         populate_by_name=True,
         from_attributes=True,
+        defer_build=True,
     )
 
 
@@ -181,6 +186,7 @@ class ParticipantTrackResponse(BaseModel):
         alias_generator=to_camel,
         populate_by_name=True,
         from_attributes=True,
+        defer_build=True,
     )
 
 
@@ -200,9 +206,15 @@ class SessionParticipantResponse(BaseModel):
         alias_generator=to_camel,
         populate_by_name=True,
         from_attributes=True,
+        defer_build=True,
     )
 
 
+EGRESS_FINISHED_STATUSES = frozenset(
+    {"COMPLETE", "COMPLETED", "FAILED", "ABORTED", "LIMIT_REACHED", "ENDED", "STOPPED"}
+)
+
+
 class SessionEgressResponse(BaseModel):
     id: str
     track_id: str
@@ -220,8 +232,15 @@ class SessionEgressResponse(BaseModel):
         alias_generator=to_camel,
         populate_by_name=True,
         from_attributes=True,
+        defer_build=True,
     )
 
+    def is_finished(self):
+        status = self.status.upper()
+        if status.startswith("EGRESS_"):
+            status = status[len("EGRESS_") :]
+        return status in EGRESS_FINISHED_STATUSES
+
 
 class ProjectSessionResponse(BaseModel):
     id: str
@@ -242,13 +261,20 @@ class ProjectSessionResponse(BaseModel):
         default_factory=list, description="List of recordings in the session"
     )
     duration: int
+    device_groups: Optional[List[str]] = Field(
+        None, description="List of device groups associated with the session"
+    )
 
     model_config = ConfigDict(
         alias_generator=to_camel,
         populate_by_name=True,
         from_attributes=True,
+        defer_build=True,
     )
 
+    def is_stopped(self):
+        return self.status.lower() == "stopped"
+
 
 class ProjectInfo(BaseModel):
     id: str
@@ -264,6 +290,7 @@ class ProjectInfo(BaseModel):
         alias_generator=to_camel,
         populate_by_name=True,
         from_attributes=True,
+        defer_build=True,
     )
 
 
@@ -276,6 +303,7 @@ class TokenResponse(BaseModel):
         alias_generator=to_camel,
         populate_by_name=True,
         from_attributes=True,
+        defer_build=True,
     )
 
 
@@ -294,6 +322,7 @@ class DeviceResponse(BaseModel):
         alias_generator=to_camel,
         populate_by_name=True,
         from_attributes=True,
+        defer_build=True,
     )
 
 
@@ -307,6 +336,7 @@ class ProjectSummary(BaseModel):
         alias_generator=to_camel,
         populate_by_name=True,
         from_attributes=True,
+        defer_build=True,
     )
 
 
@@ -331,4 +361,41 @@ class ParticipantInfo(BaseModel):
         alias_generator=to_camel,
         populate_by_name=True,
         from_attributes=True,
+        defer_build=True,
     )
+
+
+class SessionNotificationType(str, Enum):
+    STARTED = "Started"
+    STOPPED = "Stopped"
+
+
+class SessionNotification(BaseModel):
+    """A session event published to a device's notification exchange."""
+
+    type: SessionNotificationType
+    session_id: str
+    session_name: Optional[str] = None
+    project_id: Optional[str] = None
+    livekit_room_name: Optional[str] = None
+    device_groups: Optional[List[str]] = None
+    timestamp: Optional[int] = None
+
+    model_config = ConfigDict(
+        alias_generator=to_camel,
+        populate_by_name=True,
+        from_attributes=True,
+        extra="allow",
+        defer_build=True,
+    )
+
+    @field_validator("type", mode="before")
+    @classmethod
+    def _normalize_type(cls, value):
+        # Accept "SessionStarted", "session_stopped", "STARTED" and the like.
+        if isinstance(value, str):
+            name = value.lower().replace("_", "")
+            if name.startswith("session"):
+                name = name[len("session") :]
+            return name.capitalize()
+        return value
@@ -1,22 +1,44 @@
+import asyncio
 import os
 import time
-from typing import List
+from typing import TYPE_CHECKING, AsyncIterator, Iterable, List, Optional, Union
 
 import httpx
-import jwt
 
+from syncflow import codec
 from syncflow.models import (
     CreateSessionRequest,
     DeviceResponse,
     ParticipantInfo,
+    ParticipantState,
     ProjectInfo,
     ProjectSessionResponse,
     ProjectSummary,
     ProjectTokenClaims,
     RegisterDeviceRequest,
+    SessionNotificationType,
     TokenRequest,
     TokenResponse,
 )
+from syncflow.retry import HedgePolicy, RetryPolicy, hedged
+from syncflow.singleflight import SingleFlight
+from syncflow.token_manager import TokenManager
+from syncflow.transport import PoolConfig, PoolStats, SharedTransport
+
+# Optional features are imported where they are used, so creating a client
+# does not pay for sqlite3, the streaming parser and the like.
+if TYPE_CHECKING:
+    from syncflow.batch import Batch
+    from syncflow.cache import ResponseCache
+    from syncflow.compact import CompactSession
+    from syncflow.instrumentation import Instrumentation, RequestMetrics
+    from syncflow.limits import AdaptiveLimiter, LimiterStats, RateLimits
+    from syncflow.notifications import NotificationBackend, SessionSubscriber
+    from syncflow.session_store import SessionStore
+    from syncflow.session_tokens import SessionTokenCache, TokenResult
+    from syncflow.watch import WatchScheduler
+
+SUPPORTED_METHODS = ("GET", "POST", "PUT", "DELETE")
 
 
 class HttpError(Exception):
@@ -33,23 +55,56 @@ class ProjectClient:
         project_id: str = None,
         api_key: str = None,
         api_secret: str = None,
+        token_ttl: int = 60 * 60,
+        token_refresh_skew: float = 60,
+        pool_config: PoolConfig = None,
+        transport: SharedTransport = None,
+        retry_policy: RetryPolicy = None,
+        hedge_policy: HedgePolicy = None,
+        coalesce_gets: bool = True,
+        cache: "ResponseCache" = None,
+        session_store: "SessionStore" = None,
+        token_cache: "SessionTokenCache" = None,
+        instrumentation: "Instrumentation" = None,
+        concurrency_limiter: "AdaptiveLimiter" = None,
+        rate_limits: "RateLimits" = None,
     ):
         self.server_url = server_url or os.getenv("SYNCFLOW_SERVER_URL")
         self.project_id = project_id or os.getenv("SYNCFLOW_PROJECT_ID")
         self.api_key = api_key or os.getenv("SYNCFLOW_API_KEY")
         self.api_secret = api_secret or os.getenv("SYNCFLOW_API_SECRET")
-        self.httpx_client = httpx.AsyncClient(base_url=self.server_url)
-        self._api_token = None
+        self._owns_transport = transport is None
+        self.transport = transport or SharedTransport(pool_config)
+        self.httpx_client = httpx.AsyncClient(
+            base_url=self.server_url,
+            transport=self.transport.attach(),
+            timeout=(pool_config or self.transport.config).timeout(),
+        )
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.hedge_policy = hedge_policy
+        self.singleflight = SingleFlight() if coalesce_gets else None
+        self.cache = cache
+        self.session_store = session_store
+        self.token_cache = token_cache
+        self.instrumentation = instrumentation
+        self.concurrency_limiter = concurrency_limiter
+        self.rate_limits = rate_limits
+        self._watcher: Optional["WatchScheduler"] = None
+        self.token_manager = TokenManager(
+            project_id=self.project_id,
+            api_key=self.api_key,
+            api_secret=self.api_secret,
+            ttl=token_ttl,
+            refresh_skew=token_refresh_skew,
+        )
 
     @property
     def api_token(self):
-        if not self._api_token:
-            self._api_token = self.get_api_token()
-        if self.is_expired(self._api_token):
-            self._api_token = self.get_api_token()
-        return self._api_token
+        return self.token_manager.token
 
     def is_expired(self, token):
+        import jwt
+
         try:
             decoded_jwt = jwt.decode(token, self.api_secret, algorithms=["HS256"])
             api_token = ProjectTokenClaims.model_validate(decoded_jwt)
@@ -67,137 +122,662 @@ class ProjectClient:
             data (dict, optional): The request payload. Defaults to None.
 
         Returns:
-            Any: The API response JSON parsed into a Pydantic model.
+            Any: The API response JSON.
         """
-        jwt_token = self.api_token
-        headers = {
-            "Authorization": f"Bearer {jwt_token}",
-            "Content-Type": "application/json",
-        }
+        response = await self._send(url, method=method, data=data)
+        return codec.loads(response.content)
+
+    async def _fetch(self, url, response_type, method="GET", data=None, endpoint=None):
+        _, value = await self._fetch_raw(url, response_type, method, data, endpoint)
+        return value
 
+    async def _fetch_raw(
+        self, url, response_type, method="GET", data=None, endpoint=None
+    ):
+        """Return the response body and its decoded value."""
+        metrics = self._start_metrics(endpoint, method, url)
         try:
-            if method == "GET":
-                response = await self.httpx_client.get(url, headers=headers)
-            elif method == "POST":
-                response = await self.httpx_client.post(url, headers=headers, json=data)
-            elif method == "PUT":
-                response = await self.httpx_client.put(url, headers=headers, json=data)
-            elif method == "DELETE":
-                response = await self.httpx_client.delete(url, headers=headers)
+            if method == "GET" and self.singleflight is not None:
+                if metrics is not None:
+                    metrics.coalesced = self.singleflight.in_flight(url)
+                # Awaiters share the response and each decode their own value,
+                # so none of them sees another's mutations.
+                response = await self.singleflight.do(
+                    url,
+                    lambda: self._fetch_uncoalesced(
+                        url, method, data, metrics, endpoint
+                    ),
+                )
             else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
+                response = await self._fetch_uncoalesced(
+                    url, method, data, metrics, endpoint
+                )
+            content = response.content
+            if metrics is not None:
+                metrics.status_code = response.status_code
+            return content, self._decode(content, response_type, metrics)
+        except Exception as e:
+            if metrics is not None:
+                metrics.error = type(e).__name__
+                if isinstance(e, HttpError):
+                    metrics.status_code = e.status_code
+            raise
+        finally:
+            self._finish_metrics(metrics)
+
+    async def _fetch_cached(
+        self, endpoint, url, response_type, should_cache=None, refresh=False
+    ):
+        """
+        Serve ``url`` from the cache, or fetch and cache it. With ``refresh``
+        the cached entry is skipped and replaced, without invalidating other
+        fills in flight.
+        """
+        cache = self.cache
+        if cache is None or not cache.is_cacheable(endpoint):
+            return await self._fetch(url, response_type, endpoint=endpoint)
+        hit, content = (False, None) if refresh else cache.get(url)
+        if hit:
+            metrics = self._start_metrics(endpoint, "GET", url)
+            if metrics is None:
+                return codec.decode(content, response_type)
+            metrics.cache_hit = True
+            # Only successful GET bodies are cached.
+            metrics.status_code = 200
+            value = self._decode(content, response_type, metrics)
+            self._finish_metrics(metrics)
+            return value
+        generation = cache.generation
+        content, value = await self._fetch_raw(url, response_type, endpoint=endpoint)
+        if should_cache is None or should_cache(value):
+            cache.set(url, content, endpoint, generation=generation)
+        return value
+
+    def _invalidate(self, *urls):
+        if self.cache is not None:
+            self.cache.invalidate(*urls)
+
+    async def _fetch_uncoalesced(
+        self, url, method, data, metrics, endpoint
+    ) -> httpx.Response:
+        return await self._send(
+            url, method=method, data=data, metrics=metrics, endpoint=endpoint
+        )
 
-            response.raise_for_status()
-            return response.json()
+    @staticmethod
+    def _decode(content: bytes, response_type, metrics: Optional["RequestMetrics"]):
+        if metrics is None:
+            return codec.decode(content, response_type)
+        started = time.perf_counter()
+        value = codec.decode(content, response_type)
+        metrics.decode += time.perf_counter() - started
+        return value
+
+    def _start_metrics(self, endpoint, method, url) -> Optional["RequestMetrics"]:
+        if self.instrumentation is None:
+            return None
+        from syncflow.instrumentation import RequestMetrics
+
+        return RequestMetrics(endpoint=endpoint or f"{method} {url}", method=method)
+
+    def _finish_metrics(self, metrics: Optional["RequestMetrics"]):
+        if metrics is not None:
+            metrics.total = time.perf_counter() - metrics.started
+            self.instrumentation.on_request(metrics)
+
+    async def _send(
+        self, url, method="GET", data=None, stream=False, metrics=None, endpoint=None
+    ) -> httpx.Response:
+        if method not in SUPPORTED_METHODS:
+            raise ValueError(f"Unsupported HTTP method: {method}")
+
+        content = codec.encode(data) if data is not None else None
+        if metrics is not None and content is not None:
+            metrics.bytes_out += len(content)
+        policy = self.retry_policy
+        policy.record_attempt()
+        attempt = 1
+        while True:
+            if metrics is not None:
+                metrics.retries = attempt - 1
+            try:
+                if self.hedge_policy is not None and method == "GET" and not stream:
+                    admitted = asyncio.Event()
+                    response = await hedged(
+                        lambda: self._send_once(
+                            url, method, content, False, metrics, endpoint, admitted
+                        ),
+                        self.hedge_policy,
+                        admitted,
+                        endpoint,
+                    )
+                else:
+                    response = await self._send_once(
+                        url, method, content, stream, metrics, endpoint
+                    )
+            except httpx.TransportError:
+                if not self._can_retry(method, attempt):
+                    raise
+                await asyncio.sleep(policy.delay(attempt))
+            else:
+                if metrics is not None:
+                    metrics.status_code = response.status_code
+                if response.is_success:
+                    return response
+                if stream:
+                    await response.aread()
+                    await response.aclose()
+                if response.status_code not in policy.status_codes or not (
+                    self._can_retry(method, attempt)
+                ):
+                    raise HttpError(response.status_code, response.text)
+                await asyncio.sleep(policy.delay(attempt, response))
+            attempt += 1
+
+    async def _send_once(
+        self,
+        url,
+        method,
+        content,
+        stream=False,
+        metrics=None,
+        endpoint=None,
+        admitted: asyncio.Event = None,
+    ) -> httpx.Response:
+        if self.rate_limits is not None:
+            await self.rate_limits.acquire(endpoint)
+        limiter = self.concurrency_limiter
+        if limiter is None:
+            if admitted is not None:
+                admitted.set()
+            return await self._dispatch(url, method, content, stream, metrics)
+
+        await limiter.acquire()
+        if admitted is not None:
+            admitted.set()
+        started = time.perf_counter()
+        latency, overloaded = None, False
+        try:
+            response = await self._dispatch(url, method, content, stream, metrics)
+            latency = time.perf_counter() - started
+            overloaded = response.status_code in limiter.overload_status_codes
+            return response
+        except httpx.TimeoutException:
+            latency, overloaded = time.perf_counter() - started, True
+            raise
+        finally:
+            limiter.release(endpoint, latency, overloaded)
+
+    async def _dispatch(
+        self, url, method, content, stream=False, metrics=None
+    ) -> httpx.Response:
+        if metrics is None:
+            jwt_token = await self.token_manager.get_token()
+        else:
+            started = time.perf_counter()
+            jwt_token = await self.token_manager.get_token()
+            metrics.token += time.perf_counter() - started
 
-        except httpx.HTTPStatusError as e:
-            raise HttpError(e.response.status_code, e.response.text)
+        headers = {
+            "Authorization": f"Bearer {jwt_token}",
+            "Content-Type": "application/json",
+        }
+        request = self.httpx_client.build_request(
+            method, url, headers=headers, content=content
+        )
+        if metrics is None:
+            return await self.httpx_client.send(request, stream=stream)
+
+        from syncflow.instrumentation import connect_tracer
+
+        request.extensions["trace"] = connect_tracer(metrics)
+        connect_before = metrics.connect
+        started = time.perf_counter()
+        response = await self.httpx_client.send(request, stream=True)
+        headers_received = time.perf_counter()
+        metrics.server += (
+            headers_received - started - (metrics.connect - connect_before)
+        )
+        if not stream:
+            try:
+                await response.aread()
+            finally:
+                await response.aclose()
+            metrics.transfer += time.perf_counter() - headers_received
+            metrics.bytes_in += len(response.content)
+        return response
+
+    async def _iter(self, url, item_type, endpoint=None) -> AsyncIterator:
+        """Stream a JSON array response, validating one element at a time."""
+        from syncflow.streaming import iter_json_array
+
+        metrics = self._start_metrics(endpoint, "GET", url)
+        try:
+            response = await self._send(
+                url, stream=True, metrics=metrics, endpoint=endpoint
+            )
+            try:
+                async for item in iter_json_array(response.aiter_bytes()):
+                    if metrics is None:
+                        yield codec.decode(item, item_type)
+                        continue
+                    metrics.bytes_in += len(item)
+                    started = time.perf_counter()
+                    value = codec.decode(item, item_type)
+                    metrics.decode += time.perf_counter() - started
+                    yield value
+            finally:
+                await response.aclose()
+        except Exception as e:
+            if metrics is not None:
+                metrics.error = type(e).__name__
+            raise
+        finally:
+            self._finish_metrics(metrics)
+
+    def _can_retry(self, method, attempt) -> bool:
+        policy = self.retry_policy
+        return (
+            attempt < policy.max_attempts
+            and policy.is_retryable_method(method)
+            and policy.acquire_retry()
+        )
 
     async def get_project_details(self) -> ProjectInfo:
-        response_data = await self.authorized_fetch(f"/projects/{self.project_id}")
-        return ProjectInfo(**response_data)
+        return await self._fetch_cached(
+            "get_project_details", f"/projects/{self.project_id}", ProjectInfo
+        )
 
     async def delete_project(self) -> ProjectInfo:
-        response_data = await self.authorized_fetch(
-            f"/projects/{self.project_id}", method="DELETE"
-        )
-        return ProjectInfo(**response_data)
+        try:
+            return await self._fetch(
+                f"/projects/{self.project_id}",
+                ProjectInfo,
+                method="DELETE",
+                endpoint="delete_project",
+            )
+        finally:
+            if self.cache is not None:
+                self.cache.clear()
 
     async def summarize_project(self) -> ProjectSummary:
-        response_data = await self.authorized_fetch(
-            f"/projects/{self.project_id}/summarize"
+        return await self._fetch(
+            f"/projects/{self.project_id}/summarize",
+            ProjectSummary,
+            endpoint="summarize_project",
         )
-        return ProjectSummary(**response_data)
 
     async def create_session(
         self, new_session_request: CreateSessionRequest
     ) -> ProjectSessionResponse:
-        response_data = await self.authorized_fetch(
-            f"/projects/{self.project_id}/create-session",
-            method="POST",
-            data=new_session_request.model_dump(by_alias=True),
-        )
-        return ProjectSessionResponse(**response_data)
+        try:
+            return await self._fetch(
+                f"/projects/{self.project_id}/create-session",
+                ProjectSessionResponse,
+                method="POST",
+                data=new_session_request,
+                endpoint="create_session",
+            )
+        finally:
+            self._invalidate(f"/projects/{self.project_id}/sessions")
 
     async def list_sessions(self) -> List[ProjectSessionResponse]:
-        response_data = await self.authorized_fetch(
-            f"/projects/{self.project_id}/sessions"
+        sessions = await self._fetch(
+            f"/projects/{self.project_id}/sessions",
+            List[ProjectSessionResponse],
+            endpoint="list_sessions",
         )
-        return [ProjectSessionResponse(**session) for session in response_data]
+        await self._persist_sessions(sessions)
+        return sessions
+
+    async def list_sessions_compact(self) -> List["CompactSession"]:
+        """List sessions as lightweight, immutable ``CompactSession`` records."""
+        from syncflow.compact import decode_sessions
 
-    async def list_session(self, session_id: str) -> ProjectSessionResponse:
-        response_data = await self.authorized_fetch(
-            f"/projects/{self.project_id}/sessions/{session_id}"
+        url = f"/projects/{self.project_id}/sessions"
+        metrics = self._start_metrics("list_sessions_compact", "GET", url)
+        try:
+            response = await self._send(
+                url, metrics=metrics, endpoint="list_sessions_compact"
+            )
+            if metrics is None:
+                return decode_sessions(response.content)
+            started = time.perf_counter()
+            sessions = decode_sessions(response.content)
+            metrics.decode += time.perf_counter() - started
+            return sessions
+        except Exception as e:
+            if metrics is not None:
+                metrics.error = type(e).__name__
+            raise
+        finally:
+            self._finish_metrics(metrics)
+
+    async def iter_sessions(self) -> AsyncIterator[ProjectSessionResponse]:
+        async for session in self._iter(
+            f"/projects/{self.project_id}/sessions",
+            ProjectSessionResponse,
+            endpoint="iter_sessions",
+        ):
+            yield session
+
+    async def list_session(
+        self, session_id: str, fresh: bool = False
+    ) -> ProjectSessionResponse:
+        """
+        Get a session by ID.
+
+        Args:
+            session_id (str): The session ID.
+            fresh (bool, optional): Bypass the response cache and session store,
+                e.g. to obtain new presigned URLs. The response still updates
+                the cache. Defaults to False.
+        """
+        url = f"/projects/{self.project_id}/sessions/{session_id}"
+        if not fresh and self.session_store is not None:
+            stored = await self._in_thread(self.session_store.get, session_id)
+            if stored is not None:
+                return stored
+        # Only stopped sessions are cached; active ones keep changing.
+        session = await self._fetch_cached(
+            "list_session",
+            url,
+            ProjectSessionResponse,
+            should_cache=lambda session: session.is_stopped(),
+            refresh=fresh,
         )
-        return ProjectSessionResponse(**response_data)
+        await self._persist_sessions([session])
+        return session
+
+    async def _persist_sessions(self, sessions: List[ProjectSessionResponse]):
+        if self.session_store is None:
+            return
+        stopped = [session for session in sessions if session.is_stopped()]
+        if stopped:
+            await self._in_thread(self.session_store.put_many, stopped)
+
+    @staticmethod
+    async def _in_thread(fn, *args):
+        """Run blocking ``SessionStore`` I/O without stalling the event loop."""
+        return await asyncio.get_running_loop().run_in_executor(None, fn, *args)
 
     async def list_participants(self, session_id: str) -> List[ParticipantInfo]:
-        response_data = await self.authorized_fetch(
-            f"/projects/{self.project_id}/sessions/{session_id}/participants"
+        return await self._fetch(
+            f"/projects/{self.project_id}/sessions/{session_id}/participants",
+            List[ParticipantInfo],
+            endpoint="list_participants",
         )
-        return [ParticipantInfo(**participant) for participant in response_data]
+
+    async def iter_participants(
+        self, session_id: str
+    ) -> AsyncIterator[ParticipantInfo]:
+        async for participant in self._iter(
+            f"/projects/{self.project_id}/sessions/{session_id}/participants",
+            ParticipantInfo,
+            endpoint="iter_participants",
+        ):
+            yield participant
 
     async def generate_session_token(
         self, session_id: str, token_request: TokenRequest
     ) -> TokenResponse:
-        response_data = await self.authorized_fetch(
-            f"/projects/{self.project_id}/sessions/{session_id}/token",
-            method="POST",
-            data=token_request.model_dump(mode="json", by_alias=True),
-        )
-        return TokenResponse(**response_data)
+        if self.token_cache is None:
+            return await self._fetch(
+                f"/projects/{self.project_id}/sessions/{session_id}/token",
+                TokenResponse,
+                method="POST",
+                data=token_request,
+                endpoint="generate_session_token",
+            )
+        key = self.token_cache.key(session_id, token_request)
+        token = self.token_cache.get(key)
+        if token is None:
+            token = await self._fetch(
+                f"/projects/{self.project_id}/sessions/{session_id}/token",
+                TokenResponse,
+                method="POST",
+                data=token_request,
+                endpoint="generate_session_token",
+            )
+            self.token_cache.set(key, token)
+        return token
+
+    async def generate_session_tokens(
+        self,
+        session_id: str,
+        token_requests: List[TokenRequest],
+        concurrency: int = 8,
+    ) -> List["TokenResult"]:
+        """
+        Mint tokens for many identities in a session concurrently.
+
+        Args:
+            session_id (str): The session to mint tokens for.
+            token_requests (List[TokenRequest]): One request per identity.
+            concurrency (int, optional): Maximum requests in flight. Defaults to 8.
+
+        Returns:
+            List[TokenResult]: One result per request, in input order. Failed
+                requests carry the exception in ``error`` instead of failing the batch.
+        """
+        from syncflow.session_tokens import TokenResult
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def mint(token_request):
+            async with semaphore:
+                try:
+                    token = await self.generate_session_token(session_id, token_request)
+                except Exception as e:
+                    return TokenResult(request=token_request, error=e)
+                return TokenResult(request=token_request, token=token)
+
+        return list(await asyncio.gather(*(mint(r) for r in token_requests)))
 
     async def get_livekit_session_info(self, session_id: str) -> dict:
-        response_data = await self.authorized_fetch(
-            f"/projects/{self.project_id}/sessions/{session_id}/livekit-session-info"
+        return await self._fetch(
+            f"/projects/{self.project_id}/sessions/{session_id}/livekit-session-info",
+            dict,
+            endpoint="get_livekit_session_info",
         )
-        return response_data
 
     async def stop_session(self, session_id: str) -> ProjectSessionResponse:
-        response_data = await self.authorized_fetch(
-            f"/projects/{self.project_id}/sessions/{session_id}/stop",
-            method="POST",
-            data={},
-        )
-        return ProjectSessionResponse(**response_data)
+        try:
+            session = await self._fetch(
+                f"/projects/{self.project_id}/sessions/{session_id}/stop",
+                ProjectSessionResponse,
+                method="POST",
+                data={},
+                endpoint="stop_session",
+            )
+            await self._persist_sessions([session])
+            return session
+        finally:
+            self._invalidate(
+                f"/projects/{self.project_id}/sessions",
+                f"/projects/{self.project_id}/sessions/{session_id}",
+            )
+            if self.token_cache is not None:
+                self.token_cache.invalidate_session(session_id)
 
     async def register_device(self, device: RegisterDeviceRequest) -> DeviceResponse:
-        response_data = await self.authorized_fetch(
-            f"/projects/{self.project_id}/devices/register",
-            method="POST",
-            data=device.dict(),
-        )
-        return DeviceResponse(**response_data)
+        try:
+            return await self._fetch(
+                f"/projects/{self.project_id}/devices/register",
+                DeviceResponse,
+                method="POST",
+                data=device,
+                endpoint="register_device",
+            )
+        finally:
+            self._invalidate(f"/projects/{self.project_id}/devices")
 
     async def list_devices(self) -> List[DeviceResponse]:
-        response_data = await self.authorized_fetch(
-            f"/projects/{self.project_id}/devices"
+        return await self._fetch_cached(
+            "list_devices",
+            f"/projects/{self.project_id}/devices",
+            List[DeviceResponse],
         )
-        return [DeviceResponse(**device) for device in response_data]
+
+    async def iter_devices(self) -> AsyncIterator[DeviceResponse]:
+        async for device in self._iter(
+            f"/projects/{self.project_id}/devices",
+            DeviceResponse,
+            endpoint="iter_devices",
+        ):
+            yield device
 
     async def list_device(self, device_id: str) -> DeviceResponse:
-        response_data = await self.authorized_fetch(
-            f"/projects/{self.project_id}/devices/{device_id}"
+        return await self._fetch_cached(
+            "list_device",
+            f"/projects/{self.project_id}/devices/{device_id}",
+            DeviceResponse,
         )
-        return DeviceResponse(**response_data)
 
     async def delete_device(self, device_id: str) -> DeviceResponse:
-        response_data = await self.authorized_fetch(
-            f"/projects/{self.project_id}/devices/{device_id}", method="DELETE"
+        try:
+            return await self._fetch(
+                f"/projects/{self.project_id}/devices/{device_id}",
+                DeviceResponse,
+                method="DELETE",
+                endpoint="delete_device",
+            )
+        finally:
+            self._invalidate(
+                f"/projects/{self.project_id}/devices",
+                f"/projects/{self.project_id}/devices/{device_id}",
+            )
+
+    async def subscribe_session_notifications(
+        self,
+        device: Union[str, DeviceResponse],
+        backend: "NotificationBackend",
+        types: Optional[Iterable[SessionNotificationType]] = None,
+    ) -> "SessionSubscriber":
+        """
+        Subscribe to session start/stop events for a registered device.
+
+        Args:
+            device (Union[str, DeviceResponse]): The device or its ID.
+            backend (NotificationBackend): Where to consume the device's
+                notification exchange from, e.g. ``AmqpBackend``.
+            types (Iterable[SessionNotificationType], optional): Only deliver
+                these event types. Defaults to all.
+
+        Returns:
+            SessionSubscriber: An async iterator of ``SessionNotification``.
+        """
+        from syncflow.notifications import SessionSubscriber
+
+        if isinstance(device, str):
+            device = await self.list_device(device)
+        return SessionSubscriber(backend, device, types)
+
+    @property
+    def watcher(self) -> "WatchScheduler":
+        """The scheduler shared by every ``wait_for_*`` call on this client."""
+        if self._watcher is None:
+            from syncflow.watch import WatchScheduler
+
+            self._watcher = WatchScheduler(self)
+        return self._watcher
+
+    async def wait_for_session_stopped(
+        self, session_id: str, timeout: Optional[float] = None
+    ) -> ProjectSessionResponse:
+        """
+        Wait until a session has stopped.
+
+        Args:
+            session_id (str): The session ID.
+            timeout (float, optional): Seconds to wait before raising
+                ``asyncio.TimeoutError``. Defaults to no limit.
+        """
+        return await self.watcher.wait_for_session(
+            session_id, lambda session: session.is_stopped(), timeout
+        )
+
+    async def wait_for_recordings_complete(
+        self,
+        session_id: str,
+        timeout: Optional[float] = None,
+        min_recordings: int = 1,
+    ) -> ProjectSessionResponse:
+        """
+        Wait until every egress of a session has finished, successfully or not.
+
+        Args:
+            session_id (str): The session ID.
+            timeout (float, optional): Seconds to wait before raising
+                ``asyncio.TimeoutError``. Defaults to no limit.
+            min_recordings (int, optional): Keep waiting until the session has
+                at least this many egresses, so a session whose recordings
+                have not started yet does not count as complete. Pass 0 to
+                accept a session without recordings. Defaults to 1.
+        """
+        return await self.watcher.wait_for_session(
+            session_id,
+            lambda session: len(session.recordings) >= min_recordings
+            and all(egress.is_finished() for egress in session.recordings),
+            timeout,
         )
-        return DeviceResponse(**response_data)
+
+    async def wait_for_participant(
+        self,
+        session_id: str,
+        identity: str,
+        state: ParticipantState = ParticipantState.CONNECTED,
+        timeout: Optional[float] = None,
+    ) -> Optional[ParticipantInfo]:
+        """
+        Wait until a participant reaches ``state``. Waiting for
+        ``DISCONNECTED`` also completes once the participant is no longer
+        listed, in which case None is returned.
+        """
+
+        def find(participants):
+            for participant in participants:
+                if participant.identity == identity:
+                    return participant
+            return None
+
+        def matches(participants):
+            participant = find(participants)
+            if participant is None:
+                return state == ParticipantState.DISCONNECTED
+            return participant.state == state
+
+        participants = await self.watcher.wait_for_participants(
+            session_id, matches, timeout
+        )
+        return find(participants)
 
     async def aclose(self):
+        if self._watcher is not None:
+            await self._watcher.aclose()
+        await self.token_manager.aclose()
         await self.httpx_client.aclose()
+        if self._owns_transport:
+            await self.transport.aclose()
 
-    def get_api_token(self):
-        claims = ProjectTokenClaims(
-            iat=int(time.time()),
-            exp=int(time.time()) + 60 * 60,
-            iss=self.api_key,
-            project_id=self.project_id,
-        )
+    def batch(self, concurrency: int = 8) -> "Batch":
+        """
+        Queue calls to run concurrently as one batch; see ``syncflow.batch.Batch``.
 
-        dict_model = claims.model_dump(by_alias=True)
+        Args:
+            concurrency (int, optional): Maximum calls in flight. Defaults to 8.
+        """
+        from syncflow.batch import Batch
+
+        return Batch(self, concurrency)
 
-        return jwt.encode(dict_model, self.api_secret, algorithm="HS256")
+    def pool_stats(self) -> PoolStats:
+        return self.transport.stats()
+
+    def limiter_stats(self) -> Optional["LimiterStats"]:
+        if self.concurrency_limiter is None:
+            return None
+        return self.concurrency_limiter.stats()
+
+    def get_api_token(self):
+        return self.token_manager.mint()
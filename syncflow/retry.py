@@ -0,0 +1,206 @@
+import asyncio
+import random
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import Awaitable, Callable, Dict, FrozenSet, Optional
+
+import httpx
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+RETRYABLE_STATUS_CODES = frozenset({429, 502, 503, 504})
+
+
+class RetryBudget:
+    """
+    Caps retries to a fraction of the overall request volume.
+
+    Every first attempt deposits ``ratio`` tokens and every retry withdraws one,
+    so a failing server sees at most ``ratio`` extra load on top of a small
+    ``min_retries`` reserve.
+    """
+
+    def __init__(self, ratio: float = 0.2, min_retries: int = 10):
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self._max_tokens = max(min_retries, 1) * 2
+        self._tokens = float(min_retries)
+
+    def deposit(self):
+        self._tokens = min(self._max_tokens, self._tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+    @property
+    def available(self) -> float:
+        return self._tokens
+
+
+@dataclass
+class RetryPolicy:
+    """
+    When and how ``ProjectClient`` retries failed requests.
+
+    Only idempotent methods are retried by default. Delays grow exponentially
+    from ``backoff_base`` up to ``backoff_max`` with full jitter, and a
+    ``Retry-After`` header on 429/503 responses takes precedence when present.
+    """
+
+    max_attempts: int = 3
+    backoff_base: float = 0.1
+    backoff_max: float = 5.0
+    methods: FrozenSet[str] = IDEMPOTENT_METHODS
+    status_codes: FrozenSet[int] = RETRYABLE_STATUS_CODES
+    respect_retry_after: bool = True
+    max_retry_after: float = 30.0
+    budget: Optional[RetryBudget] = field(default_factory=RetryBudget)
+
+    def is_retryable_method(self, method: str) -> bool:
+        return method.upper() in self.methods
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter delay before retry number ``attempt`` (starting at 1)."""
+        ceiling = min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1))
+        return random.uniform(0, ceiling)
+
+    def delay(self, attempt: int, response: httpx.Response = None) -> float:
+        if self.respect_retry_after and response is not None:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                return min(retry_after, self.max_retry_after)
+        return self.backoff(attempt)
+
+    def acquire_retry(self) -> bool:
+        return self.budget is None or self.budget.withdraw()
+
+    def record_attempt(self):
+        if self.budget is not None:
+            self.budget.deposit()
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class LatencyTracker:
+    """Sliding window of recent request latencies."""
+
+    def __init__(self, window: int = 200):
+        self._samples = deque(maxlen=window)
+
+    def record(self, seconds: float):
+        self._samples.append(seconds)
+
+    def __len__(self):
+        return len(self._samples)
+
+    def percentile(self, q: float) -> Optional[float]:
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, int(q * len(ordered)))
+        return ordered[index]
+
+
+@dataclass
+class HedgePolicy:
+    """
+    Fire a backup GET once the primary has been outstanding for longer than
+    the ``percentile`` latency of recent GETs to the same endpoint, and keep
+    whichever finishes first.
+
+    Latencies are tracked per endpoint, so fast endpoints do not pull the
+    hedge delay of slow ones down. Until ``min_samples`` latencies have been
+    observed for an endpoint, ``initial_delay`` is used.
+    """
+
+    percentile: float = 0.95
+    initial_delay: float = 0.5
+    min_delay: float = 0.01
+    min_samples: int = 20
+    window: int = 200
+    trackers: Dict[Optional[str], LatencyTracker] = field(default_factory=dict)
+
+    def tracker(self, endpoint: Optional[str] = None) -> LatencyTracker:
+        tracker = self.trackers.get(endpoint)
+        if tracker is None:
+            tracker = self.trackers[endpoint] = LatencyTracker(self.window)
+        return tracker
+
+    def hedge_delay(self, endpoint: Optional[str] = None) -> float:
+        tracker = self.tracker(endpoint)
+        if len(tracker) < self.min_samples:
+            return self.initial_delay
+        return max(self.min_delay, tracker.percentile(self.percentile))
+
+
+async def hedged(
+    send: Callable[[], Awaitable[httpx.Response]],
+    policy: HedgePolicy,
+    admitted: Optional[asyncio.Event] = None,
+    endpoint: Optional[str] = None,
+) -> httpx.Response:
+    """
+    Run ``send`` and, if it has not completed within the policy's hedge delay
+    for ``endpoint``, run it a second time and return the first successful
+    result.
+
+    If ``admitted`` is given, the hedge delay starts only once ``send`` sets
+    it. Time the primary spends queued behind a client-side limiter then
+    does not count as latency, so an overloaded client does not add backup
+    requests to its own queue.
+
+    Requests still outstanding when this returns, raises or is cancelled are
+    cancelled.
+    """
+    pending = {asyncio.ensure_future(send())}
+    error = None
+    try:
+        if admitted is not None:
+            await _wait_for_admission(pending, admitted)
+        tracker = policy.tracker(endpoint)
+        start = time.perf_counter()
+        done, pending = await asyncio.wait(
+            pending, timeout=policy.hedge_delay(endpoint)
+        )
+        if done:
+            response = done.pop().result()
+            tracker.record(time.perf_counter() - start)
+            return response
+
+        pending.add(asyncio.ensure_future(send()))
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                if task.exception() is None:
+                    tracker.record(time.perf_counter() - start)
+                    return task.result()
+                error = task.exception()
+        raise error
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def _wait_for_admission(pending, admitted: asyncio.Event):
+    waiter = asyncio.ensure_future(admitted.wait())
+    try:
+        await asyncio.wait(pending | {waiter}, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        waiter.cancel()
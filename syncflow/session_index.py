@@ -0,0 +1,182 @@
+import asyncio
+import bisect
+import inspect
+from collections import defaultdict
+from dataclasses import dataclass
+from enum import Enum
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+from syncflow.models import ProjectSessionResponse
+
+
+class SessionEventType(str, Enum):
+    ADDED = "added"
+    CHANGED = "changed"
+    STOPPED = "stopped"
+
+
+@dataclass
+class SessionEvent:
+    type: SessionEventType
+    session: ProjectSessionResponse
+    previous: Optional[ProjectSessionResponse] = None
+
+
+def fingerprint(session: ProjectSessionResponse) -> Tuple[str, int, int]:
+    return session.status, session.num_participants, session.num_recordings
+
+
+class SessionIndex:
+    """
+    A local, queryable index of a project's sessions that refreshes incrementally.
+
+    Each ``refresh`` lists the project's sessions. New sessions are indexed
+    from their listing entry, and only sessions whose status, participant
+    count or recording count changed since the previous refresh are fetched
+    again. Subscribers are called with a ``SessionEvent`` for every added,
+    changed or stopped session.
+
+    Args:
+        client (ProjectClient): The client used to list and fetch sessions.
+        concurrency (int, optional): Maximum concurrent detail fetches. Defaults to 8.
+        fetch_details (bool, optional): Fetch each changed session with
+            ``list_session``; when False the listing entry is indexed as-is.
+            Defaults to True.
+    """
+
+    def __init__(self, client, concurrency: int = 8, fetch_details: bool = True):
+        self.client = client
+        self.concurrency = concurrency
+        self.fetch_details = fetch_details
+        self._sessions: Dict[str, ProjectSessionResponse] = {}
+        self._fingerprints: Dict[str, Tuple[str, int, int]] = {}
+        self._by_status: Dict[str, Set[str]] = defaultdict(set)
+        self._by_device_group: Dict[str, Set[str]] = defaultdict(set)
+        self._by_started_at: List[Tuple[int, str]] = []
+        self._subscribers: List[Callable] = []
+        self._refresh_lock: Optional[asyncio.Lock] = None
+
+    def subscribe(self, callback: Callable[[SessionEvent], None]) -> Callable[[], None]:
+        """Register a sync or async callback; returns a function that unsubscribes it."""
+        self._subscribers.append(callback)
+
+        def unsubscribe():
+            if callback in self._subscribers:
+                self._subscribers.remove(callback)
+
+        return unsubscribe
+
+    async def refresh(self) -> List[SessionEvent]:
+        if self._refresh_lock is None:
+            self._refresh_lock = asyncio.Lock()
+        async with self._refresh_lock:
+            return await self._refresh()
+
+    async def run(self, interval: float = 5.0):
+        """Refresh the index every ``interval`` seconds until cancelled."""
+        while True:
+            await self.refresh()
+            await asyncio.sleep(interval)
+
+    async def _refresh(self) -> List[SessionEvent]:
+        listing = await self.client.list_sessions()
+        stale = [
+            session
+            for session in listing
+            if self._fingerprints.get(session.id) != fingerprint(session)
+        ]
+        updated = await self._load(stale)
+
+        listed_ids = {session.id for session in listing}
+        for session_id in [sid for sid in self._sessions if sid not in listed_ids]:
+            self._remove(session_id)
+
+        events = []
+        for session in updated:
+            previous = self._sessions.get(session.id)
+            self._remove(session.id)
+            self._add(session)
+            if previous is None:
+                events.append(SessionEvent(SessionEventType.ADDED, session))
+                continue
+            events.append(SessionEvent(SessionEventType.CHANGED, session, previous))
+            if session.is_stopped() and not previous.is_stopped():
+                events.append(SessionEvent(SessionEventType.STOPPED, session, previous))
+
+        for event in events:
+            await self._emit(event)
+        return events
+
+    async def _load(
+        self, sessions: List[ProjectSessionResponse]
+    ) -> List[ProjectSessionResponse]:
+        if not self.fetch_details:
+            return sessions
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def load(session):
+            # The listing already has the full model of a session seen for
+            # the first time.
+            if session.id not in self._sessions:
+                return session
+            async with semaphore:
+                return await self.client.list_session(session.id, fresh=True)
+
+        return await asyncio.gather(*(load(session) for session in sessions))
+
+    async def _emit(self, event: SessionEvent):
+        for callback in list(self._subscribers):
+            result = callback(event)
+            if inspect.isawaitable(result):
+                await result
+
+    def _add(self, session: ProjectSessionResponse):
+        self._sessions[session.id] = session
+        self._fingerprints[session.id] = fingerprint(session)
+        self._by_status[session.status].add(session.id)
+        for group in session.device_groups or []:
+            self._by_device_group[group].add(session.id)
+        bisect.insort(self._by_started_at, (session.started_at, session.id))
+
+    def _remove(self, session_id: str):
+        session = self._sessions.pop(session_id, None)
+        if session is None:
+            return
+        del self._fingerprints[session_id]
+        self._by_status[session.status].discard(session_id)
+        for group in session.device_groups or []:
+            self._by_device_group[group].discard(session_id)
+        key = (session.started_at, session_id)
+        position = bisect.bisect_left(self._by_started_at, key)
+        if position < len(self._by_started_at) and self._by_started_at[position] == key:
+            del self._by_started_at[position]
+
+    def get(self, session_id: str) -> Optional[ProjectSessionResponse]:
+        return self._sessions.get(session_id)
+
+    def by_status(self, status: str) -> List[ProjectSessionResponse]:
+        return [self._sessions[sid] for sid in self._by_status.get(status, ())]
+
+    def by_device_group(self, group: str) -> List[ProjectSessionResponse]:
+        return [self._sessions[sid] for sid in self._by_device_group.get(group, ())]
+
+    def started_between(
+        self, start: int = None, end: int = None
+    ) -> List[ProjectSessionResponse]:
+        """Sessions with ``start <= started_at < end``, ordered by ``started_at``."""
+        low = 0 if start is None else bisect.bisect_left(self._by_started_at, (start,))
+        high = (
+            len(self._by_started_at)
+            if end is None
+            else bisect.bisect_left(self._by_started_at, (end,))
+        )
+        return [self._sessions[sid] for _, sid in self._by_started_at[low:high]]
+
+    def __contains__(self, session_id: str) -> bool:
+        return session_id in self._sessions
+
+    def __iter__(self) -> Iterator[ProjectSessionResponse]:
+        return iter(self._sessions.values())
+
+    def __len__(self):
+        return len(self._sessions)
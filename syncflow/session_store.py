@@ -0,0 +1,151 @@
+import sqlite3
+import threading
+from typing import Iterable, Iterator, List, Optional, Set
+
+from syncflow import codec
+from syncflow.models import ProjectSessionResponse
+
+
+class SessionStore:
+    """
+    A SQLite file that persists stopped sessions across process restarts.
+
+    A stopped ``ProjectSessionResponse`` never changes, so once stored it is
+    served locally instead of being fetched again. Sessions that are not
+    stopped are never written.
+
+    Args:
+        path (str): Path of the SQLite database file, or ``":memory:"``.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._connection:
+            if path != ":memory:":
+                self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("""
+                CREATE TABLE IF NOT EXISTS sessions (
+                    id TEXT PRIMARY KEY,
+                    project_id TEXT NOT NULL,
+                    started_at INTEGER NOT NULL,
+                    payload BLOB NOT NULL
+                )
+                """)
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS sessions_started_at "
+                "ON sessions (project_id, started_at)"
+            )
+
+    def get(self, session_id: str) -> Optional[ProjectSessionResponse]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT payload FROM sessions WHERE id = ?", (session_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        return codec.decode(row[0], ProjectSessionResponse)
+
+    def put(self, session: ProjectSessionResponse) -> bool:
+        """Store ``session`` if it is stopped. Returns whether it was written."""
+        return self.put_many([session]) == 1
+
+    def put_many(self, sessions: Iterable[ProjectSessionResponse]) -> int:
+        """
+        Store the stopped sessions among ``sessions``. Returns how many were new.
+
+        Sessions that are already stored are skipped before serialization.
+        """
+        sessions = {session.id: session for session in sessions if session.is_stopped()}
+        if not sessions:
+            return 0
+        known = self._known_ids(list(sessions))
+        rows = [
+            (
+                session.id,
+                session.project_id,
+                session.started_at,
+                session.model_dump_json(by_alias=True).encode("utf-8"),
+            )
+            for session in sessions.values()
+            if session.id not in known
+        ]
+        if not rows:
+            return 0
+        with self._lock, self._connection:
+            before = self._connection.total_changes
+            self._connection.executemany(
+                "INSERT OR IGNORE INTO sessions (id, project_id, started_at, payload) "
+                "VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            return self._connection.total_changes - before
+
+    def _known_ids(self, session_ids: List[str]) -> Set[str]:
+        known = set()
+        # Stay below SQLite's default limit on bound parameters.
+        for start in range(0, len(session_ids), 500):
+            batch = session_ids[start : start + 500]
+            placeholders = ", ".join("?" * len(batch))
+            with self._lock:
+                known.update(
+                    row[0]
+                    for row in self._connection.execute(
+                        f"SELECT id FROM sessions WHERE id IN ({placeholders})", batch
+                    )
+                )
+        return known
+
+    def ids(self, project_id: str = None) -> Set[str]:
+        query, params = "SELECT id FROM sessions", ()
+        if project_id is not None:
+            query, params = query + " WHERE project_id = ?", (project_id,)
+        with self._lock:
+            return {row[0] for row in self._connection.execute(query, params)}
+
+    def iter_sessions(
+        self, project_id: str = None, started_after: int = None
+    ) -> Iterator[ProjectSessionResponse]:
+        """Yield stored sessions ordered by ``started_at``, one row at a time."""
+        clauses, params = [], []
+        if project_id is not None:
+            clauses.append("project_id = ?")
+            params.append(project_id)
+        if started_after is not None:
+            clauses.append("started_at > ?")
+            params.append(started_after)
+        query = "SELECT payload FROM sessions"
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += " ORDER BY started_at"
+
+        with self._lock:
+            cursor = self._connection.execute(query, params)
+        while True:
+            with self._lock:
+                rows = cursor.fetchmany(256)
+            if not rows:
+                return
+            for (payload,) in rows:
+                yield codec.decode(payload, ProjectSessionResponse)
+
+    def delete(self, session_id: str):
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM sessions WHERE id = ?", (session_id,))
+
+    def __contains__(self, session_id: str) -> bool:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT 1 FROM sessions WHERE id = ?", (session_id,)
+            ).fetchone()
+        return row is not None
+
+    def __len__(self):
+        with self._lock:
+            row = self._connection.execute("SELECT COUNT(*) FROM sessions").fetchone()
+        return row[0]
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
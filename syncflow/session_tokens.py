@@ -0,0 +1,98 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Hashable, Optional, Tuple
+
+from syncflow.models import TokenRequest, TokenResponse
+
+
+@dataclass
+class TokenResult:
+    request: TokenRequest
+    token: Optional[TokenResponse] = None
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class TokenCacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+
+class SessionTokenCache:
+    """
+    Cache of minted session tokens keyed by session, identity and grants.
+
+    Tokens are kept until ``refresh_skew`` seconds before the ``exp`` claim of
+    the minted token, so pre-minted tokens can be handed out at session start
+    without a round trip.
+
+    Args:
+        refresh_skew (float, optional): Stop serving a token this many seconds
+            before it expires. Defaults to 60.
+        default_ttl (float, optional): Lifetime assumed for tokens without an
+            ``exp`` claim. Defaults to 300.
+        max_entries (int, optional): Maximum number of cached tokens. Defaults to 4096.
+    """
+
+    def __init__(
+        self,
+        refresh_skew: float = 60,
+        default_ttl: float = 300,
+        max_entries: int = 4096,
+    ):
+        self.refresh_skew = refresh_skew
+        self.default_ttl = default_ttl
+        self.max_entries = max_entries
+        self.stats = TokenCacheStats()
+        self._entries: "OrderedDict[Hashable, Tuple[float, TokenResponse]]" = (
+            OrderedDict()
+        )
+
+    @staticmethod
+    def key(session_id: str, token_request: TokenRequest) -> Hashable:
+        return (
+            session_id,
+            token_request.identity,
+            token_request.name,
+            token_request.video_grants.model_dump_json(),
+        )
+
+    def get(self, key: Hashable) -> Optional[TokenResponse]:
+        entry = self._entries.get(key)
+        if entry is None or entry[0] - self.refresh_skew <= time.time():
+            if entry is not None:
+                del self._entries[key]
+            self.stats.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.stats.hits += 1
+        return entry[1]
+
+    def set(self, key: Hashable, token: TokenResponse):
+        self._entries[key] = (self._expires_at(token.token), token)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    def invalidate_session(self, session_id: str):
+        for key in [key for key in self._entries if key[0] == session_id]:
+            del self._entries[key]
+
+    def _expires_at(self, token: str) -> float:
+        import jwt
+
+        try:
+            claims = jwt.decode(token, options={"verify_signature": False})
+            return float(claims["exp"])
+        except (jwt.PyJWTError, KeyError, TypeError, ValueError):
+            return time.time() + self.default_ttl
+
+    def __len__(self):
+        return len(self._entries)
@@ -0,0 +1,61 @@
+import asyncio
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class SingleFlightStats:
+    calls: int = 0
+    executions: int = 0
+    coalesced: int = 0
+
+
+class SingleFlight:
+    """
+    Collapse concurrent calls that share a key into a single execution.
+
+    The first caller for a key starts the work; callers arriving while it is
+    in flight await the same result (or exception). Cancelling one awaiter
+    does not cancel the shared work for the others; it is cancelled once
+    every awaiter has been.
+    """
+
+    def __init__(self):
+        self.stats = SingleFlightStats()
+        self._in_flight: Dict[Hashable, asyncio.Future] = {}
+        self._awaiters: Dict[asyncio.Future, int] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        self.stats.calls += 1
+        future = self._in_flight.get(key)
+        if future is not None:
+            self.stats.coalesced += 1
+        else:
+            self.stats.executions += 1
+            future = asyncio.ensure_future(fn())
+            self._in_flight[key] = future
+            future.add_done_callback(lambda done: self._finish(key, done))
+        self._awaiters[future] = self._awaiters.get(future, 0) + 1
+        try:
+            return await asyncio.shield(future)
+        finally:
+            self._awaiters[future] -= 1
+            if not self._awaiters[future]:
+                del self._awaiters[future]
+                if not future.done():
+                    future.cancel()
+
+    def in_flight(self, key: Hashable) -> bool:
+        return key in self._in_flight
+
+    def _finish(self, key: Hashable, future: asyncio.Future):
+        if self._in_flight.get(key) is future:
+            del self._in_flight[key]
+        if not future.cancelled():
+            # Mark the exception as retrieved in case every awaiter was cancelled.
+            future.exception()
+
+    def __len__(self):
+        return len(self._in_flight)
@@ -0,0 +1,177 @@
+import re
+from typing import AsyncIterable, AsyncIterator, List, Optional, Tuple
+
+_STRUCTURAL = re.compile(rb'[\[\]{}",]')
+_STRING_SPECIAL = re.compile(rb'["\\]')
+# Everything but quotes and brackets, dropped to build a segment's skeleton.
+_NOT_SKELETON = bytes(sorted(set(range(256)) - set(b'"[]{}')))
+_SKELETON_STRING = re.compile(rb'"[^"]*"')
+# A closing bracket that may end an element of the top-level array.
+_ELEMENT_END = re.compile(rb"[}\]]\s*[,\]]")
+
+
+class JsonArraySplitter:
+    """
+    Incrementally split a top-level JSON array into the raw bytes of its elements.
+
+    Only the element currently being parsed is buffered, so memory stays bounded
+    by the largest element rather than the size of the whole array.
+
+    Object and array elements that are complete in the buffer are skipped in
+    bulk: strings are blanked out and brackets counted by regular expressions
+    and ``bytes.count``, so Python only steps through the closing brackets
+    that could end the element. An element split across chunks is resumed
+    where the previous chunk left off. Scalar elements are scanned token by
+    token.
+    """
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._started = False
+        self._finished = False
+        self._item_start = 0
+        # Progress through a partially received element, relative to its start.
+        self._element: Optional[Tuple[int, int, int]] = None
+
+    @property
+    def finished(self) -> bool:
+        return self._finished
+
+    def feed(self, chunk: bytes) -> List[bytes]:
+        if self._finished:
+            if chunk.strip():
+                raise ValueError("Unexpected data after the end of the JSON array")
+            return []
+        buffer = self._buffer
+        buffer += chunk
+        items = []
+        pos = self._pos
+        end = len(buffer)
+        while pos < end:
+            if self._in_string:
+                match = _STRING_SPECIAL.search(buffer, pos)
+                if match is None:
+                    pos = end
+                    break
+                if match.group() == b"\\":
+                    if match.end() >= end:
+                        # The escaped character is in the next chunk.
+                        pos = match.start()
+                        break
+                    pos = match.end() + 1
+                    continue
+                self._in_string = False
+                pos = match.end()
+                continue
+
+            match = _STRUCTURAL.search(buffer, pos)
+            if match is None:
+                pos = end
+                break
+            token = match.group()
+            pos = match.end()
+            if self._started and self._depth == 0 and token in (b"{", b"["):
+                element_end = self._skip_element(buffer, match.start(), end)
+                if element_end is None:
+                    pos = match.start()
+                    break
+                pos = element_end
+                continue
+            if not self._started:
+                if token != b"[" or buffer[: match.start()].strip():
+                    raise ValueError("Expected a JSON array")
+                self._started = True
+                self._item_start = pos
+            elif token == b'"':
+                self._in_string = True
+            elif token in (b"[", b"{"):
+                self._depth += 1
+            elif token in (b"]", b"}"):
+                if self._depth == 0:
+                    self._emit(buffer[self._item_start : match.start()], items)
+                    self._finished = True
+                    if buffer[pos:].strip():
+                        raise ValueError(
+                            "Unexpected data after the end of the JSON array"
+                        )
+                    pos = end
+                    break
+                self._depth -= 1
+            elif self._depth == 0:
+                self._emit(buffer[self._item_start : match.start()], items)
+                self._item_start = pos
+
+        if self._started and self._item_start > 0:
+            del buffer[: self._item_start]
+            pos -= self._item_start
+            self._item_start = 0
+        elif not self._started:
+            del buffer[:pos]
+            pos = 0
+        self._pos = pos
+        return items
+
+    def _skip_element(self, buffer: bytearray, start: int, end: int) -> Optional[int]:
+        """
+        Return the index just past the object or array starting at ``start``,
+        or None if it does not end before ``end``.
+        """
+        segment, search, depth = self._element or (0, 0, 0)
+        segment += start
+        search += start
+        while True:
+            match = _ELEMENT_END.search(buffer, search, end)
+            if match is None:
+                self._element = (segment - start, search - start, depth)
+                return None
+            close = match.start() + 1
+            search = close
+            skeleton = _skeleton(buffer[segment:close])
+            if b'"' in skeleton:
+                # The bracket is inside a string; extend the segment past it.
+                continue
+            depth += (
+                skeleton.count(b"{")
+                + skeleton.count(b"[")
+                - skeleton.count(b"}")
+                - skeleton.count(b"]")
+            )
+            segment = close
+            if depth == 0:
+                self._element = None
+                return close
+            if depth < 0:
+                raise ValueError("Unbalanced brackets in JSON array element")
+
+    def close(self):
+        if not self._finished:
+            raise ValueError("Truncated JSON array")
+
+    @staticmethod
+    def _emit(item: bytearray, items: List[bytes]):
+        item = bytes(item).strip()
+        if item:
+            items.append(item)
+
+
+def _skeleton(data: bytes) -> bytes:
+    """The brackets of ``data`` that are outside strings, plus any unterminated string."""
+    if b"\\" in data:
+        # Escaped backslashes first, so that ``\\"`` still closes its string.
+        data = data.replace(b"\\\\", b"").replace(b'\\"', b"")
+    skeleton = data.translate(None, _NOT_SKELETON).replace(b'""', b"")
+    if b'"' in skeleton:
+        skeleton = _SKELETON_STRING.sub(b"", skeleton)
+    return skeleton
+
+
+async def iter_json_array(chunks: AsyncIterable[bytes]) -> AsyncIterator[bytes]:
+    """Yield the raw JSON bytes of each element of a streamed top-level array."""
+    splitter = JsonArraySplitter()
+    async for chunk in chunks:
+        for item in splitter.feed(chunk):
+            yield item
+    splitter.close()
@@ -0,0 +1,295 @@
+import asyncio
+import concurrent.futures
+import threading
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Coroutine,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Union,
+)
+
+from syncflow.models import (
+    CreateSessionRequest,
+    DeviceResponse,
+    ParticipantInfo,
+    ParticipantState,
+    ProjectInfo,
+    ProjectSessionResponse,
+    ProjectSummary,
+    RegisterDeviceRequest,
+    SessionNotification,
+    SessionNotificationType,
+    TokenRequest,
+    TokenResponse,
+)
+from syncflow.project_client import ProjectClient
+from syncflow.transport import PoolStats
+
+if TYPE_CHECKING:
+    from syncflow.batch import Batch, BatchReport
+    from syncflow.compact import CompactSession
+    from syncflow.limits import LimiterStats
+    from syncflow.notifications import NotificationBackend
+    from syncflow.session_tokens import TokenResult
+
+
+class SyncProjectClient:
+    """
+    A blocking facade over ``ProjectClient`` for synchronous code.
+
+    A single background thread runs an event loop that owns one
+    ``ProjectClient``, so the connection pool, token manager and caches are
+    reused across calls instead of being rebuilt by ``asyncio.run``. Methods
+    may be called from any number of threads; each call blocks until the
+    coroutine finishes on the background loop.
+
+    Every public ``ProjectClient`` method has a blocking counterpart, except
+    that ``aclose`` is ``close`` and the loop-bound ``watcher`` is only
+    reachable through ``client``.
+
+    Accepts the same arguments as ``ProjectClient``, plus:
+
+    Args:
+        call_timeout (float, optional): Seconds to wait for each call before
+            raising ``TimeoutError``. Defaults to no limit.
+    """
+
+    def __init__(self, *args, call_timeout: Optional[float] = None, **kwargs):
+        self.call_timeout = call_timeout
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._run_loop, name="syncflow-client", daemon=True
+        )
+        self._thread.start()
+        self._closed = False
+        try:
+            self._client = self._call(self._create_client(args, kwargs))
+        except BaseException:
+            self._stop_loop()
+            raise
+
+    @property
+    def client(self) -> ProjectClient:
+        """The underlying async client; only use it on the background loop."""
+        return self._client
+
+    def _run_loop(self):
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+
+    @staticmethod
+    async def _create_client(args, kwargs) -> ProjectClient:
+        return ProjectClient(*args, **kwargs)
+
+    def _call(self, coro: Coroutine) -> Any:
+        if self._closed:
+            coro.close()
+            raise RuntimeError("SyncProjectClient is closed")
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError("SyncProjectClient cannot be called from its own loop")
+        future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        try:
+            return future.result(self.call_timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise
+
+    def _iterate(self, iterator: AsyncIterator) -> Iterator:
+        try:
+            while True:
+                try:
+                    yield self._call(iterator.__anext__())
+                except StopAsyncIteration:
+                    return
+        finally:
+            if not self._closed:
+                self._call(iterator.aclose())
+
+    @property
+    def api_token(self) -> str:
+        return self._client.api_token
+
+    def get_api_token(self) -> str:
+        return self._client.get_api_token()
+
+    def is_expired(self, token: str) -> bool:
+        return self._client.is_expired(token)
+
+    def authorized_fetch(self, url: str, method: str = "GET", data=None) -> Any:
+        return self._call(self._client.authorized_fetch(url, method, data))
+
+    def batch(self, concurrency: int = 8) -> "SyncBatch":
+        return SyncBatch(self, self._client.batch(concurrency))
+
+    def pool_stats(self) -> PoolStats:
+        return self._client.pool_stats()
+
+    def limiter_stats(self) -> Optional["LimiterStats"]:
+        return self._client.limiter_stats()
+
+    def get_project_details(self) -> ProjectInfo:
+        return self._call(self._client.get_project_details())
+
+    def delete_project(self) -> ProjectInfo:
+        return self._call(self._client.delete_project())
+
+    def summarize_project(self) -> ProjectSummary:
+        return self._call(self._client.summarize_project())
+
+    def create_session(
+        self, new_session_request: CreateSessionRequest
+    ) -> ProjectSessionResponse:
+        return self._call(self._client.create_session(new_session_request))
+
+    def list_sessions(self) -> List[ProjectSessionResponse]:
+        return self._call(self._client.list_sessions())
+
+    def list_sessions_compact(self) -> List["CompactSession"]:
+        return self._call(self._client.list_sessions_compact())
+
+    def iter_sessions(self) -> Iterator[ProjectSessionResponse]:
+        return self._iterate(self._client.iter_sessions())
+
+    def list_session(
+        self, session_id: str, fresh: bool = False
+    ) -> ProjectSessionResponse:
+        return self._call(self._client.list_session(session_id, fresh=fresh))
+
+    def list_participants(self, session_id: str) -> List[ParticipantInfo]:
+        return self._call(self._client.list_participants(session_id))
+
+    def iter_participants(self, session_id: str) -> Iterator[ParticipantInfo]:
+        return self._iterate(self._client.iter_participants(session_id))
+
+    def generate_session_token(
+        self, session_id: str, token_request: TokenRequest
+    ) -> TokenResponse:
+        return self._call(
+            self._client.generate_session_token(session_id, token_request)
+        )
+
+    def generate_session_tokens(
+        self,
+        session_id: str,
+        token_requests: List[TokenRequest],
+        concurrency: int = 8,
+    ) -> List["TokenResult"]:
+        return self._call(
+            self._client.generate_session_tokens(
+                session_id, token_requests, concurrency=concurrency
+            )
+        )
+
+    def get_livekit_session_info(self, session_id: str) -> dict:
+        return self._call(self._client.get_livekit_session_info(session_id))
+
+    def stop_session(self, session_id: str) -> ProjectSessionResponse:
+        return self._call(self._client.stop_session(session_id))
+
+    def register_device(self, device: RegisterDeviceRequest) -> DeviceResponse:
+        return self._call(self._client.register_device(device))
+
+    def list_devices(self) -> List[DeviceResponse]:
+        return self._call(self._client.list_devices())
+
+    def iter_devices(self) -> Iterator[DeviceResponse]:
+        return self._iterate(self._client.iter_devices())
+
+    def list_device(self, device_id: str) -> DeviceResponse:
+        return self._call(self._client.list_device(device_id))
+
+    def delete_device(self, device_id: str) -> DeviceResponse:
+        return self._call(self._client.delete_device(device_id))
+
+    def wait_for_session_stopped(
+        self, session_id: str, timeout: Optional[float] = None
+    ) -> ProjectSessionResponse:
+        return self._call(self._client.wait_for_session_stopped(session_id, timeout))
+
+    def wait_for_recordings_complete(
+        self,
+        session_id: str,
+        timeout: Optional[float] = None,
+        min_recordings: int = 1,
+    ) -> ProjectSessionResponse:
+        return self._call(
+            self._client.wait_for_recordings_complete(
+                session_id, timeout, min_recordings
+            )
+        )
+
+    def wait_for_participant(
+        self,
+        session_id: str,
+        identity: str,
+        state: ParticipantState = ParticipantState.CONNECTED,
+        timeout: Optional[float] = None,
+    ) -> Optional[ParticipantInfo]:
+        return self._call(
+            self._client.wait_for_participant(session_id, identity, state, timeout)
+        )
+
+    def subscribe_session_notifications(
+        self,
+        device: Union[str, DeviceResponse],
+        backend: "NotificationBackend",
+        types: Optional[Iterable[SessionNotificationType]] = None,
+    ) -> Iterator[SessionNotification]:
+        subscriber = self._call(
+            self._client.subscribe_session_notifications(device, backend, types)
+        )
+        return self._iterate(subscriber.__aiter__())
+
+    def close(self):
+        if self._closed:
+            return
+        try:
+            self._call(self._client.aclose())
+        finally:
+            self._stop_loop()
+
+    def _stop_loop(self):
+        self._closed = True
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class SyncBatch:
+    """
+    A ``Batch`` for ``SyncProjectClient``. Calls are queued as on ``Batch``
+    and run together when the ``with`` block exits:
+
+        with client.batch(concurrency=8) as batch:
+            participants = batch.list_participants(session_id)
+        print(batch.report.elapsed, participants.result())
+    """
+
+    def __init__(self, client: SyncProjectClient, batch: "Batch"):
+        self._client = client
+        self._batch = batch
+
+    def __getattr__(self, name):
+        return getattr(self._batch, name)
+
+    def run(self) -> "BatchReport":
+        return self._client._call(self._batch.run())
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.run()
@@ -0,0 +1,153 @@
+from typing import Iterable, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover - optional dependency
+    raise ImportError(
+        "syncflow.timeline requires numpy: pip install syncflow[timeline]"
+    ) from e
+
+from syncflow.models import ProjectSessionResponse
+
+
+class TrackTimeline:
+    """
+    A columnar index of when every recorded track was live.
+
+    Each track's start is its ``recording_start_time``, falling back to the
+    ``started_at`` of its egress and then the participant's ``joined_at``. It
+    ends when the participant left, or is open-ended (``inf``) while they are
+    still connected. All times use the units the server reports.
+
+    Build one with ``TrackTimeline.from_sessions`` and query it with vectorized
+    NumPy operations.
+    """
+
+    def __init__(
+        self,
+        session_ids: np.ndarray,
+        session_start: np.ndarray,
+        session_index: np.ndarray,
+        track_ids: np.ndarray,
+        participant_ids: np.ndarray,
+        kinds: np.ndarray,
+        start: np.ndarray,
+        end: np.ndarray,
+    ):
+        self.session_ids = session_ids
+        self.session_start = session_start
+        self.session_index = session_index
+        self.track_ids = track_ids
+        self.participant_ids = participant_ids
+        self.kinds = kinds
+        self.start = start
+        self.end = end
+
+    @classmethod
+    def from_sessions(cls, sessions: Iterable[ProjectSessionResponse]):
+        session_ids, session_start = [], []
+        session_index, track_ids, participant_ids, kinds = [], [], [], []
+        start, end = [], []
+        for position, session in enumerate(sessions):
+            session_ids.append(session.id)
+            session_start.append(session.started_at)
+            egress_started = {}
+            for egress in session.recordings:
+                egress_started[egress.track_id] = egress.started_at
+                if egress.db_track_id:
+                    egress_started[egress.db_track_id] = egress.started_at
+            for participant in session.participants:
+                left_at = np.inf if participant.left_at is None else participant.left_at
+                for track in participant.tracks:
+                    details = track.multimedia_details
+                    track_start = details.recording_start_time if details else None
+                    if track_start is None:
+                        track_start = egress_started.get(
+                            track.id, egress_started.get(track.sid)
+                        )
+                    if track_start is None:
+                        track_start = participant.joined_at
+                    session_index.append(position)
+                    track_ids.append(track.id)
+                    participant_ids.append(participant.id)
+                    kinds.append(track.kind)
+                    start.append(track_start)
+                    end.append(left_at)
+        return cls(
+            session_ids=np.array(session_ids, dtype=object),
+            session_start=np.array(session_start, dtype=np.float64),
+            session_index=np.array(session_index, dtype=np.int64),
+            track_ids=np.array(track_ids, dtype=object),
+            participant_ids=np.array(participant_ids, dtype=object),
+            kinds=np.array(kinds, dtype=object),
+            start=np.array(start, dtype=np.float64),
+            end=np.array(end, dtype=np.float64),
+        )
+
+    def __len__(self):
+        return len(self.track_ids)
+
+    def offsets(self) -> np.ndarray:
+        """Start of every track relative to the start of its session."""
+        return self.start - self.session_start[self.session_index]
+
+    def _session_mask(self, session_id: str) -> np.ndarray:
+        (positions,) = np.nonzero(self.session_ids == session_id)
+        if not len(positions):
+            return np.zeros(len(self), dtype=bool)
+        return self.session_index == positions[0]
+
+    def tracks_in_session(self, session_id: str) -> np.ndarray:
+        """Indices of the tracks belonging to ``session_id``."""
+        return np.nonzero(self._session_mask(session_id))[0]
+
+    def live_at(self, t: float, session_id: Optional[str] = None) -> np.ndarray:
+        """Indices of the tracks live at time ``t``, optionally within one session."""
+        mask = (self.start <= t) & (t < self.end)
+        if session_id is not None:
+            mask &= self._session_mask(session_id)
+        return np.nonzero(mask)[0]
+
+    def live_matrix(self, times: np.ndarray) -> np.ndarray:
+        """Boolean matrix of shape ``(len(times), len(self))``: track live at time."""
+        times = np.asarray(times, dtype=np.float64)[:, None]
+        return (self.start[None, :] <= times) & (times < self.end[None, :])
+
+    def overlap(self, i: int, j: int) -> Optional[Tuple[float, float]]:
+        """The window during which tracks ``i`` and ``j`` were both live, if any."""
+        low = max(self.start[i], self.start[j])
+        high = min(self.end[i], self.end[j])
+        return (low, high) if low < high else None
+
+    def overlaps(
+        self, session_id: Optional[str] = None
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Every pair of tracks in the same session that were live at the same time.
+
+        Returns:
+            tuple: Arrays ``(i, j, start, end)`` of track indices with ``i < j``
+                and the window during which both were live.
+        """
+        if session_id is not None:
+            groups = [self.tracks_in_session(session_id)]
+        else:
+            order = np.argsort(self.session_index, kind="stable")
+            boundaries = np.nonzero(np.diff(self.session_index[order]))[0] + 1
+            groups = np.split(order, boundaries)
+
+        results = [[], [], [], []]
+        for indices in groups:
+            if len(indices) < 2:
+                continue
+            low = np.maximum.outer(self.start[indices], self.start[indices])
+            high = np.minimum.outer(self.end[indices], self.end[indices])
+            rows, cols = np.nonzero(np.triu(low < high, k=1))
+            results[0].append(indices[rows])
+            results[1].append(indices[cols])
+            results[2].append(low[rows, cols])
+            results[3].append(high[rows, cols])
+        if not results[0]:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty, np.empty(0), np.empty(0)
+        return tuple(np.concatenate(column) for column in results)
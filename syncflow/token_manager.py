@@ -0,0 +1,167 @@
+import asyncio
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from syncflow.models import ProjectTokenClaims
+
+
+@dataclass
+class TokenStats:
+    mints: int = 0
+    cache_hits: int = 0
+    background_refreshes: int = 0
+    refresh_failures: int = 0
+
+
+class TokenManager:
+    """
+    Mint and cache the project API token used to authorize requests.
+
+    The expiry of every minted token is remembered, so the hot path is a
+    timestamp comparison instead of a JWT decode. Once a token enters the
+    refresh window (``refresh_skew`` seconds before it expires) a single
+    background refresh is scheduled while callers keep using the current
+    token. A token is only minted inline when it is missing or within
+    ``min_validity`` seconds of expiring, or when the background refresh
+    failed: its error is kept in ``refresh_error`` and the next
+    ``get_token`` retries the refresh inline, raising if it fails again.
+
+    Args:
+        project_id (str): The SyncFlow project ID.
+        api_key (str): The project API key, used as the token issuer.
+        api_secret (str): The project API secret used to sign tokens.
+        ttl (int, optional): Lifetime of minted tokens in seconds. Defaults to 3600.
+        refresh_skew (float, optional): Seconds before expiry at which a background
+            refresh is started. Defaults to 60.
+        min_validity (float, optional): Seconds of remaining validity below which a
+            token is no longer handed out. Defaults to 5.
+    """
+
+    def __init__(
+        self,
+        project_id: str,
+        api_key: str,
+        api_secret: str,
+        ttl: int = 60 * 60,
+        refresh_skew: float = 60,
+        min_validity: float = 5,
+    ):
+        if refresh_skew >= ttl:
+            raise ValueError("refresh_skew must be smaller than the token ttl")
+        self.project_id = project_id
+        self.api_key = api_key
+        self.api_secret = api_secret
+        self.ttl = ttl
+        self.refresh_skew = refresh_skew
+        self.min_validity = min(min_validity, refresh_skew)
+        self.stats = TokenStats()
+        self._token: Optional[str] = None
+        self._expires_at = 0.0
+        self._lock = threading.Lock()
+        self._refresh_task: Optional[asyncio.Task] = None
+        self.refresh_error: Optional[Exception] = None
+
+    @property
+    def expires_at(self) -> float:
+        return self._expires_at
+
+    def mint(self) -> str:
+        """Sign a new token without touching the cache."""
+        token, _ = self._sign()
+        return token
+
+    @property
+    def token(self) -> str:
+        """The current token, minted inline if it is missing or about to expire."""
+        token = self._token
+        if token is not None and time.time() < self._expires_at - self.min_validity:
+            self.stats.cache_hits += 1
+            return token
+        return self._refresh(force=False)
+
+    async def get_token(self) -> str:
+        """
+        Return a valid token, scheduling a background refresh when the cached
+        token enters the refresh window.
+        """
+        token = self._token
+        now = time.time()
+        if token is not None and now < self._expires_at - self.min_validity:
+            if self.refresh_error is not None:
+                return self._refresh(force=True)
+            self.stats.cache_hits += 1
+            if now >= self._expires_at - self.refresh_skew:
+                self._schedule_refresh()
+            return token
+        return self._refresh(force=False)
+
+    def invalidate(self):
+        """Drop the cached token so the next request mints a new one."""
+        with self._lock:
+            self._token = None
+            self._expires_at = 0.0
+
+    async def aclose(self):
+        task = self._refresh_task
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    def _schedule_refresh(self):
+        if self._refresh_task is not None and not self._refresh_task.done():
+            return
+        self._refresh_task = asyncio.get_running_loop().create_task(
+            self._background_refresh()
+        )
+
+    async def _background_refresh(self):
+        try:
+            self._refresh(force=True)
+        except Exception as e:
+            self.refresh_error = e
+            self.stats.refresh_failures += 1
+        else:
+            self.stats.background_refreshes += 1
+
+    def _refresh(self, force: bool) -> str:
+        with self._lock:
+            # Another caller may have refreshed while we waited on the lock.
+            if (
+                not force
+                and self._token is not None
+                and time.time() < self._expires_at - self.min_validity
+            ):
+                self.stats.cache_hits += 1
+                return self._token
+            if (
+                force
+                and self._token is not None
+                and time.time() < self._expires_at - self.refresh_skew
+            ):
+                return self._token
+            token, expires_at = self._sign()
+            self._token = token
+            self._expires_at = expires_at
+            self.refresh_error = None
+            return token
+
+    def _sign(self):
+        import jwt
+
+        issued_at = int(time.time())
+        claims = ProjectTokenClaims(
+            iat=issued_at,
+            exp=issued_at + self.ttl,
+            iss=self.api_key,
+            project_id=self.project_id,
+        )
+        token = jwt.encode(
+            claims.model_dump(by_alias=True), self.api_secret, algorithm="HS256"
+        )
+        self.stats.mints += 1
+        return token, claims.exp
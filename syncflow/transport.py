@@ -0,0 +1,147 @@
+from dataclasses import dataclass
+from typing import Optional
+
+import httpx
+
+
+@dataclass
+class PoolConfig:
+    """
+    Connection pool, protocol and timeout settings for the SyncFlow HTTP client.
+
+    ``http2`` requires the ``h2`` package (``pip install httpx[http2]``).
+    """
+
+    max_connections: Optional[int] = 100
+    max_keepalive_connections: Optional[int] = 20
+    keepalive_expiry: Optional[float] = 5.0
+    http2: bool = False
+    connect_timeout: Optional[float] = 5.0
+    read_timeout: Optional[float] = 30.0
+    write_timeout: Optional[float] = 30.0
+    pool_timeout: Optional[float] = 10.0
+
+    def limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    def timeout(self) -> httpx.Timeout:
+        return httpx.Timeout(
+            connect=self.connect_timeout,
+            read=self.read_timeout,
+            write=self.write_timeout,
+            pool=self.pool_timeout,
+        )
+
+
+@dataclass
+class PoolStats:
+    clients: int
+    connections: int
+    idle_connections: int
+    active_connections: int
+    queued_requests: int
+    in_flight_requests: int
+    total_requests: int
+
+
+class SharedTransport:
+    """
+    A single connection pool that many ``ProjectClient`` instances can share.
+
+    Each client attaches a lightweight lease; closing a client releases its
+    lease without closing the pool, which is closed by ``aclose`` once the
+    owner is done with it.
+
+    Args:
+        config (PoolConfig, optional): Pool limits and protocol settings.
+        transport (httpx.AsyncBaseTransport, optional): Use this transport instead
+            of building an ``httpx.AsyncHTTPTransport`` from ``config``.
+
+    The default transport, and with it httpcore and the TLS context, is only
+    built when the first request is sent.
+    """
+
+    def __init__(
+        self,
+        config: PoolConfig = None,
+        transport: httpx.AsyncBaseTransport = None,
+    ):
+        self.config = config or PoolConfig()
+        self._transport = transport
+        self._clients = 0
+        self._in_flight = 0
+        self._total_requests = 0
+        self._closed = False
+
+    @property
+    def transport(self) -> httpx.AsyncBaseTransport:
+        if self._transport is None:
+            self._transport = httpx.AsyncHTTPTransport(
+                limits=self.config.limits(),
+                http2=self.config.http2,
+            )
+        return self._transport
+
+    def attach(self) -> httpx.AsyncBaseTransport:
+        if self._closed:
+            raise RuntimeError("Cannot attach to a closed SharedTransport")
+        self._clients += 1
+        return _TransportLease(self)
+
+    def stats(self) -> PoolStats:
+        pool = getattr(self._transport, "_pool", None)
+        connections = list(getattr(pool, "connections", []))
+        idle = sum(1 for connection in connections if connection.is_idle())
+        queued = sum(
+            1 for request in getattr(pool, "_requests", []) if request.is_queued()
+        )
+        return PoolStats(
+            clients=self._clients,
+            connections=len(connections),
+            idle_connections=idle,
+            active_connections=len(connections) - idle,
+            queued_requests=queued,
+            in_flight_requests=self._in_flight,
+            total_requests=self._total_requests,
+        )
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self._in_flight += 1
+        self._total_requests += 1
+        try:
+            return await self.transport.handle_async_request(request)
+        finally:
+            self._in_flight -= 1
+
+    def _release(self):
+        self._clients = max(0, self._clients - 1)
+
+    async def aclose(self):
+        if not self._closed:
+            self._closed = True
+            if self._transport is not None:
+                await self._transport.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+
+class _TransportLease(httpx.AsyncBaseTransport):
+    def __init__(self, shared: SharedTransport):
+        self._shared = shared
+        self._released = False
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._shared.handle_async_request(request)
+
+    async def aclose(self):
+        if not self._released:
+            self._released = True
+            self._shared._release()
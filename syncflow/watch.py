@@ -0,0 +1,257 @@
+import asyncio
+import heapq
+import random
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from syncflow.models import ParticipantInfo, ProjectSessionResponse
+
+SESSION = "session"
+PARTICIPANTS = "participants"
+
+
+def _session_state(session: ProjectSessionResponse) -> tuple:
+    return (
+        session.status,
+        tuple((p.id, p.left_at, len(p.tracks)) for p in session.participants),
+        tuple((e.id, e.status) for e in session.recordings),
+    )
+
+
+def _participants_state(participants: List[ParticipantInfo]) -> tuple:
+    return tuple(sorted((p.id, p.state.value) for p in participants))
+
+
+@dataclass
+class WatchStats:
+    fetches: int = 0
+    errors: int = 0
+    resolved: int = 0
+    watches: int = 0
+    waiters: int = 0
+
+
+@dataclass
+class _Watch:
+    kind: str
+    session_id: str
+    interval: float
+    waiters: List[Tuple[Callable[[Any], bool], asyncio.Future]] = field(
+        default_factory=list
+    )
+    state: Optional[tuple] = None
+    due: float = 0.0
+    errors: int = 0
+    fetching: bool = False
+
+    @property
+    def key(self) -> Tuple[str, str]:
+        return self.kind, self.session_id
+
+    def prune(self) -> bool:
+        """Drop finished waiters; returns whether any are left."""
+        self.waiters = [w for w in self.waiters if not w[1].done()]
+        return bool(self.waiters)
+
+
+class WatchScheduler:
+    """
+    Polls session and participant state on behalf of many waiters.
+
+    All waiters on the same session share one fetch, and a single task
+    schedules every watch. Each watch polls every ``min_interval`` seconds
+    while the watched state keeps changing and backs off by ``backoff`` up to
+    ``max_interval`` while it stays the same. Every delay is randomized by
+    ``jitter`` so watches started together spread out. The task exits when
+    nothing is being watched.
+
+    Errors are retried with backoff. A 4xx response other than 429, or
+    ``max_errors`` consecutive failures, fails the watch's waiters.
+    """
+
+    def __init__(
+        self,
+        client,
+        min_interval: float = 1.0,
+        max_interval: float = 30.0,
+        backoff: float = 2.0,
+        jitter: float = 0.2,
+        max_errors: int = 5,
+    ):
+        self.client = client
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.jitter = jitter
+        self.max_errors = max_errors
+        self._watches: Dict[Tuple[str, str], _Watch] = {}
+        self._heap: List[Tuple[float, int, Tuple[str, str]]] = []
+        self._counter = 0
+        self._polls: Set[asyncio.Task] = set()
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._stats = WatchStats()
+
+    def stats(self) -> WatchStats:
+        self._stats.watches = len(self._watches)
+        self._stats.waiters = sum(
+            not future.done()
+            for watch in self._watches.values()
+            for _, future in watch.waiters
+        )
+        return self._stats
+
+    async def wait_for_session(
+        self,
+        session_id: str,
+        predicate: Callable[[ProjectSessionResponse], bool],
+        timeout: Optional[float] = None,
+    ) -> ProjectSessionResponse:
+        """
+        Wait until ``predicate`` holds for the session.
+
+        Returns:
+            ProjectSessionResponse: The first state of the session that
+                satisfied ``predicate``.
+
+        Raises:
+            asyncio.TimeoutError: If ``timeout`` seconds pass first.
+        """
+        return await self._wait(SESSION, session_id, predicate, timeout)
+
+    async def wait_for_participants(
+        self,
+        session_id: str,
+        predicate: Callable[[List[ParticipantInfo]], bool],
+        timeout: Optional[float] = None,
+    ) -> List[ParticipantInfo]:
+        """Wait until ``predicate`` holds for the session's live participants."""
+        return await self._wait(PARTICIPANTS, session_id, predicate, timeout)
+
+    async def _wait(self, kind, session_id, predicate, timeout):
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        watch = self._watches.get((kind, session_id))
+        if watch is None:
+            watch = _Watch(kind, session_id, self.min_interval)
+            self._watches[watch.key] = watch
+        watch.waiters.append((predicate, future))
+        if not watch.fetching:
+            # A new waiter gets a prompt first check instead of the idle interval.
+            watch.interval = self.min_interval
+            self._schedule(watch, 0.0)
+        self._ensure_running()
+        return await asyncio.wait_for(future, timeout)
+
+    def _ensure_running(self):
+        if self._wakeup is None:
+            self._wakeup = asyncio.Event()
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._run())
+        self._wakeup.set()
+
+    def _schedule(self, watch: _Watch, delay: float):
+        loop = asyncio.get_running_loop()
+        watch.due = loop.time() + delay
+        self._counter += 1
+        heapq.heappush(self._heap, (watch.due, self._counter, watch.key))
+
+    def _delay(self, interval: float) -> float:
+        return interval * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while self._watches:
+            now = loop.time()
+            while self._heap and self._heap[0][0] <= now:
+                due, _, key = heapq.heappop(self._heap)
+                watch = self._watches.get(key)
+                if watch is None or watch.due != due or watch.fetching:
+                    continue
+                if not watch.prune():
+                    del self._watches[key]
+                    continue
+                watch.fetching = True
+                poll = asyncio.ensure_future(self._poll(watch))
+                self._polls.add(poll)
+                poll.add_done_callback(self._polls.discard)
+            timeout = self._heap[0][0] - now if self._heap else None
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _fetch(self, watch: _Watch):
+        if watch.kind == SESSION:
+            return await self.client.list_session(watch.session_id, fresh=True)
+        return await self.client.list_participants(watch.session_id)
+
+    def _is_permanent(self, error: Exception) -> bool:
+        status_code = getattr(error, "status_code", None)
+        return (
+            status_code is not None and 400 <= status_code < 500 and status_code != 429
+        )
+
+    async def _poll(self, watch: _Watch):
+        try:
+            self._stats.fetches += 1
+            value = await self._fetch(watch)
+        except Exception as e:
+            self._stats.errors += 1
+            watch.errors += 1
+            if self._is_permanent(e) or watch.errors >= self.max_errors:
+                for _, future in watch.waiters:
+                    if not future.done():
+                        future.set_exception(e)
+                watch.waiters = []
+            watch.interval = min(self.max_interval, watch.interval * self.backoff)
+        else:
+            watch.errors = 0
+            state = (
+                _session_state(value)
+                if watch.kind == SESSION
+                else _participants_state(value)
+            )
+            changed = state != watch.state
+            watch.state = state
+            self._resolve(watch, value)
+            if changed:
+                watch.interval = self.min_interval
+            else:
+                watch.interval = min(self.max_interval, watch.interval * self.backoff)
+        finally:
+            watch.fetching = False
+
+        if watch.prune():
+            self._schedule(watch, self._delay(watch.interval))
+        elif self._watches.get(watch.key) is watch:
+            del self._watches[watch.key]
+        self._wakeup.set()
+
+    def _resolve(self, watch: _Watch, value):
+        for predicate, future in watch.waiters:
+            if future.done():
+                continue
+            try:
+                matched = predicate(value)
+            except Exception as e:
+                future.set_exception(e)
+                continue
+            if matched:
+                future.set_result(value)
+                self._stats.resolved += 1
+
+    async def aclose(self):
+        tasks = list(self._polls)
+        if self._task is not None:
+            tasks.append(self._task)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        for watch in self._watches.values():
+            for _, future in watch.waiters:
+                future.cancel()
+        self._watches.clear()
+        self._heap.clear()
+        self._task = None
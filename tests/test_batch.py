@@ -0,0 +1,97 @@
+import asyncio
+
+import httpx
+import pytest
+
+from syncflow.project_client import HttpError
+
+from tests.utils import device_json, mock_client
+
+
+def devices_server(delay: float = 0, missing=()):
+    requests, in_flight, peak = [], [0], [0]
+
+    async def handler(request):
+        requests.append(request.url.path)
+        in_flight[0] += 1
+        peak[0] = max(peak[0], in_flight[0])
+        try:
+            await asyncio.sleep(delay)
+        finally:
+            in_flight[0] -= 1
+        if request.url.path.endswith("/devices"):
+            return httpx.Response(200, json=[device_json("a"), device_json("b")])
+        device_id = request.url.path.rsplit("/", 1)[1]
+        if device_id in missing:
+            return httpx.Response(404, text="no such device")
+        return httpx.Response(200, json=device_json(device_id))
+
+    return handler, requests, peak
+
+
+def run_batch(handler, queue, concurrency=8):
+    async def scenario():
+        client = mock_client(handler, coalesce_gets=False)
+        try:
+            async with client.batch(concurrency) as batch:
+                operations = queue(batch)
+            return batch, operations
+        finally:
+            await client.aclose()
+
+    return asyncio.run(scenario())
+
+
+def test_identical_reads_are_sent_once_with_separate_results():
+    handler, requests, _ = devices_server()
+    batch, (first, second) = run_batch(
+        handler, lambda batch: (batch.list_devices(), batch.list_devices())
+    )
+    assert requests == ["/projects/project/devices"]
+    assert batch.report.calls == 1 and second.deduplicated
+    assert first.result() == second.result()
+    assert first.result() is not second.result()
+    first.result()[0].name = "renamed"
+    first.result().pop()
+    assert [device.name for device in second.result()] == ["a name", "b name"]
+
+
+def test_failures_are_kept_per_operation():
+    handler, _, _ = devices_server(missing={"b"})
+    batch, (found, missing) = run_batch(
+        handler, lambda batch: (batch.list_device("a"), batch.list_device("b"))
+    )
+    assert found.ok and found.result().id == "a"
+    assert isinstance(missing.error, HttpError)
+    with pytest.raises(HttpError):
+        missing.result()
+    assert batch.report.succeeded == [found] and batch.report.failed == [missing]
+
+
+def test_concurrency_is_capped():
+    handler, requests, peak = devices_server(delay=0.01)
+    batch, _ = run_batch(
+        handler,
+        lambda batch: [batch.list_device(str(index)) for index in range(10)],
+        concurrency=3,
+    )
+    assert len(requests) == 10 and len(batch.report.succeeded) == 10
+    assert peak[0] == 3
+
+
+def test_batch_runs_only_once():
+    handler, requests, _ = devices_server()
+    batch, _ = run_batch(handler, lambda batch: [batch.list_devices()])
+    with pytest.raises(RuntimeError):
+        batch.list_devices()
+    report = batch.report
+    assert asyncio.run(batch.run()) is report
+    assert len(requests) == 1
+
+
+def test_only_client_calls_can_be_queued():
+    handler, _, _ = devices_server()
+    with pytest.raises(ValueError):
+        run_batch(handler, lambda batch: batch.add("aclose"))
+    with pytest.raises(AttributeError):
+        run_batch(handler, lambda batch: batch.aclose())
@@ -0,0 +1,102 @@
+import asyncio
+
+import httpx
+
+from syncflow.cache import ResponseCache
+from syncflow.models import RegisterDeviceRequest
+
+from tests.utils import device_json, mock_client
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def device_server():
+    requests = []
+    devices = [device_json("a")]
+
+    def handler(request):
+        requests.append((request.method, request.url.path))
+        if request.url.path.endswith("/devices/register"):
+            devices.append(device_json("b"))
+            return httpx.Response(200, json=devices[-1])
+        return httpx.Response(200, json=devices)
+
+    return handler, requests
+
+
+def test_hits_return_fresh_objects():
+    handler, requests = device_server()
+
+    async def scenario():
+        client = mock_client(handler, cache=ResponseCache())
+        try:
+            first = await client.list_devices()
+            first.clear()
+            return await client.list_devices()
+        finally:
+            await client.aclose()
+
+    assert [d.id for d in asyncio.run(scenario())] == ["a"]
+    assert len(requests) == 1
+
+
+def test_entries_expire_after_their_ttl():
+    handler, requests = device_server()
+    clock = FakeClock()
+
+    async def scenario():
+        client = mock_client(
+            handler, cache=ResponseCache(ttls={"list_devices": 10}, clock=clock)
+        )
+        try:
+            await client.list_devices()
+            clock.now = 5
+            await client.list_devices()
+            clock.now = 11
+            await client.list_devices()
+        finally:
+            await client.aclose()
+
+    asyncio.run(scenario())
+    assert len(requests) == 2
+
+
+def test_mutations_invalidate_affected_entries():
+    handler, requests = device_server()
+
+    async def scenario():
+        client = mock_client(handler, cache=ResponseCache())
+        try:
+            await client.list_devices()
+            await client.register_device(RegisterDeviceRequest(name="b", group="lab"))
+            return await client.list_devices()
+        finally:
+            await client.aclose()
+
+    assert [d.id for d in asyncio.run(scenario())] == ["a", "b"]
+    assert [method for method, _ in requests] == ["GET", "POST", "GET"]
+
+
+def test_writes_racing_an_invalidation_are_dropped():
+    cache = ResponseCache(ttls={"list_devices": 10})
+    generation = cache.generation
+    cache.invalidate("other")
+    cache.set("devices", b"[]", "list_devices", generation=generation)
+    assert cache.get("devices") == (False, None)
+    cache.set("devices", b"[]", "list_devices", generation=cache.generation)
+    assert cache.get("devices") == (True, b"[]")
+
+
+def test_least_recently_used_entries_are_evicted():
+    cache = ResponseCache(max_entries=2, ttls={"list_device": 10})
+    for key in "abc":
+        cache.set(key, key, "list_device")
+        cache.get("a")
+    assert cache.get("b") == (False, None)
+    assert cache.stats.evictions == 1 and len(cache) == 2
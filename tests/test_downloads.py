@@ -0,0 +1,125 @@
+import asyncio
+import json
+import re
+
+import httpx
+
+from syncflow.downloads import RecordingDownloader
+from syncflow.models import ParticipantTrackResponse
+from syncflow.retry import RetryPolicy
+
+CONTENT = bytes(range(256)) * 4
+CHUNK_SIZE = 16
+RANGE = re.compile(r"bytes=(\d+)-(\d+)")
+
+
+def make_track(name: str) -> ParticipantTrackResponse:
+    return ParticipantTrackResponse(
+        id=f"track-{name}",
+        sid=f"TR_{name}",
+        kind="video",
+        source="camera",
+        participant_id="participant",
+        multimedia_details={
+            "file_name": f"{name}.mp4",
+            "presigned_url": f"https://storage.test/{name}.mp4",
+        },
+    )
+
+
+def range_response(request, content=CONTENT):
+    first, last = map(int, RANGE.match(request.headers["Range"]).groups())
+    return httpx.Response(
+        206,
+        content=content[first : last + 1],
+        headers={"Content-Range": f"bytes {first}-{last}/{len(content)}"},
+    )
+
+
+def downloader(tmp_path, handler, **kwargs) -> RecordingDownloader:
+    return RecordingDownloader(
+        None,
+        str(tmp_path),
+        chunk_size=CHUNK_SIZE,
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        retry_policy=RetryPolicy(backoff_base=0, budget=None),
+        **kwargs,
+    )
+
+
+def test_downloads_in_ranges(tmp_path):
+    async def scenario():
+        async with downloader(tmp_path, range_response) as d:
+            return await d.download_track("session", make_track("a"))
+
+    result = asyncio.run(scenario())
+    assert result.ok and result.bytes == len(CONTENT)
+    assert (tmp_path / "session" / "a.mp4").read_bytes() == CONTENT
+
+
+def test_failed_chunk_stops_remaining_chunks(tmp_path):
+    requests = []
+
+    async def handler(request):
+        requests.append(request.headers["Range"])
+        if request.headers["Range"] == f"bytes={3 * CHUNK_SIZE}-{4 * CHUNK_SIZE - 1}":
+            return httpx.Response(404)
+        await asyncio.sleep(0.001)
+        return range_response(request)
+
+    async def scenario():
+        async with downloader(tmp_path, handler, chunk_concurrency=2) as d:
+            result = await d.download_track("session", make_track("a"))
+            sent = len(requests)
+            await asyncio.sleep(0.05)
+            return result, sent
+
+    result, sent = asyncio.run(scenario())
+    assert isinstance(result.error, httpx.HTTPStatusError)
+    assert len(requests) == sent < len(CONTENT) // CHUNK_SIZE
+    state = json.loads((tmp_path / "session" / "a.mp4.part.json").read_text())
+    assert state["completed"] and 3 not in state["completed"]
+
+
+def test_retries_transient_chunk_errors(tmp_path):
+    failures = {
+        f"bytes={CHUNK_SIZE}-{2 * CHUNK_SIZE - 1}": [httpx.Response(500)],
+        f"bytes={2 * CHUNK_SIZE}-{3 * CHUNK_SIZE - 1}": [httpx.ReadError("reset")],
+    }
+
+    def handler(request):
+        pending = failures.get(request.headers["Range"])
+        if pending:
+            failure = pending.pop()
+            if isinstance(failure, Exception):
+                raise failure
+            return failure
+        return range_response(request)
+
+    async def scenario():
+        async with downloader(tmp_path, handler) as d:
+            return await d.download_track("session", make_track("a")), d.stats
+
+    result, stats = asyncio.run(scenario())
+    assert result.ok
+    assert stats.chunk_retries == 2
+    assert (tmp_path / "session" / "a.mp4").read_bytes() == CONTENT
+
+
+def test_throughput_uses_wall_clock_time(tmp_path):
+    async def handler(request):
+        await asyncio.sleep(0.005)
+        return range_response(request)
+
+    async def scenario():
+        async with downloader(tmp_path, handler, concurrency=4) as d:
+            results = await asyncio.gather(
+                *(d.download_track("session", make_track(n)) for n in "abcd")
+            )
+            return results, d.stats
+
+    results, stats = asyncio.run(scenario())
+    assert all(r.ok for r in results)
+    assert stats.bytes == 4 * len(CONTENT)
+    assert stats.elapsed < sum(r.elapsed for r in results) / 2
+    assert stats.throughput == stats.bytes / stats.elapsed
@@ -0,0 +1,77 @@
+import asyncio
+
+import httpx
+
+from syncflow.cache import ResponseCache
+from syncflow.instrumentation import InMemoryExporter
+from syncflow.project_client import HttpError
+
+from tests.utils import device_json, mock_client, summary_json
+
+
+def test_coalesced_calls_report_the_shared_status():
+    requests = []
+
+    async def handler(request):
+        requests.append(request)
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json=summary_json())
+
+    exporter = InMemoryExporter()
+
+    async def scenario():
+        client = mock_client(handler, instrumentation=exporter)
+        try:
+            await asyncio.gather(*(client.summarize_project() for _ in range(20)))
+        finally:
+            await client.aclose()
+
+    asyncio.run(scenario())
+    summary = exporter.summary()["summarize_project"]
+    assert len(requests) == 1
+    assert summary["status_codes"] == {200: 20}
+    assert summary["coalesced"] == 19
+    assert summary["bytes_in"] == len(httpx.Response(200, json=summary_json()).content)
+
+
+def test_coalesced_failures_report_the_shared_status():
+    async def handler(request):
+        await asyncio.sleep(0.01)
+        return httpx.Response(404, text="missing")
+
+    exporter = InMemoryExporter()
+
+    async def scenario():
+        client = mock_client(handler, instrumentation=exporter)
+        try:
+            results = await asyncio.gather(
+                *(client.summarize_project() for _ in range(5)),
+                return_exceptions=True,
+            )
+        finally:
+            await client.aclose()
+        return results
+
+    results = asyncio.run(scenario())
+    assert all(isinstance(result, HttpError) for result in results)
+    assert exporter.summary()["summarize_project"]["status_codes"] == {404: 5}
+
+
+def test_cache_hits_report_ok_status():
+    def handler(request):
+        return httpx.Response(200, json=device_json())
+
+    exporter = InMemoryExporter()
+
+    async def scenario():
+        client = mock_client(handler, cache=ResponseCache(), instrumentation=exporter)
+        try:
+            for _ in range(3):
+                await client.list_device("device")
+        finally:
+            await client.aclose()
+
+    asyncio.run(scenario())
+    summary = exporter.summary()["list_device"]
+    assert summary["status_codes"] == {200: 3}
+    assert summary["cache_hits"] == 2
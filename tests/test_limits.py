@@ -0,0 +1,85 @@
+import asyncio
+
+import httpx
+
+from syncflow.limits import AdaptiveLimiter, RateLimits, TokenBucket
+from syncflow.retry import HedgePolicy
+
+from tests.utils import mock_client, summary_json
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_token_bucket_allows_a_burst_then_spaces_requests():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=10, burst=2, clock=clock)
+    assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.1]
+    clock.now = 1.0
+    assert bucket.reserve() == 0.0
+
+
+def test_limiter_queues_beyond_its_limit():
+    async def scenario():
+        limiter = AdaptiveLimiter(initial_limit=2, max_limit=2)
+        await limiter.acquire()
+        await limiter.acquire()
+        third = asyncio.ensure_future(limiter.acquire())
+        await asyncio.sleep(0)
+        queued = limiter.stats().queued
+        limiter.release("endpoint", 0.01)
+        await third
+        return queued, limiter.in_flight
+
+    assert asyncio.run(scenario()) == (1, 2)
+
+
+def test_limiter_backs_off_on_overload():
+    clock = FakeClock()
+    limiter = AdaptiveLimiter(initial_limit=10, clock=clock)
+
+    async def scenario():
+        for _ in range(3):
+            await limiter.acquire()
+        for _ in range(3):
+            limiter.release("endpoint", 0.1, overloaded=True)
+
+    asyncio.run(scenario())
+    # A burst of rejections within one round trip counts once.
+    assert limiter.stats().decreases == 1
+    assert limiter.limit == 7
+
+
+def test_rate_limits_apply_per_endpoint():
+    limits = RateLimits({"generate_session_token": 5}, default=None)
+    assert limits.bucket("generate_session_token").rate == 5
+    assert limits.bucket("list_sessions") is None
+
+
+def test_time_queued_behind_the_limiter_does_not_trigger_hedges():
+    requests = []
+
+    async def handler(request):
+        requests.append(request)
+        await asyncio.sleep(0.03)
+        return httpx.Response(200, json=summary_json())
+
+    async def scenario():
+        client = mock_client(
+            handler,
+            coalesce_gets=False,
+            hedge_policy=HedgePolicy(initial_delay=0.05),
+            concurrency_limiter=AdaptiveLimiter(initial_limit=1, max_limit=1),
+        )
+        try:
+            await asyncio.gather(*(client.summarize_project() for _ in range(4)))
+        finally:
+            await client.aclose()
+
+    asyncio.run(scenario())
+    assert len(requests) == 4
@@ -0,0 +1,66 @@
+import asyncio
+
+import pytest
+
+from syncflow.models import DeviceResponse, SessionNotificationType
+from syncflow.notifications import (
+    InMemoryBackend,
+    NotificationBackend,
+    SessionSubscriber,
+    topic_matches,
+)
+
+from tests.utils import device_json
+
+
+def test_backend_requires_subscribe():
+    class Incomplete(NotificationBackend):
+        pass
+
+    with pytest.raises(TypeError):
+        NotificationBackend()
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+def test_topic_matches():
+    assert topic_matches("lab.*.session", "lab.cam.session")
+    assert topic_matches("lab.#", "lab")
+    assert topic_matches("#.session", "lab.cam.session")
+    assert not topic_matches("lab.*", "lab.cam.session")
+    assert not topic_matches("lab.*", "lab")
+
+
+def test_subscriber_yields_matching_events():
+    device = DeviceResponse.model_validate(
+        dict(
+            device_json(),
+            sessionNotificationExchangeName="sessions",
+            sessionNotificationBindingKey="lab.#",
+        )
+    )
+    backend = InMemoryBackend()
+
+    async def scenario():
+        subscriber = SessionSubscriber(
+            backend, device, types=[SessionNotificationType.STOPPED]
+        )
+        events = []
+
+        async def consume():
+            async for event in subscriber:
+                events.append(event)
+
+        task = asyncio.ensure_future(consume())
+        await asyncio.sleep(0)
+        backend.publish("sessions", "lab.a", {"type": "Started", "sessionId": "a"})
+        backend.publish("sessions", "lab.a", b"not json")
+        backend.publish("sessions", "other", {"type": "Stopped", "sessionId": "b"})
+        backend.publish("sessions", "lab.c", {"type": "Stopped", "sessionId": "c"})
+        await backend.aclose()
+        await task
+        return events, subscriber.invalid_messages
+
+    events, invalid = asyncio.run(scenario())
+    assert [event.session_id for event in events] == ["c"]
+    assert invalid == 1
@@ -0,0 +1,232 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from syncflow.project_client import HttpError
+from syncflow.retry import HedgePolicy, RetryBudget, RetryPolicy, hedged
+
+from tests.utils import device_json, mock_client, session_json, summary_json
+
+FAST_RETRIES = RetryPolicy(backoff_base=0, budget=None)
+
+
+def test_retries_transient_status_then_succeeds():
+    statuses = [503, 502]
+
+    def handler(request):
+        if statuses:
+            return httpx.Response(statuses.pop(0))
+        return httpx.Response(200, json=summary_json(3))
+
+    async def scenario():
+        client = mock_client(handler, retry_policy=FAST_RETRIES)
+        try:
+            return await client.summarize_project()
+        finally:
+            await client.aclose()
+
+    assert asyncio.run(scenario()).num_sessions == 3
+    assert statuses == []
+
+
+def test_gives_up_after_max_attempts():
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(503, text="unavailable")
+
+    async def scenario():
+        client = mock_client(handler, retry_policy=FAST_RETRIES)
+        try:
+            await client.summarize_project()
+        finally:
+            await client.aclose()
+
+    with pytest.raises(HttpError) as error:
+        asyncio.run(scenario())
+    assert error.value.status_code == 503
+    assert len(requests) == FAST_RETRIES.max_attempts
+
+
+def test_does_not_retry_post():
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(503)
+
+    async def scenario():
+        client = mock_client(handler, retry_policy=FAST_RETRIES)
+        try:
+            await client.stop_session("session")
+        finally:
+            await client.aclose()
+
+    with pytest.raises(HttpError):
+        asyncio.run(scenario())
+    assert len(requests) == 1
+
+
+def test_retries_transport_errors():
+    failures = [httpx.ConnectError("refused")]
+
+    def handler(request):
+        if failures:
+            raise failures.pop()
+        return httpx.Response(200, json=summary_json())
+
+    async def scenario():
+        client = mock_client(handler, retry_policy=FAST_RETRIES)
+        try:
+            return await client.summarize_project()
+        finally:
+            await client.aclose()
+
+    assert asyncio.run(scenario()).num_sessions == 1
+    assert failures == []
+
+
+def test_retry_after_takes_precedence_over_backoff():
+    policy = RetryPolicy(backoff_base=10, max_retry_after=5)
+    assert policy.delay(1, httpx.Response(429, headers={"Retry-After": "2"})) == 2
+    assert policy.delay(1, httpx.Response(503, headers={"Retry-After": "60"})) == 5
+    assert 0 <= policy.delay(1, httpx.Response(503)) <= 10
+
+
+def test_retry_budget_limits_retries():
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(503)
+
+    budget = RetryBudget(ratio=0, min_retries=1)
+    policy = RetryPolicy(max_attempts=5, backoff_base=0, budget=budget)
+
+    async def scenario():
+        client = mock_client(handler, retry_policy=policy)
+        try:
+            for _ in range(2):
+                with pytest.raises(HttpError):
+                    await client.summarize_project()
+        finally:
+            await client.aclose()
+
+    asyncio.run(scenario())
+    # One retry from the reserve, then each call gets a single attempt.
+    assert len(requests) == 3
+    assert budget.available < 1
+
+
+def test_hedge_returns_the_faster_request_and_cancels_the_other():
+    calls, cancelled = [], []
+
+    async def send():
+        calls.append(len(calls))
+        try:
+            await asyncio.sleep(1 if len(calls) == 1 else 0.01)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+        return len(calls)
+
+    async def scenario():
+        started = time.perf_counter()
+        result = await hedged(send, HedgePolicy(initial_delay=0.02))
+        await asyncio.sleep(0)
+        return result, time.perf_counter() - started
+
+    result, elapsed = asyncio.run(scenario())
+    assert result == 2
+    assert elapsed < 0.5
+    assert len(calls) == 2 and cancelled == [True]
+
+
+def test_hedge_not_sent_when_primary_is_fast():
+    calls = []
+
+    async def send():
+        calls.append(1)
+        return "ok"
+
+    policy = HedgePolicy(initial_delay=0.5)
+    assert asyncio.run(hedged(send, policy)) == "ok"
+    assert len(calls) == 1
+    assert len(policy.tracker()) == 1
+
+
+def test_hedge_cancels_requests_when_caller_is_cancelled():
+    started, cancelled = [], []
+
+    async def send():
+        started.append(True)
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    async def scenario(delay):
+        started.clear(), cancelled.clear()
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(hedged(send, HedgePolicy(initial_delay=delay)), 0.05)
+        await asyncio.sleep(0.01)
+        return list(started), list(cancelled)
+
+    # Cancelled before the hedge delay, and after the backup was sent.
+    assert asyncio.run(scenario(1.0)) == ([True], [True])
+    assert asyncio.run(scenario(0.01)) == ([True, True], [True, True])
+
+
+def test_hedged_client_requests_through_mock_transport():
+    calls = []
+
+    async def handler(request):
+        calls.append(request)
+        if len(calls) == 1:
+            await asyncio.sleep(1)
+        return httpx.Response(200, json=summary_json(len(calls)))
+
+    async def scenario():
+        client = mock_client(
+            handler, hedge_policy=HedgePolicy(initial_delay=0.02), coalesce_gets=False
+        )
+        try:
+            return await client.summarize_project()
+        finally:
+            await client.aclose()
+
+    assert asyncio.run(scenario()).num_sessions == 2
+    assert len(calls) == 2
+
+
+def test_hedge_delay_is_tracked_per_endpoint():
+    paths = []
+
+    async def handler(request):
+        paths.append(request.url.path)
+        if request.url.path.endswith("/sessions"):
+            await asyncio.sleep(0.03)
+            return httpx.Response(200, json=[session_json()])
+        return httpx.Response(200, json=device_json())
+
+    policy = HedgePolicy(initial_delay=0.2, min_samples=5)
+
+    async def scenario():
+        client = mock_client(handler, hedge_policy=policy)
+        try:
+            for _ in range(5):
+                for _ in range(20):
+                    await client.list_device("device")
+                await client.list_sessions()
+        finally:
+            await client.aclose()
+
+    asyncio.run(scenario())
+    sessions = [path for path in paths if path.endswith("/sessions")]
+    assert len(sessions) == 5
+    assert policy.hedge_delay("list_device") == policy.min_delay
+    assert policy.hedge_delay("list_sessions") >= 0.03
@@ -0,0 +1,136 @@
+import asyncio
+
+import httpx
+
+from syncflow.session_index import SessionEventType, SessionIndex
+
+from tests.utils import mock_client, session_json
+
+
+class SessionsServer:
+    """Serves a mutable set of sessions; detail responses carry extra comments."""
+
+    def __init__(self, *sessions):
+        self.sessions = {session["id"]: session for session in sessions}
+        self.requests = []
+
+    def __call__(self, request):
+        path = request.url.path
+        self.requests.append(path)
+        if path.endswith("/sessions"):
+            return httpx.Response(200, json=list(self.sessions.values()))
+        session = self.sessions[path.rsplit("/", 1)[1]]
+        return httpx.Response(200, json=dict(session, comments="details"))
+
+
+def refresh(server, index_kwargs=None, rounds=()):
+    """Refresh a new index once, then once more after each of ``rounds`` runs."""
+
+    async def scenario():
+        client = mock_client(server)
+        index = SessionIndex(client, **(index_kwargs or {}))
+        events = []
+        index.subscribe(events.append)
+        try:
+            results = [await index.refresh()]
+            for change in rounds:
+                change()
+                results.append(await index.refresh())
+        finally:
+            await client.aclose()
+        return index, results, events
+
+    return asyncio.run(scenario())
+
+
+def test_cold_start_indexes_the_listing_without_fetching_details():
+    server = SessionsServer(
+        session_json("a", status="Started"), session_json("b", status="Started")
+    )
+    index, [events], received = refresh(server)
+    assert server.requests == ["/projects/project/sessions"]
+    assert [(event.type, event.session.id) for event in events] == [
+        (SessionEventType.ADDED, "a"),
+        (SessionEventType.ADDED, "b"),
+    ]
+    assert received == events
+    assert len(index) == 2 and index.get("a").comments == ""
+
+
+def test_only_changed_sessions_are_fetched_again():
+    server = SessionsServer(
+        session_json("a", status="Started"),
+        session_json("b", status="Started"),
+        session_json("c", status="Started"),
+    )
+
+    def change():
+        server.sessions["a"]["numParticipants"] = 2
+        server.sessions["b"]["status"] = "Stopped"
+        server.requests.clear()
+
+    index, [_, events], _ = refresh(server, rounds=[change])
+    assert sorted(server.requests) == [
+        "/projects/project/sessions",
+        "/projects/project/sessions/a",
+        "/projects/project/sessions/b",
+    ]
+    assert [(event.type, event.session.id) for event in events] == [
+        (SessionEventType.CHANGED, "a"),
+        (SessionEventType.CHANGED, "b"),
+        (SessionEventType.STOPPED, "b"),
+    ]
+    assert events[2].previous.status == "Started"
+    assert index.get("a").num_participants == 2
+    assert index.get("a").comments == "details"
+    assert [session.id for session in index.by_status("Stopped")] == ["b"]
+
+
+def test_sessions_missing_from_the_listing_are_removed():
+    server = SessionsServer(
+        session_json("a", deviceGroups=["lab"]), session_json("b", deviceGroups=["lab"])
+    )
+    index, [_, events], _ = refresh(server, rounds=[lambda: server.sessions.pop("a")])
+    assert events == []
+    assert "a" not in index and "b" in index
+    assert [session.id for session in index.by_device_group("lab")] == ["b"]
+    assert [session.id for session in index.started_between()] == ["b"]
+
+
+def test_queries():
+    server = SessionsServer(
+        session_json("a", startedAt=100, deviceGroups=["lab", "field"]),
+        session_json("b", startedAt=300, deviceGroups=["lab"]),
+        session_json("c", startedAt=200, status="Started"),
+    )
+    index, _, _ = refresh(server, {"fetch_details": False})
+    assert sorted(s.id for s in index.by_device_group("lab")) == ["a", "b"]
+    assert [s.id for s in index.by_device_group("field")] == ["a"]
+    assert index.by_device_group("missing") == []
+    assert [s.id for s in index.by_status("Started")] == ["c"]
+    assert [s.id for s in index.started_between()] == ["a", "c", "b"]
+    assert [s.id for s in index.started_between(200)] == ["c", "b"]
+    assert [s.id for s in index.started_between(100, 300)] == ["a", "c"]
+    assert index.started_between(400) == []
+
+
+def test_async_subscribers_and_unsubscribe():
+    server = SessionsServer(session_json("a"))
+
+    async def scenario():
+        client = mock_client(server)
+        index = SessionIndex(client)
+        received, ignored = [], []
+
+        async def on_event(event):
+            received.append(event.session.id)
+
+        index.subscribe(on_event)
+        index.subscribe(ignored.append)()
+        try:
+            await index.refresh()
+        finally:
+            await client.aclose()
+        return received, ignored
+
+    assert asyncio.run(scenario()) == (["a"], [])
@@ -0,0 +1,60 @@
+import asyncio
+
+import httpx
+
+from syncflow.models import ProjectSessionResponse
+from syncflow.session_store import SessionStore
+
+from tests.utils import mock_client, session_json
+
+
+def sessions_server(sessions):
+    requests = []
+
+    def handler(request):
+        requests.append(request.url.path)
+        if request.url.path.endswith("/sessions"):
+            return httpx.Response(200, json=sessions)
+        session_id = request.url.path.rsplit("/", 1)[1]
+        return httpx.Response(
+            200, json=next(s for s in sessions if s["id"] == session_id)
+        )
+
+    return handler, requests
+
+
+def test_stopped_sessions_are_served_from_the_store():
+    store = SessionStore(":memory:")
+    handler, requests = sessions_server(
+        [session_json("a"), session_json("b", status="Started")]
+    )
+
+    async def scenario():
+        client = mock_client(handler, session_store=store)
+        try:
+            await client.list_sessions()
+            stopped = await client.list_session("a")
+            active = await client.list_session("b")
+            return stopped, active
+        finally:
+            await client.aclose()
+
+    stopped, active = asyncio.run(scenario())
+    assert stopped.id == "a" and active.id == "b"
+    assert store.ids() == {"a"}
+    assert requests[1:] == ["/projects/project/sessions/b"]
+
+
+def test_put_many_skips_stored_and_active_sessions():
+    store = SessionStore(":memory:")
+    a, b, c = (
+        ProjectSessionResponse.model_validate(
+            session_json(session_id, startedAt=1700000000 + index)
+        )
+        for index, session_id in enumerate("abc")
+    )
+    active = ProjectSessionResponse.model_validate(session_json("d", status="Started"))
+    assert store.put_many([a, b]) == 2
+    assert store.put_many([a, b, c, active]) == 1
+    assert len(store) == 3 and "d" not in store
+    assert [s.id for s in store.iter_sessions(started_after=0)] == ["a", "b", "c"]
@@ -0,0 +1,111 @@
+import asyncio
+
+import httpx
+
+from syncflow.project_client import HttpError
+from syncflow.retry import RetryPolicy
+from syncflow.singleflight import SingleFlight
+
+from tests.utils import device_json, mock_client
+
+
+def test_concurrent_calls_share_one_execution():
+    executions = []
+
+    async def work():
+        executions.append(1)
+        await asyncio.sleep(0.01)
+        return "value"
+
+    async def scenario():
+        flight = SingleFlight()
+        results = await asyncio.gather(*(flight.do("key", work) for _ in range(5)))
+        return results, flight
+
+    results, flight = asyncio.run(scenario())
+    assert results == ["value"] * 5 and len(executions) == 1
+    assert flight.stats.coalesced == 4 and len(flight) == 0
+
+
+def test_cancelling_one_awaiter_keeps_the_shared_work():
+    async def work():
+        await asyncio.sleep(0.02)
+        return "value"
+
+    async def scenario():
+        flight = SingleFlight()
+        first = asyncio.ensure_future(flight.do("key", work))
+        second = asyncio.ensure_future(flight.do("key", work))
+        await asyncio.sleep(0)
+        first.cancel()
+        return await second
+
+    assert asyncio.run(scenario()) == "value"
+
+
+def test_cancelling_every_awaiter_cancels_the_shared_work():
+    cancelled = []
+
+    async def work():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    async def scenario():
+        flight = SingleFlight()
+        awaiters = [asyncio.ensure_future(flight.do("key", work)) for _ in range(2)]
+        await asyncio.sleep(0)
+        for awaiter in awaiters:
+            awaiter.cancel()
+        await asyncio.gather(*awaiters, return_exceptions=True)
+        await asyncio.sleep(0)
+        # Checked before asyncio.run cancels whatever is left over.
+        return list(cancelled), len(flight)
+
+    assert asyncio.run(scenario()) == ([True], 0)
+
+
+def test_coalesced_gets_send_one_request_and_return_separate_values():
+    requests = []
+
+    async def handler(request):
+        requests.append(request)
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json=[device_json("a"), device_json("b")])
+
+    async def scenario():
+        client = mock_client(handler)
+        try:
+            return await asyncio.gather(client.list_devices(), client.list_devices())
+        finally:
+            await client.aclose()
+
+    first, second = asyncio.run(scenario())
+    assert len(requests) == 1
+    assert first == second and first is not second
+    first.clear()
+    assert len(second) == 2
+
+
+def test_coalesced_gets_share_errors():
+    requests = []
+
+    async def handler(request):
+        requests.append(request)
+        await asyncio.sleep(0.01)
+        return httpx.Response(404, text="missing")
+
+    async def scenario():
+        client = mock_client(handler, retry_policy=RetryPolicy(budget=None))
+        try:
+            return await asyncio.gather(
+                client.list_device("a"), client.list_device("a"), return_exceptions=True
+            )
+        finally:
+            await client.aclose()
+
+    errors = asyncio.run(scenario())
+    assert len(requests) == 1
+    assert all(isinstance(e, HttpError) and e.status_code == 404 for e in errors)
@@ -0,0 +1,82 @@
+import asyncio
+import json
+import random
+
+import pytest
+
+from syncflow.streaming import JsonArraySplitter, iter_json_array
+
+TRICKY_ITEMS = [
+    {"name": "brackets } ] { [ in a string", "nested": [{"a": [1, [2]]}, {}]},
+    {"quote": 'escaped " quote }', "backslash": "ends with \\", "after": "}"},
+    {"unicode": "\u00e9\u4e2d \\u00e9", "empty": "", "list": []},
+    [1, "two", {"three": 3}],
+    "a string with , and ]",
+    42,
+    None,
+    {"path": "C:\\\\dir\\\\", "slash": "\\/", "newline": "a\\nb"},
+]
+
+
+def split(data: bytes, chunk_size: int):
+    splitter = JsonArraySplitter()
+    items = []
+    for start in range(0, len(data), chunk_size):
+        items.extend(splitter.feed(data[start : start + chunk_size]))
+    splitter.close()
+    return [json.loads(item) for item in items]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64, 1 << 20])
+def test_splits_tricky_elements_at_any_chunk_boundary(chunk_size):
+    data = json.dumps(TRICKY_ITEMS).encode("utf-8")
+    assert split(data, chunk_size) == TRICKY_ITEMS
+
+
+def test_matches_json_loads_on_random_documents():
+    rng = random.Random(7)
+    alphabet = 'ab{}[],:"\\ \u00e9'
+
+    def value(depth):
+        kind = rng.randrange(6 if depth < 4 else 3)
+        if kind == 0:
+            return "".join(rng.choice(alphabet) for _ in range(rng.randrange(8)))
+        if kind == 1:
+            return rng.randrange(-100, 100)
+        if kind == 2:
+            return rng.choice([True, False, None])
+        if kind in (3, 4):
+            return {
+                f"k{i}{value(5)}": value(depth + 1) for i in range(rng.randrange(4))
+            }
+        return [value(depth + 1) for _ in range(rng.randrange(4))]
+
+    for _ in range(200):
+        items = [value(0) for _ in range(rng.randrange(6))]
+        data = json.dumps(items, ensure_ascii=rng.random() < 0.5).encode("utf-8")
+        assert split(data, rng.randrange(1, 40)) == items
+
+
+def test_whitespace_and_empty_arrays():
+    assert split(b" \n[ ] ", 1) == []
+    assert split(b'[ {"a": 1} ,\n {"b": [2 ]} ]\n', 4) == [{"a": 1}, {"b": [2]}]
+
+
+@pytest.mark.parametrize(
+    "data",
+    [b'{"a": 1}', b'[{"a": 1}] trailing', b'[{"a": 1}', b'[{"a": 1}}, 2]'],
+)
+def test_rejects_malformed_input(data):
+    with pytest.raises(ValueError):
+        split(data, 3)
+
+
+def test_iter_json_array_yields_raw_elements():
+    async def chunks():
+        yield b'[{"a": 1},'
+        yield b' {"b": "]"}]'
+
+    async def collect():
+        return [item async for item in iter_json_array(chunks())]
+
+    assert asyncio.run(collect()) == [b'{"a": 1}', b'{"b": "]"}']
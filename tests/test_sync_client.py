@@ -0,0 +1,99 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from syncflow.sync_client import SyncProjectClient
+from syncflow.transport import SharedTransport
+
+from tests.utils import PROJECT_ID, SERVER_URL, device_json, session_json, summary_json
+
+
+def sync_client(handler, **kwargs) -> SyncProjectClient:
+    transport = SharedTransport(transport=httpx.MockTransport(handler))
+    return SyncProjectClient(
+        SERVER_URL, PROJECT_ID, "key", "secret" * 8, transport=transport, **kwargs
+    )
+
+
+def sessions_handler(count: int = 5):
+    sessions = [session_json(str(index)) for index in range(count)]
+
+    def handler(request):
+        return httpx.Response(200, json=sessions)
+
+    return handler
+
+
+def test_calls_from_many_threads_share_one_loop():
+    loop_threads = set()
+
+    def handler(request):
+        loop_threads.add(threading.current_thread().name)
+        device_id = request.url.path.rsplit("/", 1)[1]
+        return httpx.Response(200, json=device_json(device_id))
+
+    with sync_client(handler, coalesce_gets=False) as client:
+        with ThreadPoolExecutor(8) as pool:
+            devices = list(
+                pool.map(lambda index: client.list_device(str(index)), range(40))
+            )
+    assert [device.id for device in devices] == [str(index) for index in range(40)]
+    assert loop_threads == {"syncflow-client"}
+
+
+def test_iterators_yield_every_item():
+    with sync_client(sessions_handler()) as client:
+        ids = [session.id for session in client.iter_sessions()]
+    assert ids == ["0", "1", "2", "3", "4"]
+
+
+def test_close_during_iteration():
+    client = sync_client(sessions_handler())
+    sessions = client.iter_sessions()
+    assert next(sessions).id == "0"
+    client.close()
+    with pytest.raises(RuntimeError, match="closed"):
+        next(sessions)
+    with pytest.raises(RuntimeError, match="closed"):
+        client.summarize_project()
+    client.close()
+
+
+def test_call_timeout_cancels_the_call():
+    cancelled = threading.Event()
+
+    async def handler(request):
+        if request.url.path.endswith("/summarize"):
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+        return httpx.Response(200, json=device_json())
+
+    with sync_client(handler, call_timeout=0.05) as client:
+        started = time.perf_counter()
+        with pytest.raises(TimeoutError):
+            client.summarize_project()
+        assert time.perf_counter() - started < 1
+        assert cancelled.wait(1)
+        assert client.list_device("device").id == "device"
+
+
+def test_authorized_fetch_and_batch():
+    def handler(request):
+        if request.url.path.endswith("/summarize"):
+            return httpx.Response(200, json=summary_json(2))
+        return httpx.Response(200, json=device_json(request.url.path[-1]))
+
+    with sync_client(handler) as client:
+        summary = client.authorized_fetch(f"/projects/{PROJECT_ID}/summarize")
+        with client.batch(concurrency=2) as batch:
+            devices = [batch.list_device(device_id) for device_id in "abc"]
+    assert summary["numSessions"] == 2
+    assert [device.result().id for device in devices] == ["a", "b", "c"]
+    assert batch.report.calls == 3
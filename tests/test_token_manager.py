@@ -0,0 +1,105 @@
+import asyncio
+
+import jwt
+import pytest
+
+from syncflow import token_manager
+from syncflow.token_manager import TokenManager
+
+SECRET = "secret" * 8
+
+
+class Clock:
+    def __init__(self, now: float = 1_000_000):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(token_manager.time, "time", clock)
+    return clock
+
+
+def manager(**kwargs) -> TokenManager:
+    kwargs.setdefault("ttl", 100)
+    kwargs.setdefault("refresh_skew", 20)
+    return TokenManager("project", "key", SECRET, **kwargs)
+
+
+def test_cached_token_is_reused(clock):
+    tokens = manager()
+
+    async def scenario():
+        return [await tokens.get_token() for _ in range(3)]
+
+    first, second, third = asyncio.run(scenario())
+    assert first == second == third
+    assert tokens.stats.mints == 1 and tokens.stats.cache_hits == 2
+    claims = jwt.decode(
+        first, SECRET, algorithms=["HS256"], options={"verify_exp": False}
+    )
+    assert claims["exp"] == clock.now + 100 and claims["iss"] == "key"
+
+
+def test_refresh_window_starts_a_single_background_refresh(clock):
+    tokens = manager()
+
+    async def scenario():
+        old = await tokens.get_token()
+        clock.now += 85
+        served = await asyncio.gather(*(tokens.get_token() for _ in range(10)))
+        await tokens._refresh_task
+        return old, served, await tokens.get_token()
+
+    old, served, new = asyncio.run(scenario())
+    assert served == [old] * 10
+    assert new != old
+    assert tokens.stats.mints == 2 and tokens.stats.background_refreshes == 1
+    assert tokens.expires_at == clock.now + 100
+
+
+def test_token_near_expiry_is_minted_inline(clock):
+    tokens = manager(min_validity=5)
+
+    async def scenario():
+        old = await tokens.get_token()
+        clock.now += 96
+        return old, await tokens.get_token()
+
+    old, new = asyncio.run(scenario())
+    assert new != old
+    assert tokens.stats.mints == 2 and tokens.stats.background_refreshes == 0
+
+
+def test_failed_background_refresh_is_retried_inline(clock, monkeypatch):
+    tokens = manager()
+    sign = tokens._sign
+
+    def failing_sign():
+        raise RuntimeError("signing failed")
+
+    async def scenario():
+        old = await tokens.get_token()
+        clock.now += 85
+        monkeypatch.setattr(tokens, "_sign", failing_sign)
+        assert await tokens.get_token() == old
+        await tokens._refresh_task
+        assert isinstance(tokens.refresh_error, RuntimeError)
+        with pytest.raises(RuntimeError):
+            await tokens.get_token()
+        monkeypatch.setattr(tokens, "_sign", sign)
+        return old, await tokens.get_token()
+
+    old, new = asyncio.run(scenario())
+    assert new != old
+    assert tokens.refresh_error is None
+    assert tokens.stats.refresh_failures == 1
+
+
+def test_refresh_skew_must_be_shorter_than_ttl():
+    with pytest.raises(ValueError):
+        manager(ttl=60, refresh_skew=60)
@@ -0,0 +1,119 @@
+import asyncio
+
+import httpx
+
+from syncflow.cache import ResponseCache
+from syncflow.watch import WatchScheduler
+
+from tests.utils import mock_client, session_json
+
+
+def egress_json(egress_id: str, status: str) -> dict:
+    return {
+        "id": egress_id,
+        "trackId": f"TR_{egress_id}",
+        "egressId": f"EG_{egress_id}",
+        "startedAt": 1700000000,
+        "status": status,
+        "roomName": "session-room",
+        "sessionId": "session",
+    }
+
+
+def changing_session(states):
+    """Serve each state in turn, repeating the last one."""
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        state = states[min(len(requests), len(states)) - 1]
+        return httpx.Response(200, json=state)
+
+    return handler, requests
+
+
+def fast_watcher(client) -> WatchScheduler:
+    client._watcher = WatchScheduler(client, min_interval=0.001, max_interval=0.005)
+    return client._watcher
+
+
+def test_recordings_are_not_complete_before_any_egress_exists():
+    handler, requests = changing_session(
+        [
+            session_json(status="Stopped"),
+            session_json(recordings=[egress_json("a", "EGRESS_ACTIVE")]),
+            session_json(recordings=[egress_json("a", "EGRESS_COMPLETE")]),
+        ]
+    )
+
+    async def scenario():
+        client = mock_client(handler)
+        fast_watcher(client)
+        try:
+            return await client.wait_for_recordings_complete("session", timeout=1)
+        finally:
+            await client.aclose()
+
+    session = asyncio.run(scenario())
+    assert [egress.status for egress in session.recordings] == ["EGRESS_COMPLETE"]
+    assert len(requests) == 3
+
+
+def test_min_recordings_zero_accepts_a_session_without_recordings():
+    handler, requests = changing_session([session_json()])
+
+    async def scenario():
+        client = mock_client(handler)
+        fast_watcher(client)
+        try:
+            return await client.wait_for_recordings_complete(
+                "session", timeout=1, min_recordings=0
+            )
+        finally:
+            await client.aclose()
+
+    assert asyncio.run(scenario()).recordings == []
+    assert len(requests) == 1
+
+
+def test_waiters_on_one_session_share_polls():
+    handler, requests = changing_session(
+        [session_json(status="Started")] * 3 + [session_json(status="Stopped")]
+    )
+
+    async def scenario():
+        client = mock_client(handler)
+        watcher = fast_watcher(client)
+        try:
+            await asyncio.gather(
+                *(client.wait_for_session_stopped("session", 1) for _ in range(5))
+            )
+            return watcher.stats()
+        finally:
+            await client.aclose()
+
+    stats = asyncio.run(scenario())
+    assert len(requests) == stats.fetches == 4
+    assert stats.resolved == 5
+
+
+def test_polling_refreshes_the_cache_without_invalidating_it():
+    handler, requests = changing_session(
+        [session_json(status="Started"), session_json(status="Stopped")]
+    )
+
+    async def scenario():
+        cache = ResponseCache()
+        client = mock_client(handler, cache=cache)
+        fast_watcher(client)
+        try:
+            generation = cache.generation
+            await client.wait_for_session_stopped("session", 1)
+            cached = await client.list_session("session")
+            return generation, cache.generation, cached
+        finally:
+            await client.aclose()
+
+    before, after, cached = asyncio.run(scenario())
+    assert before == after
+    assert cached.is_stopped() and len(requests) == 2
@@ -0,0 +1,59 @@
+import httpx
+
+from syncflow.project_client import ProjectClient
+from syncflow.transport import SharedTransport
+
+SERVER_URL = "http://syncflow.test"
+PROJECT_ID = "project"
+
+
+def mock_client(handler, **kwargs) -> ProjectClient:
+    """A ``ProjectClient`` whose requests are answered by ``handler``."""
+    transport = SharedTransport(transport=httpx.MockTransport(handler))
+    return ProjectClient(
+        SERVER_URL, PROJECT_ID, "key", "secret" * 8, transport=transport, **kwargs
+    )
+
+
+def summary_json(num_sessions: int = 1) -> dict:
+    return {
+        "numSessions": num_sessions,
+        "numActiveSessions": 0,
+        "numParticipants": 0,
+        "numRecordings": 0,
+    }
+
+
+def device_json(device_id: str = "device") -> dict:
+    return {
+        "id": device_id,
+        "name": f"{device_id} name",
+        "group": "lab",
+        "comments": None,
+        "registeredAt": 1700000000,
+        "registeredBy": 1,
+        "projectId": PROJECT_ID,
+        "sessionNotificationExchangeName": None,
+        "sessionNotificationBindingKey": None,
+    }
+
+
+def session_json(session_id: str = "session", status: str = "Stopped", **fields):
+    session = {
+        "id": session_id,
+        "name": f"{session_id} name",
+        "startedAt": 1700000000,
+        "comments": "",
+        "emptyTimeout": 300,
+        "maxParticipants": 10,
+        "livekitRoomName": f"{session_id}-room",
+        "projectId": PROJECT_ID,
+        "status": status,
+        "numParticipants": 0,
+        "numRecordings": 0,
+        "participants": [],
+        "recordings": [],
+        "duration": 60,
+    }
+    session.update(fields)
+    return session